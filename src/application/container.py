@@ -60,7 +60,7 @@ class AppContainer:
         self.corporate_action_repo = SQLAlchemyCorporateActionRepository(self.conn_provider)
 
         # 3) Market data client
-        self.market_client = YFinanceMarketDataClient()
+        self.market_client = YFinanceMarketDataClient(persistent_cache=True)
         self.price_lookup_service = PriceLookupService()
         self.db_integrity_service = DatabaseIntegrityService(self.conn_provider)
 
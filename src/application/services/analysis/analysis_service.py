@@ -54,6 +54,10 @@ class AnalysisService:
         )
         self._benchmark_service = AnalysisBenchmarkService(market_data_client=market_data_client)
 
+    def invalidate_caches(self) -> None:
+        self._series_builder.clear_ticker_cache()
+        self._benchmark_service.clear_cache()
+
     def get_benchmark_definitions(self):
         return self._benchmark_service.get_benchmark_definitions()
 
@@ -64,12 +68,22 @@ class AnalysisService:
         return self._source_resolver.get_first_trade_date_for_source(source_code)
 
     def get_stock_map_for_source(self, source_code: str) -> Dict[int, str]:
-        return self._source_resolver.get_stock_map_for_source(source_code)
+        return self._series_builder.get_ticker_map(self._source_resolver.get_stock_ids_for_source(source_code))
+
+    def get_source_context(self, source_code: str) -> Dict[str, object]:
+        trades = self._source_resolver.get_source_trades(source_code)
+        stock_ids = sorted({trade.stock_id for trade in trades})
+        return {
+            "stock_map": self._series_builder.get_ticker_map(stock_ids),
+            "first_trade_date": min((trade.trade_date for trade in trades), default=None),
+            "portfolio_options": self.get_portfolio_options(),
+        }
 
     def get_overview(self, filter_state: AnalysisFilterState) -> AnalysisOverviewDTO:
-        bundle = self._build_analysis_bundle(filter_state)
-        ticker_map = self._series_builder.get_ticker_map(list(bundle["portfolio"].positions.keys()))
-        position_snapshot = compute_position_snapshot(bundle["portfolio"], ticker_map)
+        return self._build_overview(self._build_analysis_bundle(filter_state))
+
+    def _build_overview(self, bundle: Dict[str, object]) -> AnalysisOverviewDTO:
+        position_snapshot = bundle["position_snapshot"]
         portfolio_series = bundle["portfolio_series"]
         primary_benchmark = bundle["benchmarks"][0] if bundle["benchmarks"] else None
         benchmark_gap = (
@@ -126,7 +140,9 @@ class AnalysisService:
             portfolio_source=filter_state.portfolio_source,
             comparison_portfolio_sources=list(filter_state.comparison_portfolio_sources),
         )
-        bundle = self._build_analysis_bundle(state)
+        return self._build_comparison_view(state, self._build_analysis_bundle(state))
+
+    def _build_comparison_view(self, state: AnalysisFilterState, bundle: Dict[str, object]) -> ComparisonViewDTO:
         metrics: List[ComparisonMetric] = []
         portfolio_return = compute_return_pct(bundle["portfolio_series"])
         for benchmark in bundle["benchmarks"]:
@@ -165,10 +181,11 @@ class AnalysisService:
         )
 
     def get_allocation_risk_view(self, filter_state: AnalysisFilterState) -> AllocationRiskDTO:
-        bundle = self._build_analysis_bundle(filter_state)
-        ticker_map = self._series_builder.get_ticker_map(list(bundle["portfolio"].positions.keys()))
+        return self._build_allocation_risk_view(self._build_analysis_bundle(filter_state))
+
+    def _build_allocation_risk_view(self, bundle: Dict[str, object]) -> AllocationRiskDTO:
         position_snapshot = sorted(
-            compute_position_snapshot(bundle["portfolio"], ticker_map),
+            bundle["position_snapshot"],
             key=lambda item: item["weight"],
             reverse=True,
         )
@@ -192,10 +209,12 @@ class AnalysisService:
         )
 
     def get_page_payload(self, filter_state: AnalysisFilterState) -> Dict[str, object]:
+        # Uc sekme ayni filtreyi kullandigindan fiyat/benchmark verisi tek seferde toplanir.
+        bundle = self._build_analysis_bundle(filter_state)
         return {
-            "overview": self.get_overview(filter_state),
-            "comparison": self.get_comparison_view(filter_state, filter_state.selected_benchmarks),
-            "risk": self.get_allocation_risk_view(filter_state),
+            "overview": self._build_overview(bundle),
+            "comparison": self._build_comparison_view(filter_state, bundle),
+            "risk": self._build_allocation_risk_view(bundle),
         }
 
     def _build_analysis_bundle(self, filter_state: AnalysisFilterState) -> Dict[str, object]:
@@ -208,6 +227,12 @@ class AnalysisService:
         ticker_map = self._series_builder.get_ticker_map(stock_ids)
 
         portfolio = Portfolio.from_trades([trade for trade in scoped_trades if trade.stock_id in stock_ids])
+        # Portfoy ve hisse serileri ayni fiyat haritasini kullanir; fiyatlar tek sorguda okunur.
+        prices_by_stock = self._series_builder.load_price_series(
+            stock_ids,
+            filter_state.start_date,
+            filter_state.end_date,
+        )
         portfolio_series, position_values_end, warnings = self._series_builder.compute_portfolio_series(
             scoped_trades,
             stock_ids,
@@ -215,6 +240,7 @@ class AnalysisService:
             filter_state.start_date,
             filter_state.end_date,
             portfolio,
+            prices_by_stock,
         )
         benchmark_series, benchmark_warnings = self._benchmark_service.build_benchmark_series(
             filter_state.start_date,
@@ -227,6 +253,7 @@ class AnalysisService:
             ticker_map,
             filter_state.start_date,
             filter_state.end_date,
+            prices_by_stock,
         )
         warnings.extend(stock_warnings)
 
@@ -237,6 +264,7 @@ class AnalysisService:
         end_total_value = next(reversed(portfolio_series.values())) if portfolio_series else Decimal("0")
         return {
             "portfolio": portfolio,
+            "position_snapshot": compute_position_snapshot(portfolio, ticker_map),
             "portfolio_series": portfolio_series,
             "benchmarks": benchmark_series,
             "stock_series": stock_series,
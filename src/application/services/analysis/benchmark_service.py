@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Sequence
@@ -12,6 +15,8 @@ from .models import BenchmarkDefinition, BenchmarkSeries
 
 logger = logging.getLogger(__name__)
 
+ONE_DAY = timedelta(days=1)
+
 
 class AnalysisBenchmarkService:
     DEFAULT_BENCHMARK_CODES = ["bist100", "gold", "usd", "deposit"]
@@ -22,9 +27,14 @@ class AnalysisBenchmarkService:
     }
     GOLD_DIRECT_TICKERS: Sequence[str] = ("XAUTRY=X",)
     GOLD_USD_TICKERS: Sequence[str] = ("XAUUSD=X", "GC=F")
+    MAX_FETCH_WORKERS = 4
+    MAX_CACHED_SERIES = 64
 
     def __init__(self, market_data_client: IMarketDataClient) -> None:
         self._market_data_client = market_data_client
+        # (ticker, baslangic, bitis) -> seri; LRU sirasinda tutulur, kapsanan alt araliklar agsiz dilimlenir.
+        self._series_cache: OrderedDict[tuple[str, date, date], Dict[date, Decimal]] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._benchmarks: Dict[str, BenchmarkDefinition] = {
             "bist100": BenchmarkDefinition("bist100", "BIST 100", "market", "XU100.IS"),
             "gold": BenchmarkDefinition("gold", "Altin", "market", "GC=F"),
@@ -32,6 +42,10 @@ class AnalysisBenchmarkService:
             "deposit": BenchmarkDefinition("deposit", "Mevduat Faizi", "synthetic"),
         }
 
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._series_cache.clear()
+
     def get_benchmark_definitions(self) -> List[BenchmarkDefinition]:
         return [self._benchmarks[code] for code in self.DEFAULT_BENCHMARK_CODES]
 
@@ -43,26 +57,47 @@ class AnalysisBenchmarkService:
     ) -> tuple[List[BenchmarkSeries], List[str]]:
         results: List[BenchmarkSeries] = []
         warnings: List[str] = []
-        for code in selected_codes:
-            definition = self._benchmarks.get(code)
-            if definition is None:
-                continue
-            try:
-                if definition.kind == "synthetic":
-                    points = self._build_deposit_series(start_date, end_date)
-                elif definition.code == "gold":
-                    points = self._build_gold_series(start_date, end_date)
-                else:
-                    points = self._build_market_series(definition, start_date, end_date)
-            except Exception:
-                logger.warning("Benchmark serisi olusturulamadi: %s", definition.code, exc_info=True)
-                points = {}
+        definitions = [self._benchmarks[code] for code in selected_codes if code in self._benchmarks]
+        market_definitions = [definition for definition in definitions if definition.kind == "market"]
+        points_by_code: Dict[str, Dict[date, Decimal]] = {}
+        if len(market_definitions) > 1:
+            # Piyasa benchmark'lari ayri ag istekleri; kisa omurlu bir havuzda paralel cekilir.
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_FETCH_WORKERS, len(market_definitions)),
+                thread_name_prefix="benchmark-fetch",
+            ) as executor:
+                futures = {
+                    definition.code: executor.submit(self._build_points, definition, start_date, end_date)
+                    for definition in market_definitions
+                }
+                points_by_code = {code: future.result() for code, future in futures.items()}
+
+        for definition in definitions:
+            points = points_by_code.get(definition.code)
+            if points is None:
+                points = self._build_points(definition, start_date, end_date)
             if not points:
                 warnings.append(f"{definition.label} benchmark verisi alinamadi.")
                 continue
             results.append(BenchmarkSeries(code=definition.code, label=definition.label, points=points))
         return results, warnings
 
+    def _build_points(
+        self,
+        definition: BenchmarkDefinition,
+        start_date: date,
+        end_date: date,
+    ) -> Dict[date, Decimal]:
+        try:
+            if definition.kind == "synthetic":
+                return self._build_deposit_series(start_date, end_date)
+            if definition.code == "gold":
+                return self._build_gold_series(start_date, end_date)
+            return self._build_market_series(definition, start_date, end_date)
+        except Exception:
+            logger.warning("Benchmark serisi olusturulamadi: %s", definition.code, exc_info=True)
+            return {}
+
     def _build_market_series(
         self,
         definition: BenchmarkDefinition,
@@ -112,7 +147,7 @@ class AnalysisBenchmarkService:
     ) -> tuple[Dict[date, Decimal], Optional[str]]:
         for ticker in candidates:
             try:
-                points = self._market_data_client.get_price_series(ticker, start_date, end_date)
+                points = self._get_price_series(ticker, start_date, end_date)
             except Exception:
                 logger.debug("Benchmark ticker denemesi basarisiz: %s", ticker, exc_info=True)
                 points = {}
@@ -120,6 +155,41 @@ class AnalysisBenchmarkService:
                 return points, ticker
         return {}, None
 
+    def _get_price_series(self, ticker: str, start_date: date, end_date: date) -> Dict[date, Decimal]:
+        cached = self._get_cached_series(ticker, start_date, end_date)
+        if cached is not None:
+            return cached
+
+        points = self._market_data_client.get_price_series(ticker, start_date, end_date)
+        if points:
+            with self._cache_lock:
+                self._series_cache[(ticker, start_date, end_date)] = dict(points)
+                while len(self._series_cache) > self.MAX_CACHED_SERIES:
+                    self._series_cache.popitem(last=False)
+        return points
+
+    def _get_cached_series(self, ticker: str, start_date: date, end_date: date) -> Optional[Dict[date, Decimal]]:
+        with self._cache_lock:
+            key = (ticker, start_date, end_date)
+            if key not in self._series_cache:
+                key = next(
+                    (
+                        (cached_ticker, cached_start, cached_end)
+                        for cached_ticker, cached_start, cached_end in self._series_cache
+                        if cached_ticker == ticker and cached_start <= start_date and end_date <= cached_end
+                    ),
+                    None,
+                )
+                if key is None:
+                    return None
+            self._series_cache.move_to_end(key)
+            cached_points = self._series_cache[key]
+        return {
+            point_date: value
+            for point_date, value in cached_points.items()
+            if start_date <= point_date <= end_date
+        }
+
     def _combine_series_by_date(
         self,
         left_series: Dict[date, Decimal],
@@ -140,6 +210,6 @@ class AnalysisBenchmarkService:
         while current_day <= end_date:
             result[current_day] = value
             value = value * (Decimal("1") + daily_rate)
-            current_day += timedelta(days=1)
+            current_day += ONE_DAY
         return result
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import date, time, timedelta
 from decimal import Decimal
-from typing import Dict, Iterable, List, Sequence
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from src.domain.models.portfolio import Portfolio
 from src.domain.models.position import Position
@@ -10,8 +11,12 @@ from src.domain.models.trade import Trade
 from src.domain.ports.repositories.i_price_repo import IPriceRepository
 from src.domain.ports.repositories.i_stock_repo import IStockRepository
 
+ONE_DAY = timedelta(days=1)
+
 
 class PortfolioSeriesBuilder:
+    TICKER_MAP_TTL_SECONDS = 300
+
     def __init__(
         self,
         price_repo: IPriceRepository,
@@ -19,6 +24,7 @@ class PortfolioSeriesBuilder:
     ) -> None:
         self._price_repo = price_repo
         self._stock_repo = stock_repo
+        self._ticker_map_cache: Dict[frozenset, tuple[float, Dict[int, str]]] = {}
 
     def resolve_stock_scope(self, trades: Iterable[Trade], selected_stock_ids: Sequence[int]) -> List[int]:
         selected = [stock_id for stock_id in selected_stock_ids if stock_id]
@@ -34,41 +40,43 @@ class PortfolioSeriesBuilder:
         start_date: date,
         end_date: date,
         portfolio: Portfolio,
+        prices_by_stock: Optional[Dict[int, Dict[date, Decimal]]] = None,
     ) -> tuple[Dict[date, Decimal], Dict[int, Decimal], List[str]]:
         if not stock_ids:
             return {}, {}, []
 
-        prices_by_stock: Dict[int, Dict[date, Decimal]] = {
-            stock_id: {
-                daily.price_date: daily.close_price
-                for daily in self._price_repo.get_price_series(stock_id, start_date, end_date)
-            }
-            for stock_id in stock_ids
-        }
+        if prices_by_stock is None:
+            prices_by_stock = self.load_price_series(stock_ids, start_date, end_date)
+        previous_prices = self._price_repo.get_last_prices_before(stock_ids, start_date)
         last_prices: Dict[int, Decimal | None] = {}
         warnings: List[str] = []
         for stock_id in stock_ids:
-            previous_price = self._price_repo.get_last_price_before(stock_id, start_date)
-            last_prices[stock_id] = previous_price.close_price if previous_price else None
+            last_prices[stock_id] = previous_prices.get(stock_id)
             if not prices_by_stock[stock_id]:
                 warnings.append(f"{ticker_map.get(stock_id, str(stock_id))} icin tarih araliginda fiyat verisi bulunamadi.")
 
-        trades_before = [trade for trade in trades if trade.trade_date < start_date and trade.stock_id in stock_ids]
-        current_positions = {
-            stock_id: Position.from_trades(stock_id, [trade for trade in trades_before if trade.stock_id == stock_id])
-            for stock_id in stock_ids
-        }
+        # Gun dongusunde sabit kalan isler (kapsam kumesi, hisse/gun gruplamasi, siralama) bir kez yapilir.
+        stock_id_set = set(stock_ids)
+        trades_before_by_stock: Dict[int, List[Trade]] = {stock_id: [] for stock_id in stock_ids}
         trades_by_date: Dict[date, List[Trade]] = {}
         for trade in trades:
-            if trade.stock_id not in stock_ids:
+            if trade.stock_id not in stock_id_set:
                 continue
-            if start_date <= trade.trade_date <= end_date:
+            if trade.trade_date < start_date:
+                trades_before_by_stock[trade.stock_id].append(trade)
+            elif trade.trade_date <= end_date:
                 trades_by_date.setdefault(trade.trade_date, []).append(trade)
+        current_positions = {
+            stock_id: Position.from_trades(stock_id, trades_before_by_stock[stock_id])
+            for stock_id in stock_ids
+        }
+        for day_trades in trades_by_date.values():
+            day_trades.sort(key=lambda item: item.trade_time or time.min)
 
         portfolio_series: Dict[date, Decimal] = {}
         current_day = start_date
         while current_day <= end_date:
-            for trade in sorted(trades_by_date.get(current_day, []), key=lambda item: item.trade_time or time.min):
+            for trade in trades_by_date.get(current_day, ()):
                 current_positions[trade.stock_id].apply_trade(trade)
             total_value = Decimal("0")
             for stock_id in stock_ids:
@@ -80,7 +88,7 @@ class PortfolioSeriesBuilder:
                     continue
                 total_value += current_positions[stock_id].market_value(price)
             portfolio_series[current_day] = total_value
-            current_day += timedelta(days=1)
+            current_day += ONE_DAY
 
         position_values_end: Dict[int, Decimal] = {}
         for stock_id in stock_ids:
@@ -99,23 +107,52 @@ class PortfolioSeriesBuilder:
         ticker_map: Dict[int, str],
         start_date: date,
         end_date: date,
+        prices_by_stock: Optional[Dict[int, Dict[date, Decimal]]] = None,
     ) -> tuple[Dict[str, Dict[date, Decimal]], List[str]]:
         series_map: Dict[str, Dict[date, Decimal]] = {}
         warnings: List[str] = []
+        if prices_by_stock is None:
+            prices_by_stock = self.load_price_series(stock_ids, start_date, end_date)
         for stock_id in stock_ids:
             ticker = ticker_map.get(stock_id)
             if not ticker:
                 continue
-            points = {
-                daily.price_date: daily.close_price
-                for daily in self._price_repo.get_price_series(stock_id, start_date, end_date)
-            }
+            points = prices_by_stock[stock_id]
             if not points:
                 warnings.append(f"{ticker} icin karsilastirma serisi uretilemedi.")
                 continue
             series_map[ticker] = points
         return series_map, warnings
 
+    def load_price_series(
+        self,
+        stock_ids: Sequence[int],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[int, Dict[date, Decimal]]:
+        """
+        Tum hisselerin tarih araligindaki kapanislarini tek sorguda ceker ve
+        {stock_id: {price_date: close_price}} haritasina cevirir.
+        """
+        prices_by_stock: Dict[int, Dict[date, Decimal]] = {stock_id: {} for stock_id in stock_ids}
+        if not stock_ids:
+            return prices_by_stock
+        value_series = self._price_repo.get_portfolio_value_series(list(stock_ids), start_date, end_date)
+        for price_date in sorted(value_series):
+            for stock_id, close_price in value_series[price_date].items():
+                if stock_id in prices_by_stock:
+                    prices_by_stock[stock_id][price_date] = close_price
+        return prices_by_stock
+
     def get_ticker_map(self, stock_ids: Sequence[int]) -> Dict[int, str]:
-        return self._stock_repo.get_ticker_map_for_stock_ids(list(stock_ids))
+        key = frozenset(stock_ids)
+        now = monotonic()
+        cached = self._ticker_map_cache.get(key)
+        if cached is None or now - cached[0] >= self.TICKER_MAP_TTL_SECONDS:
+            cached = (now, self._stock_repo.get_ticker_map_for_stock_ids(list(stock_ids)))
+            self._ticker_map_cache[key] = cached
+        return dict(cached[1])
+
+    def clear_ticker_cache(self) -> None:
+        self._ticker_map_cache.clear()
 
@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from src.domain.models.portfolio import Portfolio
+from src.domain.models.trade import Trade
 from src.domain.ports.repositories.i_portfolio_repo import IPortfolioRepository
 from src.domain.ports.repositories.i_price_repo import IPriceRepository
 
@@ -56,9 +57,12 @@ class ReturnCalcService:
           3) value_date için fiyat map'ini repo'dan al
           4) Portfolio metodları ile toplam değer ve P&L hesaplarını yap
         """
+        trades = self._portfolio_repo.get_all_trades()
+        return self._snapshot_from_trades(trades, value_date)
+
+    def _snapshot_from_trades(self, trades: List[Trade], value_date: date) -> PortfolioValueSnapshot:
         # 1) Sadece value_date'e kadar olan trade'ler (bedelsiz synthetic BUY'lar
         #    geçmiş tarih hesaplarına dahil edilmez; fiyat tutarlılığı korunur)
-        trades = self._portfolio_repo.get_all_trades()
         trades_as_of = [t for t in trades if t.trade_date <= value_date]
         portfolio = Portfolio.from_trades(trades_as_of)
 
@@ -100,12 +104,10 @@ class ReturnCalcService:
         value_date: date,
     ) -> Dict[int, Decimal]:
         completed_map = dict(price_map)
-        for stock_id in stock_ids:
-            if stock_id in completed_map:
-                continue
-            last_price = self._price_repo.get_last_price_before(stock_id, value_date)
-            if last_price is not None:
-                completed_map[stock_id] = last_price.close_price
+        missing_ids = [stock_id for stock_id in stock_ids if stock_id not in completed_map]
+        if missing_ids:
+            # Eksik hisselerin son kapanislari tek sorguda okunur.
+            completed_map.update(self._price_repo.get_last_prices_before(missing_ids, value_date))
         return completed_map
 
     # ---------- Yardımcı: Basit getiri oranı ---------- #
@@ -155,6 +157,34 @@ class ReturnCalcService:
 
         return rate, start_snapshot, end_snapshot
 
+    # ---------- Aynı bitişli dönem getirileri ---------- #
+
+    def compute_period_returns(
+        self,
+        end_date: date,
+        periods_in_days: Sequence[int],
+    ) -> Dict[int, Optional[Decimal]]:
+        """
+        Aynı bitiş tarihine sahip birden fazla dönem getirisini hesaplar
+        (örn. (7, 30) -> haftalık ve aylık).
+
+        Trade'ler bir kez okunur ve bitiş snapshot'ı tüm dönemler için
+        bir kez oluşturulur; her dönem için yalnızca başlangıç snapshot'ı hesaplanır.
+        """
+        trades = self._portfolio_repo.get_all_trades()
+        if not trades:
+            # Boş portföyde (ilk açılış, sıfırlama sonrası) fiyat geçmişi taranmaz.
+            return {days: None for days in periods_in_days}
+        end_snapshot = self._snapshot_from_trades(trades, end_date)
+        rates: Dict[int, Optional[Decimal]] = {}
+        for days in periods_in_days:
+            start_snapshot = self._snapshot_from_trades(trades, end_date - timedelta(days=days))
+            rates[days] = self._compute_return_rate(
+                start_value=start_snapshot.total_value,
+                end_value=end_snapshot.total_value,
+            )
+        return rates
+
     # ---------- Haftalık getiri ---------- #
 
     def compute_weekly_return(
@@ -86,31 +86,29 @@ def compute_position_snapshot(
     portfolio: Portfolio,
     ticker_map: Dict[int, str],
 ) -> List[Dict[str, object]]:
-    total_value = sum(
-        (
-            getattr(position, "_analysis_current_value", Decimal("0"))
-            for position in portfolio.positions.values()
-            if position.total_quantity > 0
-        ),
-        Decimal("0"),
-    )
-    items: List[Dict[str, object]] = []
+    # Acik pozisyonlar ve guncel degerleri tek geciste toplanir; agirliklar ikinci geciste hesaplanir.
+    open_positions = []
+    total_value = Decimal("0")
     for stock_id, position in portfolio.positions.items():
         if position.total_quantity <= 0:
             continue
         current_value = getattr(position, "_analysis_current_value", Decimal("0"))
+        total_value += current_value
+        open_positions.append((stock_id, position.total_cost, current_value))
+
+    items: List[Dict[str, object]] = []
+    for stock_id, total_cost, current_value in open_positions:
         weight = float((current_value / total_value) * Decimal("100")) if total_value > 0 else 0.0
         return_pct = None
-        if position.total_cost > 0:
-            return_pct = float(((current_value - position.total_cost) / position.total_cost) * Decimal("100"))
+        if total_cost > 0:
+            return_pct = float(((current_value - total_cost) / total_cost) * Decimal("100"))
         items.append(
             {
                 "label": ticker_map.get(stock_id, str(stock_id)),
                 "current_value": current_value,
-                "cost_value": position.total_cost,
+                "cost_value": total_cost,
                 "weight": weight,
                 "return_pct": return_pct if return_pct is not None else 0.0,
             }
         )
     return items
-
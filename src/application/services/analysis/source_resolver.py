@@ -10,6 +10,11 @@ from src.domain.ports.repositories.i_stock_repo import IStockRepository
 
 from .models import PortfolioOption
 
+_TRADE_FACTORIES = {
+    ModelTradeSide.BUY: Trade.create_buy,
+    ModelTradeSide.SELL: Trade.create_sell,
+}
+
 
 class AnalysisSourceResolver:
     SOURCE_DASHBOARD = "dashboard"
@@ -39,15 +44,15 @@ class AnalysisSourceResolver:
         return options
 
     def get_first_trade_date_for_source(self, source_code: str) -> Optional[date]:
+        if source_code == self.SOURCE_DASHBOARD:
+            return self._portfolio_repo.get_first_trade_date()
         trades = self.get_source_trades(source_code)
         if not trades:
             return None
         return min(trade.trade_date for trade in trades)
 
-    def get_stock_map_for_source(self, source_code: str) -> dict[int, str]:
-        trades = self.get_source_trades(source_code)
-        stock_ids = sorted({trade.stock_id for trade in trades})
-        return self._stock_repo.get_ticker_map_for_stock_ids(stock_ids)
+    def get_stock_ids_for_source(self, source_code: str) -> List[int]:
+        return sorted({trade.stock_id for trade in self.get_source_trades(source_code)})
 
     def get_source_trades(self, source_code: str) -> List[Trade]:
         if source_code == self.SOURCE_DASHBOARD:
@@ -55,19 +60,17 @@ class AnalysisSourceResolver:
         if source_code.startswith(self.SOURCE_MODEL_PREFIX) and self._model_portfolio_service is not None:
             portfolio_id = int(source_code.split(":", 1)[1])
             model_trades = self._model_portfolio_service.get_portfolio_trades(portfolio_id)
-            converted: List[Trade] = []
-            for trade in model_trades:
-                factory = Trade.create_buy if trade.side == ModelTradeSide.BUY else Trade.create_sell
-                converted.append(
-                    factory(
-                        stock_id=trade.stock_id,
-                        trade_date=trade.trade_date,
-                        quantity=trade.quantity,
-                        price=trade.price,
-                        trade_time=trade.trade_time,
-                    )
+            factories = _TRADE_FACTORIES
+            return [
+                factories[trade.side](
+                    stock_id=trade.stock_id,
+                    trade_date=trade.trade_date,
+                    quantity=trade.quantity,
+                    price=trade.price,
+                    trade_time=trade.trade_time,
                 )
-            return converted
+                for trade in model_trades
+            ]
         return []
 
     def get_source_label(self, source_code: str) -> str:
@@ -77,5 +77,11 @@ class ModelPortfolioService:
     def get_positions_with_details(self, *args, **kwargs):
         return self._snapshot.get_positions_with_details(*args, **kwargs)
 
+    def get_portfolio_overview(self, *args, **kwargs):
+        return self._snapshot.get_portfolio_overview(*args, **kwargs)
+
     def get_trade_count(self, portfolio_id: int):
         return self._snapshot.get_trade_count(portfolio_id)
+
+    def get_trade_counts_bulk(self, portfolio_ids):
+        return self._snapshot.get_trade_counts(portfolio_ids)
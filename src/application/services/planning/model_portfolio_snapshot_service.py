@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.domain.models.model_portfolio import ModelTradeSide
 
@@ -18,12 +18,37 @@ class ModelPortfolioSnapshotService:
         portfolio_id: int,
         price_map: Optional[Dict[int, Decimal]] = None,
     ) -> Dict[str, Any]:
+        portfolio = self._require_portfolio(portfolio_id)
+        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
+        return self._build_summary(portfolio, trades, price_map)
+
+    def get_positions_with_details(
+        self,
+        portfolio_id: int,
+        price_map: Optional[Dict[int, Decimal]] = None,
+    ) -> List[Dict[str, Any]]:
+        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
+        return self._build_positions(trades, price_map)
+
+    def get_portfolio_overview(
+        self,
+        portfolio_id: int,
+        price_map: Optional[Dict[int, Decimal]] = None,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Ozet ve pozisyon detaylarini tek trade okumasiyla birlikte dondurur."""
+        portfolio = self._require_portfolio(portfolio_id)
+        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
+        return self._build_summary(portfolio, trades, price_map), self._build_positions(trades, price_map)
+
+    def _require_portfolio(self, portfolio_id: int):
         portfolio = self._portfolio_repo.get_model_portfolio_by_id(portfolio_id)
         if portfolio is None:
             raise ValueError(f"Portfoy bulunamadi: {portfolio_id}")
+        return portfolio
 
-        remaining_cash = self._trade_service.get_remaining_cash(portfolio_id)
-        positions = self._trade_service.get_positions(portfolio_id)
+    def _build_summary(self, portfolio, trades, price_map: Optional[Dict[int, Decimal]]) -> Dict[str, Any]:
+        remaining_cash = self._trade_service.cash_after_trades(portfolio.initial_cash, trades)
+        positions = self._trade_service.positions_from_trades(trades)
 
         positions_value = Decimal("0")
         if price_map:
@@ -43,13 +68,8 @@ class ModelPortfolioSnapshotService:
             "profit_loss_pct": profit_loss_pct,
         }
 
-    def get_positions_with_details(
-        self,
-        portfolio_id: int,
-        price_map: Optional[Dict[int, Decimal]] = None,
-    ) -> List[Dict[str, Any]]:
-        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
-        positions = self._trade_service.get_positions(portfolio_id)
+    def _build_positions(self, trades, price_map: Optional[Dict[int, Decimal]]) -> List[Dict[str, Any]]:
+        positions = self._trade_service.positions_from_trades(trades)
         if not positions:
             return []
 
@@ -94,3 +114,5 @@ class ModelPortfolioSnapshotService:
     def get_trade_count(self, portfolio_id: int) -> int:
         return self._portfolio_repo.count_trades_by_portfolio_id(portfolio_id)
 
+    def get_trade_counts(self, portfolio_ids: Sequence[int]) -> Dict[int, int]:
+        return self._portfolio_repo.count_trades_by_portfolio_ids(portfolio_ids)
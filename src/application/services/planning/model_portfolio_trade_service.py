@@ -108,6 +108,18 @@ class ModelPortfolioTradeService:
 
     def get_positions(self, portfolio_id: int) -> Dict[int, int]:
         trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
+        return self.positions_from_trades(trades)
+
+    def get_remaining_cash(self, portfolio_id: int) -> Decimal:
+        portfolio = self._portfolio_repo.get_model_portfolio_by_id(portfolio_id)
+        if portfolio is None:
+            raise ValueError(f"Portfoy bulunamadi: {portfolio_id}")
+
+        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
+        return self.cash_after_trades(portfolio.initial_cash, trades)
+
+    @staticmethod
+    def positions_from_trades(trades) -> Dict[int, int]:
         positions: Dict[int, int] = defaultdict(int)
         for trade in trades:
             if trade.side == ModelTradeSide.BUY:
@@ -116,13 +128,9 @@ class ModelPortfolioTradeService:
                 positions[trade.stock_id] -= trade.quantity
         return {stock_id: qty for stock_id, qty in positions.items() if qty > 0}
 
-    def get_remaining_cash(self, portfolio_id: int) -> Decimal:
-        portfolio = self._portfolio_repo.get_model_portfolio_by_id(portfolio_id)
-        if portfolio is None:
-            raise ValueError(f"Portfoy bulunamadi: {portfolio_id}")
-
-        trades = self._portfolio_repo.get_trades_by_portfolio_id(portfolio_id)
-        cash = portfolio.initial_cash
+    @staticmethod
+    def cash_after_trades(initial_cash: Decimal, trades) -> Decimal:
+        cash = initial_cash
         for trade in trades:
             if trade.side == ModelTradeSide.BUY:
                 cash -= trade.total_amount
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.domain.models.portfolio import Portfolio
-from src.domain.models.trade import Trade, TradeSide
+from src.domain.models.trade import Trade
 from src.domain.ports.repositories.i_portfolio_repo import IPortfolioRepository
 from src.domain.ports.repositories.i_price_repo import IPriceRepository
 
@@ -42,22 +42,11 @@ class PortfolioService:
         return self._portfolio_repo.get_trades_by_stock(stock_id)
 
     def calculate_capital(self) -> Decimal:
-        trades = self._portfolio_repo.get_all_trades()
-        capital = Decimal("0")
-        for trade in trades:
-            trade_amount = trade.price * Decimal(trade.quantity)
-            if trade.side == TradeSide.SELL:
-                capital += trade_amount
-            else:
-                capital -= trade_amount
-        return max(Decimal("0"), capital)
+        return max(Decimal("0"), self._portfolio_repo.get_trade_cash_balance())
 
     def get_all_trades(self) -> List[Trade]:
         return self._portfolio_repo.get_all_trades()
 
-    def get_first_trade_date(self):
-        trades = self._portfolio_repo.get_all_trades()
-        if not trades:
-            return None
-        return min(trade.trade_date for trade in trades)
+    def get_first_trade_date(self) -> Optional[date]:
+        return self._portfolio_repo.get_first_trade_date()
 
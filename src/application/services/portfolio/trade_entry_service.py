@@ -9,6 +9,12 @@ from src.domain.models.stock import Stock
 from src.domain.models.trade import Trade, TradeSide
 
 
+_TRADE_FACTORIES = {
+    TradeSide.BUY: Trade.create_buy,
+    TradeSide.SELL: Trade.create_sell,
+}
+
+
 @dataclass(frozen=True)
 class TradeEntryResult:
     trade: Trade
@@ -62,9 +68,8 @@ class TradeEntryService:
     ) -> TradeEntryResult:
         stock = self.ensure_stock(ticker=ticker, name=name, stock_id=stock_id)
         trade_side = side if isinstance(side, TradeSide) else TradeSide(side)
-        trade_factory = Trade.create_buy if trade_side == TradeSide.BUY else Trade.create_sell
         saved_trade = self._portfolio_service.add_trade(
-            trade_factory(
+            _TRADE_FACTORIES[trade_side](
                 stock_id=stock.id,
                 trade_date=trade_date,
                 trade_time=trade_time,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from src.domain.models.model_portfolio import ModelPortfolio, ModelPortfolioTrade
 
@@ -65,6 +65,14 @@ class IModelPortfolioRepository(ABC):
         """Belirli bir model portföye ait trade sayısını veritabanından optimize biçimde sayar."""
         raise NotImplementedError
 
+    @abstractmethod
+    def count_trades_by_portfolio_ids(self, portfolio_ids: Sequence[int]) -> Dict[int, int]:
+        """
+        Birden fazla portföyün trade sayılarını tek sorguda döner.
+        Dönüş: {portfolio_id: trade_sayısı}; trade'i olmayan portföyler 0 ile yer alır.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_trade_by_id(self, trade_id: int) -> Optional[ModelPortfolioTrade]:
         """Tek bir trade'i id üzerinden döner. Bulunamazsa None."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import date
+from decimal import Decimal
 from typing import Iterable, List, Optional, Sequence
 
 from src.domain.models.trade import Trade
@@ -61,6 +62,22 @@ class IPortfolioRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_first_trade_date(self) -> Optional[date]:
+        """
+        En eski trade tarihini döner; hiç trade yoksa None.
+        MIN(trade_date) veritabanında hesaplanır.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_trade_cash_balance(self) -> Decimal:
+        """
+        Tüm trade'lerden doğan net nakit akışını (satış tutarları - alış tutarları) döner.
+        Toplam veritabanında hesaplanır; trade listesi belleğe çekilmez.
+        """
+        raise NotImplementedError
+
     # --------- WRITE (Command) operasyonları --------- #
 
     @abstractmethod
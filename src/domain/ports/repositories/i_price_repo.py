@@ -49,6 +49,17 @@ class IPriceRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_last_prices_before(self, stock_ids: Sequence[int], price_date: date) -> Dict[int, Decimal]:
+        """
+        get_last_price_before'un toplu versiyonu: verilen hisseler için tarihten
+        önceki (veya aynı gün) son kapanışları tek seferde döner.
+
+        Dönüş:
+          { stock_id: close_price }  (fiyatı olmayan hisseler yer almaz)
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_price_series(
         self,
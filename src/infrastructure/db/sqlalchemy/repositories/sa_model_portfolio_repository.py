@@ -2,7 +2,9 @@
 
 from datetime import date, time
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import func
 
 from src.domain.models.model_portfolio import ModelPortfolio, ModelPortfolioTrade, ModelTradeSide
 from src.domain.ports.repositories.i_model_portfolio_repo import IModelPortfolioRepository
@@ -129,6 +131,22 @@ class SQLAlchemyModelPortfolioRepository(IModelPortfolioRepository):
         with self._provider.get_session() as session:
             return session.query(ORMModelPortfolioTrade).filter_by(portfolio_id=portfolio_id).count()
 
+    def count_trades_by_portfolio_ids(self, portfolio_ids: Sequence[int]) -> Dict[int, int]:
+        counts: Dict[int, int] = {portfolio_id: 0 for portfolio_id in portfolio_ids}
+        if not counts:
+            return counts
+        with self._provider.get_session() as session:
+            rows = session.query(
+                ORMModelPortfolioTrade.portfolio_id,
+                func.count(ORMModelPortfolioTrade.id),
+            )\
+                .filter(ORMModelPortfolioTrade.portfolio_id.in_(list(counts)))\
+                .group_by(ORMModelPortfolioTrade.portfolio_id)\
+                .all()
+            for portfolio_id, count in rows:
+                counts[portfolio_id] = int(count)
+        return counts
+
     def get_trade_by_id(self, trade_id: int) -> Optional[ModelPortfolioTrade]:
         with self._provider.get_session() as session:
             row = session.query(ORMModelPortfolioTrade).filter_by(id=trade_id).first()
@@ -1,7 +1,11 @@
 # src/infrastructure/db/sqlalchemy/repositories/sa_portfolio_repository.py
 
 from datetime import date
+from decimal import Decimal
 from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import case, func
+
 from src.domain.models.trade import Trade, TradeSide
 from src.domain.ports.repositories.i_portfolio_repo import IPortfolioRepository
 from src.infrastructure.db.sqlalchemy.database_engine import SQLAlchemyEngineProvider
@@ -68,6 +72,18 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
             rows = session.query(ORMTrade.stock_id).distinct().all()
             return [r.stock_id for r in rows]
 
+    def get_first_trade_date(self) -> Optional[date]:
+        with self._provider.get_session() as session:
+            return session.query(func.min(ORMTrade.trade_date)).scalar()
+
+    def get_trade_cash_balance(self) -> Decimal:
+        # total_amount kalici hesaplanan kolon; satir basina carpim yapilmaz
+        trade_amount = ORMTrade.total_amount
+        signed_amount = case((ORMTrade.side == TradeSide.SELL.value, trade_amount), else_=-trade_amount)
+        with self._provider.get_session() as session:
+            total = session.query(func.coalesce(func.sum(signed_amount), 0)).scalar()
+            return Decimal(str(total))
+
     # ---------- WRITE ---------- #
     def insert_trade(self, trade: Trade) -> Trade:
         with self._provider.get_session() as session:
@@ -112,8 +128,3 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
         with self._provider.get_session() as session:
             session.query(ORMTrade).delete()
             session.commit()
-
-    def get_first_trade_date(self) -> Optional[date]:
-        with self._provider.get_session() as session:
-            row = session.query(ORMTrade.trade_date).order_by(ORMTrade.trade_date.asc()).first()
-            return row.trade_date if row else None
@@ -60,6 +60,33 @@ class SQLAlchemyPriceRepository(IPriceRepository):
                 .first()
             return self._to_domain(row) if row else None
 
+    def get_last_prices_before(self, stock_ids: Sequence[int], price_date: date) -> Dict[int, Decimal]:
+        if not stock_ids:
+            return {}
+        with self._provider.get_session() as session:
+            last_dates = session.query(
+                ORMDailyPrice.stock_id.label("stock_id"),
+                func.max(ORMDailyPrice.price_date).label("last_date"),
+            )\
+                .filter(ORMDailyPrice.stock_id.in_(stock_ids))\
+                .filter(ORMDailyPrice.price_date <= price_date)\
+                .group_by(ORMDailyPrice.stock_id)\
+                .subquery()
+            rows = session.query(ORMDailyPrice.stock_id, ORMDailyPrice.close_price)\
+                .join(
+                    last_dates,
+                    (ORMDailyPrice.stock_id == last_dates.c.stock_id)
+                    & (ORMDailyPrice.price_date == last_dates.c.last_date),
+                ).all()
+
+            result: Dict[int, Decimal] = {}
+            for r in rows:
+                val = r.close_price
+                if not isinstance(val, Decimal):
+                    val = Decimal(str(val))
+                result[r.stock_id] = val
+            return result
+
     def get_price_series(self, stock_id: int, start_date: date, end_date: date) -> List[DailyPrice]:
         with self._provider.get_session() as session:
             rows = session.query(ORMDailyPrice)\
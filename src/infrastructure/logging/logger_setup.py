@@ -44,6 +44,11 @@ def setup_logger():
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
 
+    # Toplu fiyat indirmelerinde her basarisiz ticker icin yazilan kutuphane loglari
+    # konsolu tikamasin; yalnizca hata seviyesi gecer.
+    for noisy_logger in ("yfinance", "urllib3"):
+        logging.getLogger(noisy_logger).setLevel(logging.ERROR)
+
     return logger
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> Path:
+    """
+    Kullaniciya ozel fiyat cache dizini (Linux: ~/.cache/portfoy/prices).
+    Paylasilan temp dizini kullanilmaz; baska bir kullanici dosya yerlestiremez.
+    """
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "portfoy" / "prices"
+
+
+class PriceSeriesFileCache:
+    """
+    Piyasa fiyat serilerini (ticker, baslangic, bitis) anahtariyla diske yazan TTL cache.
+    Uygulama yeniden acildiginda ayni aralik icin ag istegi tekrarlanmaz.
+
+    Seriler JSON olarak (ISO tarih -> Decimal metni) saklanir; okuma kod calistirmaz.
+    Acilista suresi dolmus kayitlar silinir ve kayit sayisi MAX_ENTRIES ile sinirlanir.
+    """
+
+    INTRADAY_TTL_SECONDS = 15 * 60
+    RECENT_TTL_SECONDS = 24 * 60 * 60
+    HISTORICAL_TTL_SECONDS = 90 * 24 * 60 * 60
+    HISTORICAL_AGE_DAYS = 7
+    MAX_ENTRIES = 500
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._sweep()
+
+    @classmethod
+    def ttl_for(cls, end_date: date, today: Optional[date] = None) -> int:
+        today = today or date.today()
+        if end_date >= today:
+            return cls.INTRADAY_TTL_SECONDS
+        if end_date < today - timedelta(days=cls.HISTORICAL_AGE_DAYS):
+            return cls.HISTORICAL_TTL_SECONDS
+        return cls.RECENT_TTL_SECONDS
+
+    def get(self, ticker: str, start_date: date, end_date: date) -> Optional[Dict[date, Decimal]]:
+        path = self._path_for(ticker, start_date, end_date)
+        entry = self._read_entry(path)
+        if entry is None:
+            return None
+
+        if time.time() - entry["ts"] >= entry["ttl"]:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            return {date.fromisoformat(key): Decimal(value) for key, value in entry["series"].items()}
+        except (AttributeError, TypeError, ValueError, ArithmeticError):
+            logger.debug("Fiyat cache kaydi cozulemedi: %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, ticker: str, start_date: date, end_date: date, series: Dict[date, Decimal]) -> None:
+        path = self._path_for(ticker, start_date, end_date)
+        entry = {
+            "ts": time.time(),
+            "ttl": self.ttl_for(end_date),
+            "series": {point_date.isoformat(): str(value) for point_date, value in series.items()},
+        }
+        temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(temp_path, path)
+        except OSError:
+            logger.debug("Fiyat cache dosyasi yazilamadi: %s", path, exc_info=True)
+            temp_path.unlink(missing_ok=True)
+
+    def _read_entry(self, path: Path) -> Optional[dict]:
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+            entry["ts"], entry["ttl"] = float(entry["ts"]), float(entry["ttl"])
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Fiyat cache dosyasi okunamadi: %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _sweep(self) -> None:
+        """Suresi dolmus, bozuk veya yarim kalmis kayitlari siler; en eski kayitlari sinira kadar budar."""
+        now = time.time()
+        live = []
+        try:
+            paths = list(self._cache_dir.iterdir())
+        except OSError:
+            logger.debug("Fiyat cache dizini taranamadi: %s", self._cache_dir, exc_info=True)
+            return
+        for path in paths:
+            if path.suffix != ".json":
+                # Eski pickle kayitlari ve yarim kalmis gecici dosyalar okunmaz, silinir.
+                if path.is_file():
+                    path.unlink(missing_ok=True)
+                continue
+            entry = self._read_entry(path)
+            if entry is None:
+                continue
+            if now - entry["ts"] >= entry["ttl"]:
+                path.unlink(missing_ok=True)
+                continue
+            live.append((entry["ts"], path))
+
+        live.sort()
+        for _, path in live[: max(0, len(live) - self.MAX_ENTRIES)]:
+            path.unlink(missing_ok=True)
+
+    def _path_for(self, ticker: str, start_date: date, end_date: date) -> Path:
+        key = f"{ticker.upper()}:{start_date.isoformat()}:{end_date.isoformat()}"
+        return self._cache_dir / f"{hashlib.md5(key.encode('utf-8')).hexdigest()}.json"
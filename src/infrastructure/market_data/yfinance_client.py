@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import tempfile
+import threading
 import warnings
 from datetime import date
 from pathlib import Path
@@ -17,6 +18,7 @@ from pandas.errors import Pandas4Warning
 from src.domain.ports.services.i_market_data_client import IMarketDataClient
 
 from .investing_fallback_client import InvestingFallbackClient
+from .price_series_cache import PriceSeriesFileCache, default_cache_dir
 from .scraped_benchmark_provider import ScrapedBenchmarkProvider
 from .yfinance_price_client import YFinancePriceClient
 
@@ -28,11 +30,16 @@ class YFinanceMarketDataClient(IMarketDataClient):
     Thin facade over dedicated market-data providers.
     """
 
-    def __init__(self, timeout: int = 10) -> None:
+    def __init__(self, timeout: int = 10, persistent_cache: bool = False) -> None:
         self._timeout = timeout
+        # yf.download modul seviyesinde paylasilan durum kullanir; toplu indirmeler birbirini ezmesin.
+        self._download_lock = threading.Lock()
         cache_dir = Path(tempfile.gettempdir()) / "portfoy-simulasyonu" / "yfinance-cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
         yf.set_tz_cache_location(str(cache_dir))
+        self._series_cache = (
+            PriceSeriesFileCache(default_cache_dir()) if persistent_cache else None
+        )
         warnings.filterwarnings(
             "ignore",
             message="Timestamp.utcnow is deprecated and will be removed in a future version.*",
@@ -43,17 +50,28 @@ class YFinanceMarketDataClient(IMarketDataClient):
         self._investing_client = InvestingFallbackClient(self)
         self._price_client = YFinancePriceClient(self)
 
-    def _download_dataframe(self, tickers, start: date, end: date):
-        return yf.download(
-            tickers=tickers,
+    def _history_dataframe(self, ticker: str, start: date, end: date):
+        # Ticker.history nesneye ozel calisir; yf.download'in modul durumunu paylasmadigi icin kilitsiz paralel cagrilabilir.
+        return yf.Ticker(ticker).history(
             start=start,
             end=end,
             interval="1d",
-            progress=False,
             auto_adjust=False,
             timeout=self._timeout,
         )
 
+    def _download_dataframe(self, tickers, start: date, end: date):
+        with self._download_lock:
+            return yf.download(
+                tickers=tickers,
+                start=start,
+                end=end,
+                interval="1d",
+                progress=False,
+                auto_adjust=False,
+                timeout=self._timeout,
+            )
+
     def _request_text(self, url: str) -> str:
         request = Request(
             url,
@@ -105,4 +123,13 @@ class YFinanceMarketDataClient(IMarketDataClient):
         start_date: date,
         end_date: date,
     ):
-        return self._price_client.get_price_series(ticker=ticker, start_date=start_date, end_date=end_date)
+        if self._series_cache is None:
+            return self._price_client.get_price_series(ticker=ticker, start_date=start_date, end_date=end_date)
+
+        cached = self._series_cache.get(ticker, start_date, end_date)
+        if cached is not None:
+            return cached
+        series = self._price_client.get_price_series(ticker=ticker, start_date=start_date, end_date=end_date)
+        if series:
+            self._series_cache.set(ticker, start_date, end_date, series)
+        return series
@@ -15,6 +15,20 @@ class YFinancePriceClient:
     def to_decimal(value) -> Decimal:
         return Decimal(str(float(value.squeeze())))
 
+    @staticmethod
+    def close_series(dataframe: pd.DataFrame, ticker: str | None = None) -> pd.Series:
+        """
+        yfinance tek ticker icin de MultiIndex kolon dondurebilir; Close kolonunu
+        bir kez tek boyutlu, NaN'siz float serisine indirger.
+        """
+        close = dataframe["Close"]
+        if isinstance(close, pd.DataFrame):
+            if ticker is not None and ticker in close.columns:
+                close = close[ticker]
+            else:
+                close = close.iloc[:, 0]
+        return close.dropna().astype(float)
+
     @staticmethod
     def next_date(point_date: date) -> date:
         return point_date + timedelta(days=1)
@@ -30,10 +44,11 @@ class YFinancePriceClient:
         if investing_series:
             return investing_series[price_date]
 
-        dataframe = self._owner._download_dataframe(ticker, price_date, self.next_date(price_date))
-        if dataframe.empty:
+        dataframe = self._owner._history_dataframe(ticker, price_date, self.next_date(price_date))
+        closes = self.close_series(dataframe, ticker) if not dataframe.empty else None
+        if closes is None or closes.empty:
             raise ValueError(f"{ticker} icin {price_date} gun sonu fiyati bulunamadi.")
-        return self.to_decimal(dataframe["Close"].iloc[-1])
+        return self.to_decimal(closes.iloc[-1])
 
     def get_closing_prices(
         self,
@@ -81,9 +96,9 @@ class YFinancePriceClient:
                     continue
                 result[stock_id] = self.to_decimal(close_value)
         else:
-            close_value = dataframe.iloc[-1]["Close"]
-            if not pd.isna(close_value):
-                result[remaining_ids[0]] = self.to_decimal(close_value)
+            closes = self.close_series(dataframe, remaining_tickers[0])
+            if not closes.empty:
+                result[remaining_ids[0]] = self.to_decimal(closes.iloc[-1])
         return result
 
     def get_price_series(
@@ -103,14 +118,13 @@ class YFinancePriceClient:
         if investing_series:
             return investing_series
 
-        dataframe = self._owner._download_dataframe(ticker, start_date, self.next_date(end_date))
+        dataframe = self._owner._history_dataframe(ticker, start_date, self.next_date(end_date))
         if dataframe.empty:
             return {}
 
+        closes = self.close_series(dataframe, ticker)
         result: Dict[date, Decimal] = {}
-        for timestamp, value in dataframe["Close"].items():
-            if pd.isna(value):
-                continue
+        for timestamp, value in zip(closes.index, closes.to_numpy()):
             point_date = timestamp.date()
             if start_date <= point_date <= end_date:
                 result[point_date] = self.to_decimal(value)
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-import math
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pyqtgraph as pg
-import pyqtgraph.exporters
 from PyQt5.QtCore import QRectF, Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QFont, QPainter, QPen
-from PyQt5.QtPrintSupport import QPrinter
 from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
 
@@ -24,18 +24,46 @@ TEXT_PRIMARY = "#f1f5f9"
 TEXT_SECONDARY = "#94a3b8"
 TEXT_MUTED = "#64748b"
 ACCENT = "#38bdf8"
+SERIES_COLORS: Tuple[str, ...] = (
+    ACCENT,
+    "#f97316",
+    "#22c55e",
+    "#ef4444",
+    "#a78bfa",
+    "#f472b6",
+    "#facc15",
+    "#14b8a6",
+    "#fb7185",
+    "#60a5fa",
+)
+
+
+@lru_cache(maxsize=8192)
+def _date_to_timestamp(point_date: date) -> float:
+    # Portfoy, benchmark ve hisse serileri ayni gunleri paylasir; donusum gun basina bir kez yapilir.
+    return datetime.combine(point_date, time.min).timestamp()
 
 
 @dataclass(frozen=True)
 class PreparedSeries:
     label: str
-    x_values: List[float]
-    y_values: List[float]
+    x_values: np.ndarray
+    y_values: np.ndarray
     color: str
     is_primary: bool
     trimmed_points: int
 
 
+@dataclass(frozen=True)
+class PieSlice:
+    start_angle: int
+    span: int
+    label: str
+    compact: bool
+    label_cos: float
+    label_sin: float
+
+
 class DateAxisItem(pg.AxisItem):
     def tickStrings(self, values, scale, spacing):  # noqa: N802 - pyqtgraph API
         labels = []
@@ -52,35 +80,54 @@ class PieChartWidget(QWidget):
         super().__init__(parent)
         self._title = ""
         self._breakdown: List[Tuple[str, float]] = []
+        self._slices: List[PieSlice] = []
         self._message = "Grafik verisi bekleniyor"
-        self._colors = [
-            "#38bdf8",
-            "#f97316",
-            "#22c55e",
-            "#ef4444",
-            "#a78bfa",
-            "#f472b6",
-            "#facc15",
-            "#14b8a6",
-            "#fb7185",
-            "#60a5fa",
-        ]
+        self._colors = SERIES_COLORS
         self.setMinimumHeight(320)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
     def set_empty(self, message: str) -> None:
         self._title = ""
         self._breakdown = []
+        self._slices = []
         self._message = message
         self.update()
 
     def set_data(self, title: str, breakdown: List[Tuple[str, float]]) -> None:
         self._title = title
         self._breakdown = list(breakdown)
+        self._slices = self._build_slices(self._breakdown)
         self._message = ""
         self.update()
 
-    def colors(self) -> List[str]:
+    @classmethod
+    def _build_slices(cls, breakdown: List[Tuple[str, float]]) -> List[PieSlice]:
+        # Aci ve etiket geometrisi veri degistiginde bir kez hesaplanir; paintEvent yalnizca boyutla olcekler.
+        values = np.fromiter((value for _, value in breakdown), dtype=np.float64, count=len(breakdown))
+        total = float(values.sum()) if values.size else 0.0
+        if total <= 0:
+            return []
+
+        fractions = values / total
+        spans = (-fractions * 360 * 16).astype(np.int64)
+        start_angles = 90 * 16 + np.concatenate(([0], np.cumsum(spans)[:-1]))
+        mid_radians = np.radians((start_angles + spans / 2) / 16)
+        cosines = np.cos(mid_radians)
+        sines = np.sin(mid_radians)
+        pcts = fractions * 100
+        return [
+            PieSlice(
+                start_angle=int(start_angles[idx]),
+                span=int(spans[idx]),
+                label=f"{cls._break_label(label)}\n%{pcts[idx]:.1f}",
+                compact=bool(pcts[idx] < 8),
+                label_cos=float(cosines[idx]),
+                label_sin=float(sines[idx]),
+            )
+            for idx, (label, _) in enumerate(breakdown)
+        ]
+
+    def colors(self) -> Tuple[str, ...]:
         return self._colors
 
     def paintEvent(self, _event) -> None:  # noqa: N802 - Qt API
@@ -100,35 +147,27 @@ class PieChartWidget(QWidget):
             painter.drawText(self.rect(), Qt.AlignCenter, self._message)
             return
 
-        total = sum(value for _, value in self._breakdown)
-        if total <= 0:
+        if not self._slices:
             painter.setPen(QColor(TEXT_SECONDARY))
             painter.drawText(self.rect(), Qt.AlignCenter, "Dağılım için pozitif değer yok")
             return
 
         side = max(140, min(self.width() - 30, self.height() - 95))
         pie_rect = QRectF((self.width() - side) / 2, 54, side, side)
-        start_angle = 90 * 16
-        for idx, (_, value) in enumerate(self._breakdown):
-            span = int(-(value / total) * 360 * 16)
+        center = pie_rect.center()
+        label_radius = side * 0.33
+        slice_pen = QPen(QColor(BG_BASE), 2)
+        for idx, pie_slice in enumerate(self._slices):
             painter.setBrush(QColor(self._colors[idx % len(self._colors)]))
-            painter.setPen(QPen(QColor(BG_BASE), 2))
-            painter.drawPie(pie_rect, start_angle, span)
-
-            mid_angle = (start_angle + span / 2) / 16
-            label_radius = side * 0.33
-            center = pie_rect.center()
-            label_x = center.x() + math.cos(math.radians(mid_angle)) * label_radius
-            label_y = center.y() - math.sin(math.radians(mid_angle)) * label_radius
-            pct = (value / total) * 100
+            painter.setPen(slice_pen)
+            painter.drawPie(pie_rect, pie_slice.start_angle, pie_slice.span)
             self._draw_slice_label(
                 painter,
-                label=f"{self._break_label(self._breakdown[idx][0])}\n%{pct:.1f}",
-                center_x=label_x,
-                center_y=label_y,
-                compact=pct < 8,
+                label=pie_slice.label,
+                center_x=center.x() + pie_slice.label_cos * label_radius,
+                center_y=center.y() - pie_slice.label_sin * label_radius,
+                compact=pie_slice.compact,
             )
-            start_angle += span
 
     def _draw_slice_label(self, painter: QPainter, label: str, center_x: float, center_y: float, compact: bool) -> None:
         font = QFont()
@@ -159,12 +198,17 @@ class AnalysisChartEngine(QWidget):
     """
 
     hover_changed = pyqtSignal(str)
+    MAX_CACHED_SERIES = 32
 
     def __init__(self, parent=None, show_toolbar: bool = True):
         super().__init__(parent)
         self._show_toolbar = show_toolbar
         self._prepared_series: List[PreparedSeries] = []
         self._plot_items: list = []
+        # (id(points), normalize) -> (points, x, y, kirpilan); grafik modu degisince seriler yeniden hazirlanmaz.
+        self._series_cache: OrderedDict[Tuple[int, bool], tuple] = OrderedDict()
+        self._legend_label_pool: deque[QLabel] = deque()
+        self._hover_x: float | None = None
         self._init_ui()
 
     def _init_ui(self):
@@ -213,6 +257,13 @@ class AnalysisChartEngine(QWidget):
         self.hover_label = pg.TextItem("", color=TEXT_PRIMARY, fill=pg.mkBrush(15, 23, 42, 230), border=pg.mkPen(BORDER))
         self.hover_label.hide()
         self.plot_widget.addItem(self.hover_label, ignoreBounds=True)
+        self.baseline_line = pg.InfiniteLine(
+            angle=0,
+            movable=False,
+            pen=pg.mkPen("#64748b", width=1.4, style=Qt.DashLine),
+        )
+        self.baseline_line.hide()
+        self.plot_widget.addItem(self.baseline_line)
         self.proxy = pg.SignalProxy(self.plot_widget.scene().sigMouseMoved, rateLimit=30, slot=self._on_mouse_moved)
 
         self.draw_empty_chart("Grafik verisi bekleniyor")
@@ -222,6 +273,9 @@ class AnalysisChartEngine(QWidget):
         plot_item.showGrid(x=True, y=True, alpha=0.16)
         plot_item.setMenuEnabled(False)
         plot_item.hideButtons()
+        # Uzun araliklarda piksel basina min/max (peak) ornekleme; gorunmeyen noktalar cizilmez.
+        plot_item.setDownsampling(auto=True, mode="peak")
+        plot_item.setClipToView(True)
         plot_item.setLabel("bottom", "Tarih", color=TEXT_SECONDARY)
         plot_item.setLabel("left", "", color=TEXT_SECONDARY)
         for axis_name in ("left", "bottom"):
@@ -234,21 +288,17 @@ class AnalysisChartEngine(QWidget):
 
     def draw_empty_chart(self, message: str):
         self._show_plot()
-        self.plot_widget.clear()
-        self._plot_items = []
+        self._remove_series_items(keep=0)
         self._prepared_series = []
-        self._configure_plot_item()
-        self.plot_widget.getPlotItem().setTitle(message, color=TEXT_SECONDARY, size="13pt")
+        plot_item = self.plot_widget.getPlotItem()
+        plot_item.setTitle(message, color=TEXT_SECONDARY, size="13pt")
+        plot_item.setLabel("left", "", color=TEXT_SECONDARY)
+        self.baseline_line.hide()
+        self._hide_hover()
         self._clear_legend()
         self._add_legend_label(message, TEXT_SECONDARY)
         self.legend_panel.show()
         self.lbl_summary.setText(message)
-        self.v_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen(TEXT_MUTED, width=1, style=Qt.DashLine))
-        self.v_line.hide()
-        self.plot_widget.addItem(self.v_line, ignoreBounds=True)
-        self.hover_label = pg.TextItem("", color=TEXT_PRIMARY, fill=pg.mkBrush(15, 23, 42, 230), border=pg.mkPen(BORDER))
-        self.hover_label.hide()
-        self.plot_widget.addItem(self.hover_label, ignoreBounds=True)
 
     def draw_line_series(
         self,
@@ -259,10 +309,9 @@ class AnalysisChartEngine(QWidget):
         baseline: float | None = None,
     ):
         self._show_plot()
-        self.plot_widget.clear()
-        self._configure_plot_item()
-        self.plot_widget.getPlotItem().setTitle(title, color=TEXT_PRIMARY, size="15pt")
-        self.plot_widget.getPlotItem().setLabel("left", y_label, color=TEXT_SECONDARY)
+        plot_item = self.plot_widget.getPlotItem()
+        plot_item.setTitle(title, color=TEXT_PRIMARY, size="15pt")
+        plot_item.setLabel("left", y_label, color=TEXT_SECONDARY)
         self._clear_legend()
         self.legend_panel.show()
 
@@ -272,36 +321,42 @@ class AnalysisChartEngine(QWidget):
             return
 
         if baseline is not None:
-            baseline_item = pg.InfiniteLine(
-                pos=baseline,
-                angle=0,
-                movable=False,
-                pen=pg.mkPen("#64748b", width=1.4, style=Qt.DashLine),
-            )
-            self.plot_widget.addItem(baseline_item)
-
-        self._plot_items = []
-        for series in self._prepared_series:
+            self.baseline_line.setPos(baseline)
+            self.baseline_line.show()
+        else:
+            self.baseline_line.hide()
+
+        # Mevcut cizgi ogeleri setData ile guncellenir; sahne her cizimde bastan kurulmaz.
+        # Otomatik olcekleme her setData'da degil, tum seriler eklendikten sonra bir kez hesaplanir.
+        plot_item.disableAutoRange()
+        for idx, series in enumerate(self._prepared_series):
             line_color = QColor(series.color)
             if not series.is_primary:
                 line_color.setAlpha(190)
             pen = pg.mkPen(line_color, width=3.2 if series.is_primary else 1.8)
-            item = self.plot_widget.plot(series.x_values, series.y_values, pen=pen, symbol=None, name=series.label)
+            if idx < len(self._plot_items):
+                item = self._plot_items[idx]
+                item.setData(series.x_values, series.y_values, pen=pen, name=series.label)
+            else:
+                item = self.plot_widget.plot(series.x_values, series.y_values, pen=pen, symbol=None, name=series.label)
+                self._plot_items.append(item)
             item.setZValue(10 if series.is_primary else 3)
-            self._plot_items.append(item)
             self._add_legend_row(series)
+        self._remove_series_items(keep=len(self._prepared_series))
 
         self.plot_widget.enableAutoRange()
         trimmed = sum(series.trimmed_points for series in self._prepared_series)
         extra = f" - {trimmed} başlangıç noktası kırpıldı" if trimmed else ""
         self.lbl_summary.setText(f"{len(self._prepared_series)} seri gösteriliyor{extra}")
+        self._hide_hover()
 
-        self.v_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen(TEXT_MUTED, width=1, style=Qt.DashLine))
-        self.v_line.hide()
-        self.plot_widget.addItem(self.v_line, ignoreBounds=True)
-        self.hover_label = pg.TextItem("", color=TEXT_PRIMARY, fill=pg.mkBrush(15, 23, 42, 235), border=pg.mkPen(BORDER))
-        self.hover_label.hide()
-        self.plot_widget.addItem(self.hover_label, ignoreBounds=True)
+    def clear_series_cache(self) -> None:
+        self._series_cache.clear()
+
+    def _remove_series_items(self, keep: int) -> None:
+        for item in self._plot_items[keep:]:
+            self.plot_widget.removeItem(item)
+        del self._plot_items[keep:]
 
     def draw_portfolio_pie(self, title: str, breakdown: List[Tuple[str, float]]):
         self._show_pie()
@@ -321,16 +376,23 @@ class AnalysisChartEngine(QWidget):
         suffix = Path(file_path).suffix.lower()
         target_widget: QWidget = self.pie_widget if self.pie_widget.isVisible() else self.plot_widget
 
+        # Disa aktarma modulleri sayfa acilisinda degil, yalnizca kayit aninda yuklenir.
         if suffix == ".svg" and target_widget is self.plot_widget:
-            exporter = pg.exporters.SVGExporter(self.plot_widget.getPlotItem())
+            from pyqtgraph import exporters
+
+            exporter = exporters.SVGExporter(self.plot_widget.getPlotItem())
             exporter.export(file_path)
             return
         if suffix in {".png", ".jpg", ".jpeg"} and target_widget is self.plot_widget:
-            exporter = pg.exporters.ImageExporter(self.plot_widget.getPlotItem())
+            from pyqtgraph import exporters
+
+            exporter = exporters.ImageExporter(self.plot_widget.getPlotItem())
             exporter.parameters()["width"] = max(1200, self.plot_widget.width())
             exporter.export(file_path)
             return
         if suffix == ".pdf":
+            from PyQt5.QtPrintSupport import QPrinter
+
             printer = QPrinter(QPrinter.HighResolution)
             printer.setOutputFormat(QPrinter.PdfFormat)
             printer.setOutputFileName(file_path)
@@ -356,67 +418,94 @@ class AnalysisChartEngine(QWidget):
         series_map: Dict[str, Dict[date, Decimal | float]],
         normalize: bool,
     ) -> List[PreparedSeries]:
-        palette = [
-            ACCENT,
-            "#f97316",
-            "#22c55e",
-            "#ef4444",
-            "#a78bfa",
-            "#f472b6",
-            "#facc15",
-            "#14b8a6",
-            "#fb7185",
-            "#60a5fa",
-        ]
         prepared: List[PreparedSeries] = []
         for idx, (label, points) in enumerate(series_map.items()):
-            sorted_points = sorted(points.items(), key=lambda item: item[0])
-            raw = [(point_date, float(value)) for point_date, value in sorted_points if value is not None]
-            if normalize:
-                first_positive_index = next((i for i, (_, value) in enumerate(raw) if value > 0), None)
-                if first_positive_index is None:
-                    continue
-                trimmed_points = first_positive_index
-                raw = raw[first_positive_index:]
-                base = raw[0][1]
-                if base <= 0:
-                    continue
-                values = [(point_date, (value / base) * 100) for point_date, value in raw if value > 0]
-            else:
-                trimmed_points = 0
-                values = [(point_date, value) for point_date, value in raw if math.isfinite(value)]
-            if not values:
+            arrays = self._get_series_arrays(points, normalize)
+            if arrays is None:
                 continue
-
-            x_values = [self._date_to_x(point_date) for point_date, _ in values]
-            y_values = [value for _, value in values]
+            x_values, y_values, trimmed_points = arrays
             prepared.append(
                 PreparedSeries(
                     label=label,
                     x_values=x_values,
                     y_values=y_values,
-                    color=palette[idx % len(palette)],
+                    color=SERIES_COLORS[idx % len(SERIES_COLORS)],
                     is_primary=label == "Ana Portföy" or not prepared,
                     trimmed_points=trimmed_points,
                 )
             )
         return prepared
 
+    def _get_series_arrays(
+        self,
+        points: Dict[date, Decimal | float],
+        normalize: bool,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        key = (id(points), normalize)
+        cached = self._series_cache.get(key)
+        # id tekrar kullanilabilir; kayit yalnizca ayni sozluk nesnesi icin gecerlidir.
+        if cached is not None and cached[0] is points:
+            self._series_cache.move_to_end(key)
+            return cached[1]
+
+        arrays = self._build_series_arrays(points, normalize)
+        self._series_cache[key] = (points, arrays)
+        while len(self._series_cache) > self.MAX_CACHED_SERIES:
+            self._series_cache.popitem(last=False)
+        return arrays
+
+    def _build_series_arrays(
+        self,
+        points: Dict[date, Decimal | float],
+        normalize: bool,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        sorted_points = sorted(points.items(), key=lambda item: item[0])
+        raw = [(point_date, value) for point_date, value in sorted_points if value is not None]
+        if not raw:
+            return None
+        # x epoch saniyesi oldugu icin float64 kalir; y ekranda float32 hassasiyetiyle yeterli.
+        x_values = np.fromiter((self._date_to_x(point_date) for point_date, _ in raw), dtype=np.float64, count=len(raw))
+        y_values = np.fromiter((float(value) for _, value in raw), dtype=np.float64, count=len(raw))
+        if normalize:
+            positive = np.flatnonzero(y_values > 0)
+            if not positive.size:
+                return None
+            trimmed_points = int(positive[0])
+            x_values = x_values[trimmed_points:]
+            y_values = y_values[trimmed_points:]
+            base = y_values[0]
+            keep = y_values > 0
+            y_values = y_values[keep] / base * 100
+            x_values = x_values[keep]
+        else:
+            trimmed_points = 0
+            keep = np.isfinite(y_values)
+            x_values = x_values[keep]
+            y_values = y_values[keep]
+        if not y_values.size:
+            return None
+        return x_values, y_values.astype(np.float32), trimmed_points
+
     def _on_mouse_moved(self, event) -> None:
         if not self._prepared_series or not self.plot_widget.isVisible():
             return
         pos = event[0]
         if not self.plot_widget.sceneBoundingRect().contains(pos):
-            self.v_line.hide()
-            self.hover_label.hide()
+            self._hide_hover()
             return
         mouse_point = self.plot_widget.getPlotItem().vb.mapSceneToView(pos)
         x = mouse_point.x()
+        view_range = self.plot_widget.getPlotItem().vb.viewRange()
         nearest = self._nearest_points(x)
         if not nearest:
             return
 
         nearest_x = nearest[0][1]
+        if nearest_x == self._hover_x and self.hover_label.isVisible():
+            # Ayni gun uzerinde gezinirken metin yeniden olusturulmaz; yalnizca etiket konumu izlenir.
+            self.hover_label.setPos(x, view_range[1][1])
+            return
+        self._hover_x = nearest_x
         self.v_line.setPos(nearest_x)
         self.v_line.show()
         point_date = datetime.fromtimestamp(nearest_x).strftime("%d/%m/%Y")
@@ -426,48 +515,65 @@ class AnalysisChartEngine(QWidget):
         if len(nearest) > 6:
             rows.append(f"+{len(nearest) - 6} seri")
         self.hover_label.setText("\n".join(rows))
-        view_range = self.plot_widget.getPlotItem().vb.viewRange()
         self.hover_label.setPos(x, view_range[1][1])
         self.hover_label.show()
 
+    def _hide_hover(self) -> None:
+        self._hover_x = None
+        self.v_line.hide()
+        self.hover_label.hide()
+
     def _nearest_points(self, x: float) -> List[Tuple[str, float, float]]:
         result = []
         for series in self._prepared_series:
-            if not series.x_values:
+            if not series.x_values.size:
                 continue
-            idx = min(range(len(series.x_values)), key=lambda i: abs(series.x_values[i] - x))
-            result.append((series.label, series.x_values[idx], series.y_values[idx]))
+            # x degerleri artan sirali; en yakin nokta ikili arama ile bulunur.
+            idx = int(np.searchsorted(series.x_values, x))
+            if idx >= series.x_values.size:
+                idx = series.x_values.size - 1
+            elif idx > 0 and x - series.x_values[idx - 1] <= series.x_values[idx] - x:
+                idx -= 1
+            result.append((series.label, float(series.x_values[idx]), float(series.y_values[idx])))
         result.sort(key=lambda item: abs(item[1] - x))
         return result
 
     def _clear_legend(self) -> None:
+        # Etiketler silinmez; bir sonraki cizimde yeniden kullanilmak uzere havuza alinir.
         while self.legend_layout.count():
             item = self.legend_layout.takeAt(0)
             widget = item.widget()
             if widget is not None:
-                widget.deleteLater()
+                widget.hide()
+                self._legend_label_pool.append(widget)
 
     def _add_legend_row(self, series: PreparedSeries) -> None:
-        start = series.y_values[0]
-        end = series.y_values[-1]
+        start = float(series.y_values[0])
+        end = float(series.y_values[-1])
         change = ((end - start) / start) * 100 if start else 0.0
         text = f"{series.label}\n{end:.2f}  ({change:+.1f}%)"
         self._add_legend_label(text, series.color, primary=series.is_primary)
 
     def _add_legend_label(self, text: str, color: str, primary: bool = False) -> None:
-        label = QLabel()
-        label.setWordWrap(True)
-        label.setStyleSheet(
+        if self._legend_label_pool:
+            label = self._legend_label_pool.popleft()
+        else:
+            label = QLabel()
+            label.setWordWrap(True)
+        style = (
             f"color: {TEXT_PRIMARY if primary else TEXT_SECONDARY};"
             f"font-weight: {'700' if primary else '500'};"
             "background: transparent;"
             "border: none;"
             f"font-size: {'13px' if primary else '12px'};"
         )
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
         label.setProperty("seriesColor", color)
         label.setText(f"<span style='color:{color};'>■</span> {text.replace(chr(10), '<br>')}")
         self.legend_layout.addWidget(label)
+        label.show()
 
     @staticmethod
     def _date_to_x(point_date: date) -> float:
-        return datetime.combine(point_date, time.min).timestamp()
+        return _date_to_timestamp(point_date)
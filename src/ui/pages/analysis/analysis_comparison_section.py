@@ -23,6 +23,7 @@ class AnalysisComparisonSection(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._dto: ComparisonViewDTO | None = None
+        self._relative_gap_map: Dict[str, Dict[date, float]] | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -76,6 +77,9 @@ class AnalysisComparisonSection(QWidget):
 
     def set_data(self, dto: ComparisonViewDTO) -> None:
         self._dto = dto
+        # Hazirlanmis seriler DTO basina tutulur; mod degisimleri yeniden hesaplama yapmaz.
+        self._relative_gap_map = None
+        self.chart_engine.clear_series_cache()
         if dto.warnings:
             self.warning_banner.setText(" | ".join(dto.warnings))
             self.warning_banner.show()
@@ -153,23 +157,29 @@ class AnalysisComparisonSection(QWidget):
                 baseline=100,
             )
         else:
-            series_map = {}
-            for benchmark in self._dto.benchmark_series:
-                aligned = self._build_relative_gap_series(self._dto.portfolio_series, benchmark.points)
-                if aligned:
-                    series_map[f"{self._dto.current_portfolio_label} - {benchmark.label}"] = aligned
-            for portfolio in self._dto.comparison_portfolios:
-                aligned = self._build_relative_gap_series(self._dto.portfolio_series, portfolio.points)
-                if aligned:
-                    series_map[f"{self._dto.current_portfolio_label} - {portfolio.label}"] = aligned
             self.chart_engine.draw_line_series(
                 title="Göreli Fark Karşılaştırması",
                 y_label="Fark (%)",
-                series_map=series_map,
+                series_map=self._get_relative_gap_map(),
                 normalize=False,
                 baseline=0,
             )
 
+    def _get_relative_gap_map(self) -> Dict[str, Dict[date, float]]:
+        if self._relative_gap_map is not None:
+            return self._relative_gap_map
+        series_map: Dict[str, Dict[date, float]] = {}
+        for benchmark in self._dto.benchmark_series:
+            aligned = self._build_relative_gap_series(self._dto.portfolio_series, benchmark.points)
+            if aligned:
+                series_map[f"{self._dto.current_portfolio_label} - {benchmark.label}"] = aligned
+        for portfolio in self._dto.comparison_portfolios:
+            aligned = self._build_relative_gap_series(self._dto.portfolio_series, portfolio.points)
+            if aligned:
+                series_map[f"{self._dto.current_portfolio_label} - {portfolio.label}"] = aligned
+        self._relative_gap_map = series_map
+        return series_map
+
     def _build_relative_gap_series(
         self,
         portfolio_series: Dict[date, Decimal],
@@ -33,6 +33,7 @@ class AnalysisControlPanel(QFrame):
         self.setMinimumHeight(0)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
         self._earliest_date = date.today() - timedelta(days=365)
+        self._stock_items: List[tuple[str, str]] = []
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -159,9 +160,11 @@ class AnalysisControlPanel(QFrame):
 
     def set_stocks(self, stock_map: Dict[int, str]) -> None:
         items = [(ticker, str(stock_id)) for stock_id, ticker in sorted(stock_map.items(), key=lambda item: item[1])]
-        current_selected = [str(stock_id) for stock_id in self.selected_stock_ids()]
+        # Liste degismediyse model ve secim oldugu gibi kalir; set_items korunan satirlarin secimini zaten tasir.
+        if items == self._stock_items:
+            return
+        self._stock_items = items
         self.stock_combo.set_items(items)
-        self.stock_combo.set_selected_data(current_selected)
 
     def set_benchmarks(self, definitions: List[BenchmarkDefinition]) -> None:
         self.benchmark_chips.set_benchmarks(definitions)
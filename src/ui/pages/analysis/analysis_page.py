@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from datetime import date, timedelta
 
-from PyQt5.QtCore import QSize, Qt, QThreadPool
+from PyQt5.QtCore import QSize, Qt, QThreadPool, QTimer
 from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -29,6 +29,8 @@ from .analysis_risk_section import AnalysisRiskSection
 
 logger = logging.getLogger(__name__)
 
+FILTER_DEBOUNCE_MS = 150
+
 
 class AnalysisPage(BasePage):
     def __init__(self, container, parent=None):
@@ -38,6 +40,15 @@ class AnalysisPage(BasePage):
         self.analysis_service = container.analysis_service
         self.threadpool = QThreadPool()
         self._request_seq = 0
+        self._context_seq = 0
+        self._context_pending = False
+        self._context_source = "dashboard"
+        self._payload_in_flight = False
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._request_refresh)
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -75,7 +86,7 @@ class AnalysisPage(BasePage):
         self.btn_refresh = QPushButton("Analizi Yenile")
         self.btn_refresh.setProperty("cssClass", "secondaryButton")
         self.btn_refresh.setIcon(IconManager.get_icon("refresh-cw", color="@COLOR_TEXT_PRIMARY"))
-        self.btn_refresh.clicked.connect(self.refresh_data)
+        self.btn_refresh.clicked.connect(self._on_refresh_clicked)
         header_layout.addWidget(self.btn_refresh)
         left_layout.addLayout(header_layout)
 
@@ -104,7 +115,7 @@ class AnalysisPage(BasePage):
         content_layout.addWidget(left_container, 1)
 
         self.control_panel = AnalysisControlPanel()
-        self.control_panel.filter_changed.connect(self._request_refresh)
+        self.control_panel.filter_changed.connect(self._schedule_refresh)
         self.control_panel.source_changed.connect(self._on_source_changed)
 
         panel_min_width = self.control_panel.minimumWidth() + 20
@@ -165,23 +176,52 @@ class AnalysisPage(BasePage):
             self.btn_refresh.setIcon(IconManager.get_icon("refresh-cw", color="@COLOR_TEXT_PRIMARY"))
         super().changeEvent(event)
 
+    def _on_refresh_clicked(self) -> None:
+        self.analysis_service.invalidate_caches()
+        self.refresh_data()
+
     def refresh_data(self):
         self._load_static_options()
         self._sync_source_context()
-        self._request_refresh()
 
     def _load_static_options(self) -> None:
-        options = self.analysis_service.get_portfolio_options()
-        self.control_panel.set_portfolio_options(options)
-        self.control_panel.set_comparison_portfolios(options)
+        # Portfoy secenekleri DB'den okunur; kaynak bilgisiyle birlikte arka planda gelir.
         self.control_panel.set_benchmarks(self.analysis_service.get_benchmark_definitions())
 
     def _sync_source_context(self) -> None:
+        # Kaynaga ait hisse/tarih bilgisi arka planda okunur; analiz istegi bu bilgi gelince atilir.
         source = self.control_panel.selected_portfolio_source() or "dashboard"
-        self.control_panel.set_stocks(self.analysis_service.get_stock_map_for_source(source))
-        earliest = self.analysis_service.get_first_trade_date_for_source(source) or (date.today() - timedelta(days=365))
+        self._context_seq += 1
+        context_id = self._context_seq
+        self._context_pending = True
+        self._context_source = source
+
+        worker = Worker(self.analysis_service.get_source_context, source)
+        worker.signals.result.connect(lambda result, cid=context_id: self._on_source_context_ready(cid, result))
+        worker.signals.error.connect(lambda err, cid=context_id: self._on_source_context_error(cid, err))
+        self.threadpool.start(worker)
+
+    def _on_source_context_ready(self, context_id: int, context: dict) -> None:
+        if context_id != self._context_seq:
+            return
+        self.control_panel.set_portfolio_options(context["portfolio_options"])
+        if (self.control_panel.selected_portfolio_source() or "dashboard") != self._context_source:
+            # Secili kaynak secenekler yenilenirken degistiyse baglam yeniden okunur.
+            self._sync_source_context()
+            return
+        self._context_pending = False
+        self.control_panel.set_stocks(context["stock_map"])
+        earliest = context["first_trade_date"] or (date.today() - timedelta(days=365))
         self.control_panel.set_earliest_date(earliest)
-        self.control_panel.set_comparison_portfolios(self.analysis_service.get_portfolio_options())
+        self.control_panel.set_comparison_portfolios(context["portfolio_options"])
+        self._request_refresh()
+
+    def _on_source_context_error(self, context_id: int, err_tuple) -> None:
+        if context_id != self._context_seq:
+            return
+        self._context_pending = False
+        logger.error("Analiz kaynak bilgisi y\u00fcklenemedi: %s", err_tuple[1])
+        self._request_refresh()
 
     def _on_source_changed(self, _source: str) -> None:
         self._sync_source_context()
@@ -197,14 +237,27 @@ class AnalysisPage(BasePage):
             comparison_portfolio_sources=self.control_panel.selected_comparison_sources(),
         )
 
-    def _request_refresh(self) -> None:
+    def _schedule_refresh(self) -> None:
+        # Art arda gelen secim/tarih degisiklikleri tek bir analiz istegine indirgenir.
+        self._refresh_timer.start()
+
+    def _request_refresh(self) -> bool:
+        """Yeni bir analiz worker'i baslatildiysa True doner."""
+        self._refresh_timer.stop()
+        if self._context_pending:
+            return False
+        if self._payload_in_flight:
+            # Calisan istek bitince guncel filtrelerle tek bir istek daha atilir.
+            self._refresh_pending = True
+            return False
         filter_state = self._build_filter_state()
         if filter_state.start_date > filter_state.end_date:
             self._render_error("Ba\u015flang\u0131\u00e7 tarihi biti\u015f tarihinden sonra olamaz.")
-            return
+            return False
 
         self._request_seq += 1
         request_id = self._request_seq
+        self._payload_in_flight = True
         self._set_loading(True)
 
         worker = Worker(self.analysis_service.get_page_payload, filter_state)
@@ -212,9 +265,10 @@ class AnalysisPage(BasePage):
         worker.signals.error.connect(lambda err, rid=request_id: self._on_payload_error(rid, err))
         worker.signals.finished.connect(lambda rid=request_id: self._on_payload_finished(rid))
         self.threadpool.start(worker)
+        return True
 
     def _on_payload_ready(self, request_id: int, payload: dict) -> None:
-        if request_id != self._request_seq:
+        if request_id != self._request_seq or self._refresh_pending:
             return
         self.warning_banner.hide()
         self.overview_section.set_data(payload["overview"])
@@ -222,7 +276,7 @@ class AnalysisPage(BasePage):
         self.risk_section.set_data(payload["risk"])
 
     def _on_payload_error(self, request_id: int, err_tuple) -> None:
-        if request_id != self._request_seq:
+        if request_id != self._request_seq or self._refresh_pending:
             return
         logger.error("Analiz y\u00fcklenemedi: %s", err_tuple[1], exc_info=True)
         self._render_error(str(err_tuple[1]))
@@ -230,6 +284,11 @@ class AnalysisPage(BasePage):
     def _on_payload_finished(self, request_id: int) -> None:
         if request_id != self._request_seq:
             return
+        self._payload_in_flight = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            if self._request_refresh():
+                return
         self._set_loading(False)
 
     def _render_error(self, message: str) -> None:
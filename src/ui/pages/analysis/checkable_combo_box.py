@@ -14,6 +14,7 @@ class CheckableComboBox(QComboBox):
         super().__init__(parent)
         self._placeholder = placeholder
         self._popup_is_open = False
+        self._syncing_items = False
 
         self.setProperty("cssClass", "customComboBox")
         self.setEditable(True)
@@ -52,20 +53,43 @@ class CheckableComboBox(QComboBox):
         return self._popup_view
 
     def set_items(self, items: List[tuple[str, str]]) -> None:
-        selected = set(self.selected_data())
+        # Mevcut satirlar korunur; yalnizca kaybolan/yeni degerler ve sira farklari uygulanir.
         model: QStandardItemModel = self.model()
-        model.blockSignals(True)
-        model.clear()
-        for label, value in items:
-            item = QStandardItem(label)
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
-            item.setData(value, Qt.UserRole)
-            item.setData(Qt.Checked if value in selected else Qt.Unchecked, Qt.CheckStateRole)
-            model.appendRow(item)
-        model.blockSignals(False)
+        existing = {model.item(row).data(Qt.UserRole): model.item(row) for row in range(model.rowCount())}
+        desired_values = {value for _, value in items}
+
+        self._syncing_items = True
+        try:
+            for row in reversed(range(model.rowCount())):
+                if model.item(row).data(Qt.UserRole) not in desired_values:
+                    model.removeRow(row)
+            for position, (label, value) in enumerate(items):
+                current = model.item(position)
+                if current is not None and current.data(Qt.UserRole) == value:
+                    if current.text() != label:
+                        current.setText(label)
+                    continue
+                item = existing.get(value)
+                if item is not None:
+                    model.takeRow(item.row())
+                    if item.text() != label:
+                        item.setText(label)
+                else:
+                    item = self._create_item(label, value)
+                model.insertRow(position, item)
+        finally:
+            self._syncing_items = False
         self._update_text()
         self._update_popup_geometry()
 
+    @staticmethod
+    def _create_item(label: str, value: str) -> QStandardItem:
+        item = QStandardItem(label)
+        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+        item.setData(value, Qt.UserRole)
+        item.setData(Qt.Unchecked, Qt.CheckStateRole)
+        return item
+
     def selected_data(self) -> List[str]:
         model: QStandardItemModel = self.model()
         values: List[str] = []
@@ -142,6 +166,8 @@ class CheckableComboBox(QComboBox):
             self.showPopup()
 
     def _on_item_changed(self, _item) -> None:
+        if self._syncing_items:
+            return
         self._update_text()
         self.selection_changed.emit()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -19,12 +20,17 @@ logger = logging.getLogger(__name__)
 
 
 class DashboardActions:
+    EXPORT_MODE = ExportMode.OVERWRITE
+
     def __init__(self, page, presenter) -> None:
         self._page = page
         self._presenter = presenter
+        self._capital_dialog = None
+        # Son secilen rapor klasoru; dosya diyalogu her seferinde calisma dizininden baslamaz.
+        self._last_export_dir = ""
 
     def on_capital_management(self) -> None:
-        dialog = self._page.capital_dialog_cls(self._page._capital, self._page)
+        dialog = self._get_capital_dialog()
         if dialog.exec_() != QDialog.Accepted:
             return
         result = dialog.get_result()
@@ -43,7 +49,15 @@ class DashboardActions:
             self._page._capital -= amount
             QMessageBox.information(self._page, "Basarili", f"{amount:,.2f} TL sermaye cekildi.")
 
-        self._presenter.refresh_data()
+        self._page.refresh_data()
+
+    def _get_capital_dialog(self):
+        # Diyalog ilk acilista kurulur; sonraki acilislarda widget agaci ve stiller yeniden olusturulmaz.
+        if self._capital_dialog is None:
+            self._capital_dialog = self._page.capital_dialog_cls(self._page._capital, self._page)
+        else:
+            self._capital_dialog.set_current_capital(self._page._capital)
+        return self._capital_dialog
 
     def on_new_trade(self) -> None:
         dialog = self._page.new_trade_dialog_cls(
@@ -72,7 +86,10 @@ class DashboardActions:
                 self._page._capital = max(Decimal("0"), self._page._capital - trade_amount)
             else:
                 self._page._capital += trade_amount
-            self._presenter.refresh_data()
+            # Mevcut hisseye eklenen islemde yalnizca ilgili satir guncellenir; aksi halde tam yenileme.
+            if not self._presenter.apply_new_trade(result):
+                self._presenter.invalidate_data()
+                self._page.refresh_data()
             QMessageBox.information(self._page, "Basarili", "Islem basariyla eklendi.")
             self._page._last_trade_result = result
         except ValueError as exc:
@@ -104,8 +121,9 @@ class DashboardActions:
         self._page.btn_update_prices.setText(" Fiyatlari Guncelle")
 
     def on_update_prices_success(self, result) -> None:
-        price_update_result, _snapshot = result
-        self._presenter.refresh_data()
+        price_update_result, snapshot = result
+        self._presenter.invalidate_data()
+        self._page.refresh_data(snapshot)
         self._presenter.update_returns()
         if price_update_result.updated_count <= 0:
             Toast.warning(
@@ -126,33 +144,19 @@ class DashboardActions:
         QMessageBox.critical(self._page, "Hata", f"Hata:\n{err_tuple[1]}")
 
     def on_export_today(self) -> None:
-        first_date = self._page.portfolio_service.get_first_trade_date()
+        first_date = self._presenter.get_first_trade_date()
         if first_date is None:
             QMessageBox.information(self._page, "Bilgi", "Herhangi bir islem bulunamadi.")
             return
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self._page,
-            "Excel Dosyasi Sec",
-            "portfoy_takip.xlsx",
-            "Excel Dosyalari (*.xlsx)",
-        )
+        file_path = self._ask_export_path("Excel Dosyasi Sec")
         if not file_path:
             return
 
-        try:
-            self._page.excel_export_service.export_history(
-                start_date=first_date,
-                end_date=date.today(),
-                file_path=file_path,
-                mode=ExportMode.OVERWRITE,
-            )
-            QMessageBox.information(self._page, "Basarili", "Excel aktarimi tamamlandi.")
-        except Exception as exc:
-            QMessageBox.critical(self._page, "Hata", f"Excel hatasi: {exc}")
+        self._start_export(first_date, date.today(), file_path, "Excel hatasi")
 
     def on_export_range(self) -> None:
-        first_date = self._page.portfolio_service.get_first_trade_date()
+        first_date = self._presenter.get_first_trade_date()
         if first_date is None:
             QMessageBox.information(self._page, "Bilgi", "Islem bulunamadi.")
             return
@@ -166,25 +170,45 @@ class DashboardActions:
             return
         start_date, end_date = result
 
+        file_path = self._ask_export_path("Excel Sec")
+        if not file_path:
+            return
+
+        self._start_export(start_date, end_date, file_path, "Hata")
+
+    def _ask_export_path(self, title: str) -> str:
         file_path, _ = QFileDialog.getSaveFileName(
             self._page,
-            "Excel Sec",
-            "portfoy_takip.xlsx",
+            title,
+            os.path.join(self._last_export_dir, "portfoy_takip.xlsx"),
             "Excel Dosyalari (*.xlsx)",
         )
-        if not file_path:
-            return
+        if file_path:
+            self._last_export_dir = os.path.dirname(file_path)
+        return file_path
+
+    def _start_export(self, start_date: date, end_date: date, file_path: str, error_title: str) -> None:
+        # Excel yazimi arka planda yapilir; bitene kadar rapor butonlari kapali kalir.
+        self._set_export_buttons_enabled(False)
+        worker = Worker(
+            self._page.excel_export_service.export_history,
+            start_date=start_date,
+            end_date=end_date,
+            file_path=file_path,
+            mode=self.EXPORT_MODE,
+        )
+        worker.signals.result.connect(
+            lambda _: QMessageBox.information(self._page, "Basarili", "Excel aktarimi tamamlandi.")
+        )
+        worker.signals.error.connect(
+            lambda err: QMessageBox.critical(self._page, "Hata", f"{error_title}: {err[1]}")
+        )
+        worker.signals.finished.connect(lambda: self._set_export_buttons_enabled(True))
+        self._page.threadpool.start(worker)
 
-        try:
-            self._page.excel_export_service.export_history(
-                start_date=start_date,
-                end_date=end_date,
-                file_path=file_path,
-                mode=ExportMode.OVERWRITE,
-            )
-            QMessageBox.information(self._page, "Basarili", "Excel aktarimi tamamlandi.")
-        except Exception as exc:
-            QMessageBox.critical(self._page, "Hata", f"Hata: {exc}")
+    def _set_export_buttons_enabled(self, enabled: bool) -> None:
+        self._page.btn_export_today.setEnabled(enabled)
+        self._page.btn_export_range.setEnabled(enabled)
 
     # ══════════════════════════════════════════════════════════
     #  SERMAYE ARTIRIMI (sağ-tık context menüden tetiklenir)
@@ -204,12 +228,14 @@ class DashboardActions:
         except IndexError:
             return
 
-        stock = self._page.stock_repo.get_stock_by_id(position.stock_id)
-        if stock is None:
-            QMessageBox.warning(self._page, "Hata", "Hisse bilgisi bulunamadı.")
-            return
-
-        ticker = stock.ticker
+        # Ticker, tablonun zaten tuttugu eslemeden okunur; yalnizca eksikse DB'ye gidilir.
+        ticker = self._page.portfolio_model.get_ticker(position.stock_id)
+        if ticker is None:
+            stock = self._page.stock_repo.get_stock_by_id(position.stock_id)
+            if stock is None:
+                QMessageBox.warning(self._page, "Hata", "Hisse bilgisi bulunamadı.")
+                return
+            ticker = stock.ticker
         price_map = getattr(self._page.portfolio_model, "_price_map", {}) if self._page.portfolio_model else {}
         current_price = price_map.get(position.stock_id)
 
@@ -279,7 +305,7 @@ class DashboardActions:
         adjusted fiyatlar verir; daily_prices tablosundaki eski fiyatlar
         upsert ile doğru değerlere güncellenir.
         """
-        first_date = self._page.portfolio_service.get_first_trade_date()
+        first_date = self._presenter.get_first_trade_date()
         if first_date is None:
             first_date = date.today() - timedelta(days=365)
 
@@ -303,7 +329,8 @@ class DashboardActions:
         ca_result_ref = ca_result
 
         def _on_success(updated_count: int):
-            self._presenter.refresh_data()
+            self._presenter.invalidate_data()
+            self._page.refresh_data()
             # Adjusted fiyatlar artık DB'de; getiri kartını doğru değerle güncelle
             self._presenter.update_returns()
             type_label = "Bedelsiz" if ca_result_ref.action_type == ActionType.BEDELSIZ else "Bedelli"
@@ -318,7 +345,8 @@ class DashboardActions:
 
         def _on_error(err_tuple):
             # Fiyat güncelleme başarısız olsa da pozisyon zaten güncellendi
-            self._presenter.refresh_data()
+            self._presenter.invalidate_data()
+            self._page.refresh_data()
             type_label = "Bedelsiz" if ca_result_ref.action_type == ActionType.BEDELSIZ else "Bedelli"
             QMessageBox.warning(
                 self._page,
@@ -344,11 +372,18 @@ class DashboardActions:
         if reply != QMessageBox.Yes:
             return
 
-        try:
-            self._page.reset_service.reset_all()
-            self._page._capital = Decimal("0")
-            self._presenter.refresh_data()
-            self._page.summary_cards.update_returns(None, None)
-            QMessageBox.information(self._page, "Tamamlandi", "Basariyla sifirlandi.")
-        except Exception as exc:
-            QMessageBox.critical(self._page, "Hata", f"Hata: {exc}")
+        # Toplu silme arka planda calisir; arayuz sonuc gelene kadar donmaz.
+        worker = Worker(self._page.reset_service.reset_all)
+        worker.signals.result.connect(lambda _: self._on_reset_success())
+        worker.signals.error.connect(
+            lambda err: QMessageBox.critical(self._page, "Hata", f"Hata: {err[1]}")
+        )
+        self._page.threadpool.start(worker)
+
+    def _on_reset_success(self) -> None:
+        self._page._capital = Decimal("0")
+        self._presenter.show_empty_portfolio()
+        # Model portfoyler de silindi; dinleyen sayfalar listelerini yeniler.
+        if getattr(self._page.container, "event_bus", None):
+            self._page.container.event_bus.portfolio_changed.emit()
+        QMessageBox.information(self._page, "Tamamlandi", "Basariyla sifirlandi.")
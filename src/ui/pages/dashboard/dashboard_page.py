@@ -56,6 +56,13 @@ class DashboardPage(BasePage):
         self._settings = QSettings("PortfoySimulasyonu", "PortfoySimulasyonu")
         self._last_update_toast_shown_for = None
 
+        # Ayni olay dongusu turundaki art arda yenileme istekleri tek hesaplamada birlestirilir.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_now)
+        self._pending_snapshot = None
+
         self._presenter = DashboardPresenter(self)
         self._actions = DashboardActions(self, self._presenter)
 
@@ -151,6 +158,8 @@ class DashboardPage(BasePage):
 
     def on_page_enter(self):
         self._presenter.load_capital()
+        # Diger sayfalarda islem/fiyat degismis olabilir; ayni gunun snapshot'i yeniden hesaplanir.
+        self._presenter.invalidate_data()
         self.refresh_data()
 
         # Kayıtlı son değeri anında göster; sonra DB'den taze hesapla
@@ -162,8 +171,15 @@ class DashboardPage(BasePage):
         self._sync_last_update_label()
         QTimer.singleShot(0, self.show_last_update_toast_once)
 
-    def refresh_data(self):
-        self._presenter.refresh_data()
+    def refresh_data(self, snapshot=None):
+        # Cagiran taraf bugunun snapshot'ini zaten hesapladiysa birlestirilmis yenilemede yeniden kullanilir.
+        if snapshot is not None:
+            self._pending_snapshot = snapshot
+        self._refresh_timer.start()
+
+    def _refresh_now(self):
+        snapshot, self._pending_snapshot = self._pending_snapshot, None
+        self._presenter.refresh_data(snapshot)
 
     def record_last_update_time(self, updated_at=None):
         from datetime import datetime
@@ -239,8 +255,11 @@ class DashboardPage(BasePage):
             return
 
         position = self.portfolio_model.get_position(row)
-        stock = self.stock_repo.get_stock_by_id(position.stock_id)
-        ticker = stock.ticker if stock else None
+        # Ticker, refresh_data sirasinda kurulan eslemeden okunur; cift tiklamada DB'ye gidilmez.
+        ticker = self.portfolio_model.get_ticker(position.stock_id)
+        if ticker is None:
+            stock = self.stock_repo.get_stock_by_id(position.stock_id)
+            ticker = stock.ticker if stock else None
 
         main_window = self.window()
         if hasattr(main_window, "show_stock_detail"):
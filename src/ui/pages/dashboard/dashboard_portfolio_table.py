@@ -1,12 +1,19 @@
 # src/ui/pages/dashboard/dashboard_portfolio_table.py
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView, QTableWidget, QTableWidgetItem, QMenu, QAction
-from PyQt5.QtCore import Qt, QModelIndex, QPoint, pyqtSignal
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QModelIndex, QPoint, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontMetrics
 from decimal import Decimal
 
 from src.ui.widgets.dashboard import PortfolioRowDelegate
 
+# tables.qss'teki QHeaderView::section ayarlariyla ayni: 15px kalin yazi, 10px 8px dolgu, 2px alt cizgi.
+HEADER_FONT_PX = 15
+HEADER_PADDING_H = 8
+HEADER_PADDING_V = 10
+HEADER_BORDER = 2
+SORT_INDICATOR_SPACE = 16
+
 class DashboardPortfolioTable(QWidget):
     """Portföy tablosu ve altındaki toplam özet satırını yöneten bileşen."""
 
@@ -31,6 +38,9 @@ class DashboardPortfolioTable(QWidget):
         self.table_view.setSortingEnabled(True)
         self.table_view.verticalHeader().setVisible(False)
         self.table_view.verticalHeader().setDefaultSectionSize(40)
+        # Satir yukseklikleri sabit, hucre metni tek satir: boyama sirasinda icerikten olcu hesaplanmaz.
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.setWordWrap(False)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_view.setShowGrid(False)
         self.table_view.doubleClicked.connect(self.row_double_clicked.emit)
@@ -57,6 +67,15 @@ class DashboardPortfolioTable(QWidget):
         self.table_summary.setProperty("cssClass", "tableSummary")
         layout.addWidget(self.table_summary)
 
+        # Ozet hucreleri bir kez olusturulur; yenilemede yalnizca metin ve gerekirse renk degisir.
+        for col in range(7):
+            item = QTableWidgetItem("TOPLAM" if col == 0 else "")
+            item.setTextAlignment(Qt.AlignCenter)
+            self.table_summary.setItem(0, col, item)
+        self._summary_value_item = self.table_summary.item(0, 5)
+        self._summary_pl_item = self.table_summary.item(0, 6)
+        self._summary_pl_color = None
+
     def _on_context_menu_requested(self, pos: QPoint):
         index = self.table_view.indexAt(pos)
         if not index.isValid():
@@ -78,31 +97,49 @@ class DashboardPortfolioTable(QWidget):
 
     def set_model(self, model):
         self.model = model
+        self.model.set_header_size_hints(self._build_header_size_hints(model))
         self.table_view.setModel(self.model)
 
+    def _build_header_size_hints(self, model):
+        """Baslik boyutlarini yalnizca baslik metinlerinden, satir verisine bakmadan bir kez hesaplar."""
+        font = QFont(self.table_view.horizontalHeader().font())
+        font.setPixelSize(HEADER_FONT_PX)
+        font.setBold(True)
+        metrics = QFontMetrics(font)
+        height = metrics.height() + 2 * HEADER_PADDING_V + HEADER_BORDER
+        hints = {}
+        for section in range(model.columnCount()):
+            title = str(model.headerData(section, Qt.Horizontal, Qt.DisplayRole))
+            width = metrics.horizontalAdvance(title) + 2 * HEADER_PADDING_H + SORT_INDICATOR_SPACE
+            hints[section] = QSize(width, height)
+        return hints
+
+    def update_model_data(self, positions, price_map, ticker_map):
+        """Model verisini siralama kapaliyken yeniler; siralama gostergesi korunur."""
+        header = self.table_view.horizontalHeader()
+        sort_section = header.sortIndicatorSection()
+        sort_order = header.sortIndicatorOrder()
+        # Veri degisimi ve siralama geri yuklemesi tek boyamada gorunur.
+        self.table_view.setUpdatesEnabled(False)
+        self.table_view.setSortingEnabled(False)
+        try:
+            self.model.update_data(positions, price_map, ticker_map)
+        finally:
+            header.setSortIndicator(sort_section, sort_order)
+            self.table_view.setSortingEnabled(True)
+            self.table_view.setUpdatesEnabled(True)
+
     def update_summary_row(self, total_value: Decimal, profit_loss: Decimal):
         """Alt kısımdaki toplam özet satırını günceller."""
-        for col in range(7):
-            item = QTableWidgetItem("")
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table_summary.setItem(0, col, item)
-            
-        item_title = QTableWidgetItem("TOPLAM")
-        item_title.setTextAlignment(Qt.AlignCenter)
-        self.table_summary.setItem(0, 0, item_title)
-        
-        item_mv = QTableWidgetItem(f"{total_value:,.2f}")
-        item_mv.setTextAlignment(Qt.AlignCenter)
-        self.table_summary.setItem(0, 5, item_mv)
-        
-        item_pl = QTableWidgetItem(f"{profit_loss:+,.2f}")
-        item_pl.setTextAlignment(Qt.AlignCenter)
-        
+        self._summary_value_item.setText(f"{total_value:,.2f}")
+        self._summary_pl_item.setText(f"{profit_loss:+,.2f}")
+
         if profit_loss > 0:
-            item_pl.setForeground(QColor("#22c55e"))
+            color = "#22c55e"
         elif profit_loss < 0:
-            item_pl.setForeground(QColor("#ef4444"))
+            color = "#ef4444"
         else:
-            item_pl.setForeground(QColor("#f1f5f9"))
-            
-        self.table_summary.setItem(0, 6, item_pl)
+            color = "#f1f5f9"
+        if color != self._summary_pl_color:
+            self._summary_pl_item.setForeground(QColor(color))
+            self._summary_pl_color = color
@@ -1,38 +1,69 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from datetime import date
+from operator import attrgetter
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.domain.models.portfolio import Portfolio
 from src.domain.models.position import Position
 from src.ui.portfolio_table_model import PortfolioTableModel
+from src.ui.worker import Worker
 
 logger = logging.getLogger(__name__)
 
+ZERO = Decimal("0")
+_stock_id_of = attrgetter("stock_id")
+
 
 class DashboardPresenter:
+    MAX_CACHED_SNAPSHOTS = 4
+
     def __init__(self, page) -> None:
         self._page = page
+        # Islem/fiyat degismedikce ayni gunun snapshot'i yeniden hesaplanmaz; anahtar (gun, veri surumu).
+        self._data_version = 0
+        self._snapshot_cache: OrderedDict[tuple[date, int], object] = OrderedDict()
+        self._first_trade_date_cache: Optional[tuple[int, Optional[date]]] = None
+        # Pozisyonlar yalnizca refresh_data ile degisir; fiyat olaylarinda maliyet toplami yeniden hesaplanmaz.
+        self._total_cost = ZERO
+        self._returns_seq = 0
+        # Hisse kumesi degismedikce ticker eslemesi DB'den yeniden okunmaz.
+        self._ticker_cache: tuple[frozenset, Dict[int, str]] = (frozenset(), {})
+        # Ticker'lar hisse bazinda degismez; kume degistiginde yalnizca yeni hisseler DB'den okunur.
+        self._known_tickers: Dict[int, str] = {}
 
     def load_capital(self) -> None:
         try:
             self._page._capital = self._page.portfolio_service.calculate_capital()
         except Exception as exc:
             logger.error("Sermaye yuklenemedi: %s", exc, exc_info=True)
-            self._page._capital = Decimal("0")
+            self._page._capital = ZERO
 
-    def refresh_data(self) -> None:
+    def refresh_data(self, snapshot=None) -> None:
         portfolio: Portfolio = self._page.portfolio_service.get_current_portfolio()
         today = date.today()
-        snapshot = self._page.return_calc_service.compute_portfolio_value_on(today)
-
-        all_positions: List[Position] = list(portfolio.positions.values())
-        positions: List[Position] = [position for position in all_positions if position.total_quantity != 0]
+        key = (today, self._data_version)
+        if snapshot is None or snapshot.as_of_date != today:
+            snapshot = self._snapshot_cache.get(key)
+            if snapshot is None:
+                snapshot = self._page.return_calc_service.compute_portfolio_value_on(today)
+        self._remember_snapshot(key, snapshot)
+
+        # Acik pozisyonlar, hisse id'leri ve toplam maliyet tek geciste toplanir.
+        positions: List[Position] = []
+        stock_ids: List[int] = []
+        total_cost = ZERO
+        append_position, append_stock_id = positions.append, stock_ids.append
+        for position in portfolio.positions.values():
+            if position.total_quantity:
+                append_position(position)
+                append_stock_id(position.stock_id)
+                total_cost += position.total_cost
         price_map: Dict[int, Decimal] = snapshot.price_map if snapshot else {}
-        stock_ids = [position.stock_id for position in positions]
-        ticker_map = self._page.stock_repo.get_ticker_map_for_stock_ids(stock_ids)
+        ticker_map = self._get_ticker_map(stock_ids)
 
         if self._page.portfolio_model is None:
             self._page.portfolio_model = PortfolioTableModel(
@@ -44,48 +75,130 @@ class DashboardPresenter:
             )
             self._page.portfolio_table_widget.set_model(self._page.portfolio_model)
         else:
-            current_ids = {position.stock_id for position in positions}
-            model_ids = {position.stock_id for position in self._page.portfolio_model._positions}
-            if len(positions) != self._page.portfolio_model.rowCount() or current_ids != model_ids:
-                self._page.portfolio_model.update_data(positions, price_map, ticker_map)
-
-        total_value = snapshot.total_value if snapshot else Decimal("0")
-        total_cost = sum(position.total_cost for position in positions)
+            current_ids = set(stock_ids)
+            model_ids = set(map(_stock_id_of, self._page.portfolio_model._positions))
+            if len(positions) != self._page.portfolio_model.position_count() or current_ids != model_ids:
+                self._page.portfolio_table_widget.update_model_data(positions, price_map, ticker_map)
+            else:
+                # Ayni hisseler: model sifirlanmaz, yalnizca degerler yenilenir.
+                self._page.portfolio_model.update_prices_only(price_map, positions)
+
+        total_value = snapshot.total_value if snapshot else ZERO
+        self._total_cost = total_cost
         profit_loss = total_value - total_cost
 
         self._page.summary_cards.update_base_metrics(total_value, total_cost, self._page._capital, profit_loss)
         self._page.portfolio_table_widget.update_summary_row(total_value, profit_loss)
 
+    def invalidate_data(self) -> None:
+        """Islem, fiyat veya portfoy degisikliginden sonra onbellekteki snapshot'lari gecersiz kilar."""
+        self._data_version += 1
+
+    def get_first_trade_date(self) -> Optional[date]:
+        # Disa aktarma ve kurumsal islem akislari ayni veri surumunde tarihi DB'den tekrar okumaz.
+        cached = self._first_trade_date_cache
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
+        first_date = self._page.portfolio_service.get_first_trade_date()
+        self._first_trade_date_cache = (self._data_version, first_date)
+        return first_date
+
+    def _remember_snapshot(self, key: tuple[date, int], snapshot) -> None:
+        if snapshot is None:
+            return
+        self._snapshot_cache[key] = snapshot
+        self._snapshot_cache.move_to_end(key)
+        while len(self._snapshot_cache) > self.MAX_CACHED_SNAPSHOTS:
+            self._snapshot_cache.popitem(last=False)
+
+    def show_empty_portfolio(self) -> None:
+        # Sifirlama sonrasi bos portfoy icin snapshot hesaplanmaz; gorunum dogrudan varsayilana cekilir.
+        self.invalidate_data()
+        self._returns_seq += 1
+        self._total_cost = ZERO
+        self._ticker_cache = (frozenset(), {})
+        self._known_tickers.clear()
+        if self._page.portfolio_model is not None:
+            self._page.portfolio_model.clear()
+        self._page.summary_cards.reset_to_defaults()
+        self._page.portfolio_table_widget.update_summary_row(ZERO, ZERO)
+
+    def _get_ticker_map(self, stock_ids: List[int]) -> Dict[int, str]:
+        key = frozenset(stock_ids)
+        cached_key, cached_map = self._ticker_cache
+        if key == cached_key and (cached_map or not key):
+            return cached_map
+        known = self._known_tickers
+        missing_ids = [stock_id for stock_id in stock_ids if stock_id not in known]
+        if missing_ids:
+            known.update(self._page.stock_repo.get_ticker_map_for_stock_ids(missing_ids))
+        ticker_map = {stock_id: known[stock_id] for stock_id in stock_ids if stock_id in known}
+        self._ticker_cache = (key, ticker_map)
+        return ticker_map
+
+    def apply_new_trade(self, result) -> bool:
+        """
+        Yeni islem tabloda zaten olan bir hisseye aitse yalnizca o satiri ve toplamlari gunceller.
+        Yeni hisse, kapanan pozisyon veya ileri tarihli islemde False doner; cagiran tam yenileme yapar.
+        """
+        model = self._page.portfolio_model
+        if model is None or result.trade.trade_date > date.today():
+            return False
+        stock_id = result.stock_id
+        old_position = next((position for position in model._positions if position.stock_id == stock_id), None)
+        if old_position is None:
+            return False
+
+        position = Position.from_trades(stock_id, self._page.portfolio_service.get_trades_for_stock(stock_id))
+        if position.total_quantity == 0 or not model.update_row_for_stock(stock_id, position):
+            return False
+
+        self.invalidate_data()
+        self._total_cost += position.total_cost - old_position.total_cost
+        self._update_totals_from_model()
+        return True
+
     def on_prices_updated_event(self, new_prices: Dict[int, Decimal]) -> None:
         if not self._page.portfolio_model or getattr(self._page, "_is_refreshing", False):
             return
 
+        self.invalidate_data()
+        self._update_totals_from_model()
+
+    def _update_totals_from_model(self) -> None:
         price_map = getattr(self._page.portfolio_model, "_price_map", {})
-        total_cost = Decimal("0")
-        total_value = Decimal("0")
+        total_cost = self._total_cost
+        total_value = ZERO
+        # Her fiyat olayinda calisan dongu: global/attribute aramalari yerel isimlere alinir.
+        get_price = price_map.get
         for position in self._page.portfolio_model._positions:
             if position.total_quantity <= 0:
                 continue
-            total_cost += position.total_cost
-            current_price = price_map.get(position.stock_id, Decimal("0"))
-            total_value += position.market_value(current_price)
+            total_value += position.market_value(get_price(position.stock_id, ZERO))
 
         profit_loss = total_value - total_cost
         self._page.summary_cards.update_base_metrics(total_value, total_cost, self._page._capital, profit_loss)
         self._page.portfolio_table_widget.update_summary_row(total_value, profit_loss)
 
     def update_returns(self) -> None:
-        today = date.today()
-        try:
-            weekly_rate, _, _ = self._page.return_calc_service.compute_weekly_return(today)
-            monthly_rate, _, _ = self._page.return_calc_service.compute_monthly_return(today)
-        except Exception as exc:
-            logger.error("Getiri hesaplama hatasi: %s", exc, exc_info=True)
-            return
-
+        # Haftalik/aylik getiri DB'den arka planda hesaplanir; kartlar sonuc gelince guncellenir.
+        self._returns_seq += 1
+        request_id = self._returns_seq
+        worker = Worker(self._compute_returns, date.today())
+        worker.signals.result.connect(lambda result, rid=request_id: self._on_returns_ready(rid, result))
+        worker.signals.error.connect(lambda err: logger.error("Getiri hesaplama hatasi: %s", err[1]))
+        self._page.threadpool.start(worker)
+
+    def _compute_returns(self, today: date) -> tuple[float | None, float | None]:
+        rates = self._page.return_calc_service.compute_period_returns(today, (7, 30))
+        weekly_rate, monthly_rate = rates[7], rates[30]
         weekly_pct = float(weekly_rate) * 100 if weekly_rate is not None else None
         monthly_pct = float(monthly_rate) * 100 if monthly_rate is not None else None
+        return weekly_pct, monthly_pct
 
+    def _on_returns_ready(self, request_id: int, result: tuple[float | None, float | None]) -> None:
+        if request_id != self._returns_seq:
+            return
+        weekly_pct, monthly_pct = result
         self._page._save_returns(weekly_pct, monthly_pct)
         self._page.summary_cards.update_returns(weekly_pct, monthly_pct)
-
@@ -8,6 +8,9 @@ class DashboardSummaryCards(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Son gosterilen degerler; ayni degerlerle gelen guncellemede bicimleme ve setText atlanir.
+        self._last_base_metrics = None
+        self._last_returns = None
         self._init_ui()
 
     def _init_ui(self):
@@ -91,6 +94,11 @@ class DashboardSummaryCards(QWidget):
         return card, lbl_wk_value, lbl_mo_value
 
     def update_base_metrics(self, total_value: Decimal, total_cost: Decimal, capital: Decimal, profit_loss: Decimal):
+        values = (total_value, total_cost, capital, profit_loss)
+        if values == self._last_base_metrics:
+            return
+        self._last_base_metrics = values
+
         self.lbl_total_value.setText(f"₺ {total_value:,.2f}")
         self.lbl_total_cost.setText(f"₺ {total_cost:,.2f}")
         self.lbl_capital.setText(f"₺ {capital:,.2f}")
@@ -105,29 +113,33 @@ class DashboardSummaryCards(QWidget):
         state = "positive" if profit_loss >= 0 else "negative"
         
         self.lbl_total_context.setText(f"{prefix} ₺ {abs(profit_loss):,.2f} ({sign}{roi:.1f}% All Time)")
-        self.lbl_total_context.setProperty("state", state)
-        self.lbl_total_context.style().unpolish(self.lbl_total_context)
-        self.lbl_total_context.style().polish(self.lbl_total_context)
+        self._set_state(self.lbl_total_context, state)
+
+    def reset_to_defaults(self):
+        """Bos portfoy icin kartlari varsayilan degerlere tek geciste ceker."""
+        self.update_base_metrics(Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0"))
+        self.update_returns(None, None)
 
     def update_returns(self, weekly_pct: float, monthly_pct: float):
-        if weekly_pct is not None:
-            state = "positive" if weekly_pct >= 0 else "negative"
-            self.lbl_weekly_return.setText(f"%{weekly_pct:+.2f}")
-            self.lbl_weekly_return.setProperty("state", state)
-        else:
-            self.lbl_weekly_return.setText("-")
-            self.lbl_weekly_return.setProperty("state", "neutral")
-            
-        self.lbl_weekly_return.style().unpolish(self.lbl_weekly_return)
-        self.lbl_weekly_return.style().polish(self.lbl_weekly_return)
+        if (weekly_pct, monthly_pct) == self._last_returns:
+            return
+        self._last_returns = (weekly_pct, monthly_pct)
+        self._set_return(self.lbl_weekly_return, weekly_pct)
+        self._set_return(self.lbl_monthly_return, monthly_pct)
 
-        if monthly_pct is not None:
-            state = "positive" if monthly_pct >= 0 else "negative"
-            self.lbl_monthly_return.setText(f"%{monthly_pct:+.2f}")
-            self.lbl_monthly_return.setProperty("state", state)
+    def _set_return(self, label: QLabel, pct: float):
+        if pct is not None:
+            label.setText(f"%{pct:+.2f}")
+            self._set_state(label, "positive" if pct >= 0 else "negative")
         else:
-            self.lbl_monthly_return.setText("-")
-            self.lbl_monthly_return.setProperty("state", "neutral")
-            
-        self.lbl_monthly_return.style().unpolish(self.lbl_monthly_return)
-        self.lbl_monthly_return.style().polish(self.lbl_monthly_return)
+            label.setText("-")
+            self._set_state(label, "neutral")
+
+    @staticmethod
+    def _set_state(label: QLabel, state: str):
+        # Stil yalnizca durum degistiginde yeniden uygulanir; her yenilemede QSS tekrar cozumlenmez.
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
@@ -2,24 +2,32 @@ from __future__ import annotations
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, Optional
 
 from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QMessageBox, QVBoxLayout, QDialog
-from PyQt5.QtCore import QSettings, QTimer, QSize
+from PyQt5.QtCore import QSettings, QThreadPool, QTimer, QSize
 
 from .base_page import BasePage
 from src.domain.models.daily_price import DailyPrice
 from src.domain.models.model_portfolio import ModelPortfolio
 from src.ui.widgets.shared.controls.icon_label import IconLabel
 from src.ui.widgets.model_portfolio import PortfolioInputDialog, PortfolioListPanel, PositionsTable, TradeInputDialog
+from src.ui.widgets.model_portfolio.tables import PositionsTableModel
 from src.ui.widgets.shared import AnimatedButton, InfoCard, Toast
+from src.ui.worker import Worker
 
 logger = logging.getLogger(__name__)
 
 LAST_SELECTED_PORTFOLIO_KEY = "model_portfolios/last_selected_id"
 LAST_UPDATE_TOAST_DURATION_MS = 4000
+PRICE_LOOKUP_WORKERS = 8
+PRICE_LOOKUP_TTL_SECONDS = 60
+VIEW_UPDATE_INTERVAL_MS = 50
+BACKGROUND_FORMAT_MIN_ROWS = 200
 
 
 class ModelPortfolioPage(BasePage):
@@ -34,7 +42,23 @@ class ModelPortfolioPage(BasePage):
         self.current_price_map: Dict[int, Decimal] = {}
         self._settings = QSettings("PortfoySimulasyonu", "PortfoySimulasyonu")
         self._last_update_toast_shown_for = None
+        self.threadpool = QThreadPool()
+        self._recent_lookups: Dict[str, tuple] = {}
+        # Liste yalnizca veri degistiginde yeniden yuklenir; sayfa gecisleri DB'ye gitmez.
+        self._portfolios_dirty = True
+        # Portfoy, trade versiyonu ve fiyatlar ayniysa _update_view servis cagrisi yapmaz.
+        self._trade_version = 0
+        self._last_view_key = None
+        # Arka planda bicimlenen pozisyonlardan yalnizca en sonuncusu tabloya yazilir.
+        self._positions_seq = 0
+        # Kisa aralikta gelen gorunum yenileme istekleri tek _update_view cagrisinda birlestirilir.
+        self._view_timer = QTimer(self)
+        self._view_timer.setSingleShot(True)
+        self._view_timer.setInterval(VIEW_UPDATE_INTERVAL_MS)
+        self._view_timer.timeout.connect(self._update_view)
         self._init_ui()
+        if getattr(container, "event_bus", None):
+            container.event_bus.portfolio_changed.connect(self._on_portfolio_data_changed)
 
     def _init_ui(self):
         header = QHBoxLayout()
@@ -124,23 +148,37 @@ class ModelPortfolioPage(BasePage):
         return panel
 
     def on_page_enter(self):
-        self.refresh_data()
+        if self._portfolios_dirty:
+            self.refresh_data()
 
     def refresh_data(self):
         self._load_portfolios()
 
+    def _on_portfolio_data_changed(self):
+        if self.isVisible():
+            self.refresh_data()
+        else:
+            self._portfolios_dirty = True
+
     def _load_portfolios(self):
+        self._portfolios_dirty = False
+        self._trade_version += 1
         portfolios = self.model_portfolio_service.get_all_portfolios()
-        self.list_panel.refresh(
-            portfolios,
-            trade_count_func=self.model_portfolio_service.get_trade_count,
+        trade_counts = self.model_portfolio_service.get_trade_counts_bulk(
+            [portfolio.id for portfolio in portfolios]
         )
+        self.list_panel.refresh(portfolios, trade_counts=trade_counts)
         selected_id = self.current_portfolio_id or self._get_last_selected_portfolio_id()
         if selected_id is None:
             return
         selected_portfolio = self.list_panel.select_portfolio_by_id(selected_id)
         if selected_portfolio:
             self._set_current_portfolio(selected_portfolio, show_toast=True)
+        elif self.current_portfolio_id is not None:
+            # Secili portfoy artik yok (orn. sistem sifirlandi); sag panel bosaltilir.
+            self.current_portfolio_id = None
+            self.current_price_map = {}
+            self._clear_right_panel()
 
     def _on_portfolio_selected(self, portfolio: ModelPortfolio):
         self._set_current_portfolio(portfolio, show_toast=True)
@@ -154,15 +192,28 @@ class ModelPortfolioPage(BasePage):
         self.lbl_portfolio_name.setText(portfolio.name)
         for button in (self.btn_buy, self.btn_sell, self.btn_refresh):
             button.setEnabled(True)
-        self._update_view()
+        self._request_update()
         if show_toast:
             QTimer.singleShot(0, self.show_last_update_toast_once)
 
+    def _request_update(self):
+        if not self._view_timer.isActive():
+            self._view_timer.start()
+
     def _update_view(self):
         if self.current_portfolio_id is None:
             return
+        view_key = (
+            self.current_portfolio_id,
+            self._trade_version,
+            tuple(sorted(self.current_price_map.items())),
+        )
+        if view_key == self._last_view_key:
+            return
+        self._last_view_key = view_key
 
-        summary = self.model_portfolio_service.get_portfolio_summary(
+        # Ozet ve pozisyonlar ayni trade okumasindan hesaplanir.
+        summary, positions = self.model_portfolio_service.get_portfolio_overview(
             self.current_portfolio_id,
             self.current_price_map,
         )
@@ -174,16 +225,30 @@ class ModelPortfolioPage(BasePage):
         self.card_pl.set_value(f"TL {profit_loss:+,.2f}")
         self.card_pl.set_value_state("positive" if profit_loss >= 0 else "negative")
 
-        positions = self.model_portfolio_service.get_positions_with_details(
-            self.current_portfolio_id,
-            self.current_price_map,
-        )
-        self.positions_table.populate(positions)
+        self._populate_positions(positions)
+
+    def _populate_positions(self, positions) -> None:
+        self._positions_seq += 1
+        if len(positions) < BACKGROUND_FORMAT_MIN_ROWS:
+            self.positions_table.populate(positions)
+            return
+
+        # Buyuk portfoylerde Decimal bicimlendirme UI thread'ini bekletmesin diye arka planda yapilir.
+        seq = self._positions_seq
+        worker = Worker(PositionsTableModel.prepare_rows, positions)
+        worker.signals.result.connect(lambda prepared: self._apply_prepared_positions(seq, prepared))
+        self.threadpool.start(worker)
+
+    def _apply_prepared_positions(self, seq: int, prepared: tuple) -> None:
+        if seq != self._positions_seq:
+            return
+        self.positions_table.populate_prepared(prepared)
 
     def _clear_right_panel(self):
+        self._last_view_key = None
         self.lbl_portfolio_name.setText("Bir portfoy secin")
         self.lbl_last_update.setText("")
-        self.positions_table.setRowCount(0)
+        self._populate_positions([])
         for button in (self.btn_buy, self.btn_sell, self.btn_refresh):
             button.setEnabled(False)
         for card in (self.card_initial, self.card_cash, self.card_value, self.card_pl):
@@ -200,8 +265,12 @@ class ModelPortfolioPage(BasePage):
         try:
             portfolio = self.model_portfolio_service.create_portfolio(**result)
             if portfolio and portfolio.id is not None:
-                self.current_portfolio_id = portfolio.id
-            self._load_portfolios()
+                # Yeni portfoy listeye tek satir olarak eklenir; tum liste yeniden kurulmaz.
+                self.list_panel.add_portfolio(portfolio, trade_count=0)
+                self.list_panel.select_portfolio_by_id(portfolio.id)
+                self._set_current_portfolio(portfolio, show_toast=True)
+            else:
+                self._load_portfolios()
             Toast.success(self, f"'{result['name']}' portfoyu olusturuldu.")
         except Exception as exc:
             Toast.error(self, f"Portfoy olusturulamadi: {exc}")
@@ -220,9 +289,12 @@ class ModelPortfolioPage(BasePage):
             return
         try:
             self.model_portfolio_service.update_portfolio(portfolio_id=self.current_portfolio_id, **result)
-            self._load_portfolios()
+            self._trade_version += 1
+            updated = self.model_portfolio_service.get_portfolio_by_id(self.current_portfolio_id)
+            if updated is None or not self.list_panel.update_portfolio(updated):
+                self._load_portfolios()
             self.lbl_portfolio_name.setText(result["name"])
-            self._update_view()
+            self._request_update()
             Toast.success(self, "Portfoy guncellendi.")
         except Exception as exc:
             Toast.error(self, f"Portfoy guncellenemedi: {exc}")
@@ -240,15 +312,16 @@ class ModelPortfolioPage(BasePage):
         if reply != QMessageBox.Yes:
             return
         try:
-            self.model_portfolio_service.delete_portfolio(self.current_portfolio_id)
-            self._settings.remove(self._price_map_settings_key(self.current_portfolio_id))
-            self._settings.remove(self._last_update_settings_key(self.current_portfolio_id))
+            portfolio_id = self.current_portfolio_id
+            self.model_portfolio_service.delete_portfolio(portfolio_id)
+            self._settings.remove(self._price_map_settings_key(portfolio_id))
+            self._settings.remove(self._last_update_settings_key(portfolio_id))
             self._settings.remove(LAST_SELECTED_PORTFOLIO_KEY)
             self._settings.sync()
             self.current_portfolio_id = None
             self.current_price_map = {}
             self._last_update_toast_shown_for = None
-            self._load_portfolios()
+            self.list_panel.remove_portfolio(portfolio_id)
             self._clear_right_panel()
             Toast.success(self, "Portfoy silindi.")
         except Exception as exc:
@@ -272,8 +345,12 @@ class ModelPortfolioPage(BasePage):
                 price=result["price"],
                 trade_date=result["trade_date"],
             )
-            self._load_portfolios()
-            self._update_view()
+            self._trade_version += 1
+            self.list_panel.set_trade_count(
+                self.current_portfolio_id,
+                self.model_portfolio_service.get_trade_count(self.current_portfolio_id),
+            )
+            self._request_update()
             action = "alindi" if side == "BUY" else "satildi"
             Toast.success(self, f"{result['quantity']} lot {result['ticker']} {action}.")
         except ValueError as exc:
@@ -287,33 +364,79 @@ class ModelPortfolioPage(BasePage):
         if not self.price_lookup_func:
             Toast.warning(self, "Fiyat sorgulama fonksiyonu mevcut degil.")
             return
-        positions = self.model_portfolio_service.get_positions_with_details(self.current_portfolio_id)
-        updated_count = 0
-        prices_to_save = []
-        event_prices: Dict[int, Decimal] = {}
+        portfolio_id = self.current_portfolio_id
+        positions = self.model_portfolio_service.get_positions_with_details(portfolio_id)
+
+        self.btn_refresh.setEnabled(False)
+        self.btn_refresh.setText("Guncelleniyor...")
+
+        # Fiyat sorgulari arka planda paralel yapilir; sonuc UI thread'inde tek seferde uygulanir.
+        worker = Worker(self._lookup_prices, positions)
+        worker.signals.result.connect(lambda results: self._apply_refreshed_prices(portfolio_id, results))
+        worker.signals.error.connect(lambda err: Toast.error(self, f"Fiyatlar alinamadi: {err[1]}"))
+        worker.signals.finished.connect(lambda: self._finish_refresh_prices())
+        self.threadpool.start(worker)
+
+    def _lookup_prices(self, positions) -> Dict[int, object]:
+        # Ayni ticker tek kez sorgulanir; son PRICE_LOOKUP_TTL_SECONDS icindeki sonuclar tekrar kullanilir.
+        stock_ids_by_ticker: Dict[str, list] = {}
         for pos in positions:
-            try:
-                result = self.price_lookup_func(pos["ticker"])
-                if result:
-                    self.current_price_map[pos["stock_id"]] = result.price
-                    event_prices[pos["stock_id"]] = result.price
-                    prices_to_save.append(
-                        DailyPrice(
-                            id=None,
-                            stock_id=pos["stock_id"],
-                            price_date=self._price_date_for_lookup_result(result),
-                            close_price=result.price,
-                            source=result.source,
-                        )
-                    )
-                    updated_count += 1
-            except Exception as exc:
-                logger.error("Fiyat alinamadi: %s - %s", pos["ticker"], exc)
+            stock_ids_by_ticker.setdefault(pos["ticker"], []).append(pos["stock_id"])
+
+        lookups: Dict[str, object] = {}
+        pending = []
+        now = time.monotonic()
+        for ticker in stock_ids_by_ticker:
+            cached = self._recent_lookups.get(ticker)
+            if cached and now - cached[0] < PRICE_LOOKUP_TTL_SECONDS:
+                lookups[ticker] = cached[1]
+            else:
+                pending.append(ticker)
+
+        if pending:
+            max_workers = min(PRICE_LOOKUP_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model-price-lookup") as executor:
+                futures = {executor.submit(self.price_lookup_func, ticker): ticker for ticker in pending}
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        logger.error("Fiyat alinamadi: %s - %s", ticker, exc)
+                        continue
+                    if result:
+                        lookups[ticker] = result
+                        self._recent_lookups[ticker] = (time.monotonic(), result)
+
+        results: Dict[int, object] = {}
+        for ticker, result in lookups.items():
+            for stock_id in stock_ids_by_ticker[ticker]:
+                results[stock_id] = result
+        return results
+
+    def _apply_refreshed_prices(self, portfolio_id: int, results: Dict[int, object]) -> None:
+        prices_to_save = [
+            DailyPrice(
+                id=None,
+                stock_id=stock_id,
+                price_date=self._price_date_for_lookup_result(result),
+                close_price=result.price,
+                source=result.source,
+            )
+            for stock_id, result in results.items()
+        ]
+        event_prices: Dict[int, Decimal] = {stock_id: result.price for stock_id, result in results.items()}
         if prices_to_save:
             self.price_repo.upsert_daily_prices_bulk(prices_to_save)
         if event_prices and getattr(self.container, "event_bus", None):
             self.container.event_bus.prices_updated.emit(event_prices)
-        self._update_view()
+        # Sorgu surerken baska portfoye gecildiyse ekrandaki fiyat haritasina dokunulmaz.
+        if portfolio_id != self.current_portfolio_id:
+            return
+
+        self.current_price_map.update(event_prices)
+        self._request_update()
+        updated_count = len(event_prices)
         if updated_count <= 0:
             Toast.warning(
                 self,
@@ -328,6 +451,10 @@ class ModelPortfolioPage(BasePage):
             detail=f"{updated_count} hisse icin fiyat guncellendi.",
         )
 
+    def _finish_refresh_prices(self) -> None:
+        self.btn_refresh.setText(" Fiyat Guncelle")
+        self.btn_refresh.setEnabled(self.current_portfolio_id is not None)
+
     def record_last_update_time(self, updated_at=None):
         if self.current_portfolio_id is None:
             return None
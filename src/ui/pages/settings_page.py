@@ -824,6 +824,8 @@ class SettingsPage(BasePage):
 
         try:
             self.reset_service.reset_all()
+            if getattr(self.container, "event_bus", None):
+                self.container.event_bus.portfolio_changed.emit()
             Toast.success(self, "Sistem başarıyla sıfırlandı.")
         except Exception as exc:
             Toast.error(self, f"Sistem sıfırlanamadı: {exc}")
@@ -1,8 +1,9 @@
 # src/ui/pages/stock_detail/stock_chart_widget.py
 
 import logging
+import time
 from datetime import date, timedelta
-import yfinance as yf
+import numpy as np
 
 from PyQt5.QtWidgets import QFrame, QVBoxLayout
 
@@ -12,14 +13,28 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 
+# Uzun fiyat serilerinde Agg cizimi: es-dogrusal noktalar birlestirilir, yol parcalar halinde cizilir.
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
 logger = logging.getLogger(__name__)
 
 class StockChartWidget(QFrame):
     """Hisse fiyat grafiğini çizen bağımsız bileşen."""
+
+    # Gun ici fiyatlar degistigi icin indirilen seri bu sure boyunca yeniden kullanilir.
+    CLOSE_CACHE_TTL_SECONDS = 300
     
-    def __init__(self, parent=None):
+    def __init__(self, market_data_client, parent=None):
         super().__init__(parent)
         self.setProperty("cssClass", "chartWidget")
+        # Seriler uygulamanin piyasa verisi istemcisinden alinir; yfinance'e dogrudan gidilmez.
+        self._market_data_client = market_data_client
+        # (yf_ticker, bitis) -> (zaman damgasi, (tarih dizisi, kapanis dizisi) | None)
+        self._close_cache = {}
         self._init_ui()
 
     def _init_ui(self):
@@ -30,31 +45,35 @@ class StockChartWidget(QFrame):
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
 
-    def draw_chart(self, current_ticker: str, current_stock_id, current_price, portfolio_service):
-        if not current_ticker:
-            return
-            
+    def cached_close_series(self, current_ticker: str):
+        """TTL icindeki seriyi (bulundu, seri) olarak doner; ag istegi yapmaz."""
+        cached = self._close_cache.get(self._cache_key(current_ticker))
+        if cached is not None and time.monotonic() - cached[0] < self.CLOSE_CACHE_TTL_SECONDS:
+            return True, cached[1]
+        return False, None
+
+    def load_close_series(self, current_ticker: str):
+        """Kapanis serisini cache'ten ya da piyasa verisi istemcisinden alir; arka plan thread'inde cagrilabilir."""
+        return self._get_close_series(current_ticker)
+
+    def show_message(self, text: str) -> None:
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.set_facecolor('#0f172a')
+        ax.set_axis_off()
+        ax.text(0.5, 0.5, text, color='#94a3b8', ha='center', va='center')
+        self.canvas.draw()
+
+    def render_chart(self, current_ticker: str, series, current_stock_id, current_price, portfolio_service):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         ax.set_facecolor('#0f172a')
         
         try:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=180) 
-            
-            yf_ticker = current_ticker if "." in current_ticker else f"{current_ticker}.IS"
-            data = yf.download(yf_ticker, start=start_date, end=end_date + timedelta(days=1), progress=False, auto_adjust=False)
-            
-            if data is not None and not data.empty:
-                close_col = 'Close' if 'Close' in data.columns else data.columns[0]
-                
-                if hasattr(data[close_col], 'values') and len(data[close_col].shape) > 1:
-                    close_data = data[close_col].iloc[:, 0]
-                else:
-                    close_data = data[close_col]
-                    
-                ax.plot(data.index, close_data, color='#3b82f6', linewidth=2.5)
-                ax.fill_between(data.index, close_data, alpha=0.1, color='#3b82f6')
+            if series is not None:
+                dates, close_data = series
+                ax.plot(dates, close_data, color='#3b82f6', linewidth=2.5)
+                ax.fill_between(dates, close_data, alpha=0.1, color='#3b82f6')
                 
                 # Dinamik Y-Ekseni Ölçeklendirme
                 ymin = close_data.min()
@@ -90,8 +109,35 @@ class StockChartWidget(QFrame):
                 ax.text(0.5, 0.5, "Veri bulunamadı", color='#94a3b8', ha='center', va='center')
                 
         except Exception as e:
-            logger.error(f"Grafik hatası: {e}")
+            logger.error("Grafik hatası: %s", e)
             ax.text(0.5, 0.5, "Grafik yüklenemedi", color='#94a3b8', ha='center', va='center')
             
         self.figure.tight_layout()
         self.canvas.draw()
+
+    def _get_close_series(self, current_ticker: str):
+        """Kapanis serisini indirir ve NumPy dizileri olarak saklar."""
+        hit, series = self.cached_close_series(current_ticker)
+        if hit:
+            return series
+
+        cache_key = self._cache_key(current_ticker)
+        yf_ticker, end_date = cache_key
+        start_date = end_date - timedelta(days=180)
+        points = self._market_data_client.get_price_series(yf_ticker, start_date, end_date)
+
+        series = None
+        if points:
+            dates = sorted(points)
+            series = (
+                np.array(dates, dtype="datetime64[D]"),
+                np.array([float(points[point_date]) for point_date in dates], dtype=np.float64),
+            )
+        # Bos sonuc da saklanir; gecersiz ticker TTL suresince tekrar indirilmez.
+        self._close_cache[cache_key] = (time.monotonic(), series)
+        return series
+
+    @staticmethod
+    def _cache_key(current_ticker: str):
+        yf_ticker = current_ticker if "." in current_ticker else f"{current_ticker}.IS"
+        return yf_ticker, date.today()
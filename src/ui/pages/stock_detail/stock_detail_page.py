@@ -2,16 +2,14 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-from PyQt5.QtCore import QDate, Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import QDate, Qt, QThreadPool
 from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
     QMessageBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QHeaderView,
@@ -19,10 +17,12 @@ from PyQt5.QtWidgets import (
 
 from src.domain.models.trade import TradeSide
 from src.ui.pages.base_page import BasePage
+from src.ui.worker import Worker
 
 from .stock_chart_widget import StockChartWidget
 from .stock_stats_panel import StockStatsPanel
 from .trade_form_panel import TradeFormPanel
+from .trade_history_model import TradeHistoryModel
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,9 @@ class StockDetailPage(BasePage):
         self.current_ticker: Optional[str] = None
         self.current_stock_id: Optional[int] = None
         self.current_price: Optional[Decimal] = None
+        self.threadpool = QThreadPool()
+        # Arka planda indirilen grafik serisinden yalnizca en son istenen cizilir.
+        self._chart_request_seq = 0
         self._init_ui()
 
     def _init_ui(self):
@@ -93,7 +96,7 @@ class StockDetailPage(BasePage):
         left_layout.setContentsMargins(0, 0, 10, 0)
         left_layout.setSpacing(15)
 
-        self.chart_widget = StockChartWidget()
+        self.chart_widget = StockChartWidget(self.container.market_client)
         left_layout.addWidget(self.chart_widget, 3)
 
         self.stats_panel = StockStatsPanel()
@@ -103,19 +106,19 @@ class StockDetailPage(BasePage):
         lbl_history.setProperty("cssClass", "panelTitle")
         left_layout.addWidget(lbl_history)
 
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["Tarih", "Islem", "Adet", "Fiyat", "Tutar"])
+        self.history_model = TradeHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
         self.history_table.verticalHeader().setVisible(False)
+        self.history_table.setShowGrid(False)
+        self.history_table.setProperty("cssClass", "dataTable")
         left_layout.addWidget(self.history_table, 2)
 
         self.trade_form = TradeFormPanel()
         self.trade_form.trade_submitted.connect(self._on_submit_trade)
-        self.trade_form.spin_qty.valueChanged.connect(self._trigger_impact_update)
-        self.trade_form.spin_price.valueChanged.connect(self._trigger_impact_update)
-        self.trade_form.btn_buy_mode.toggled.connect(self._trigger_impact_update)
+        self.trade_form.impact_preview_requested.connect(self._trigger_impact_update)
 
         splitter.addWidget(left_panel)
         splitter.addWidget(self.trade_form)
@@ -142,14 +145,43 @@ class StockDetailPage(BasePage):
     def refresh_data(self):
         if not self.current_ticker:
             return
-        self.chart_widget.draw_chart(
-            self.current_ticker,
+        self.stats_panel.update_stats(self.portfolio_service, self.current_stock_id, self.current_price)
+        self._load_history()
+        self._refresh_chart()
+
+    def _refresh_chart(self):
+        self._chart_request_seq += 1
+        request_id = self._chart_request_seq
+        ticker = self.current_ticker
+
+        hit, series = self.chart_widget.cached_close_series(ticker)
+        if hit:
+            self._on_chart_series_ready(request_id, ticker, series)
+            return
+
+        # yfinance indirmesi UI thread'ini bloklamasin; istatistik ve gecmis hemen gorunur.
+        self.chart_widget.show_message("Grafik yükleniyor...")
+        worker = Worker(self.chart_widget.load_close_series, ticker)
+        worker.signals.result.connect(lambda result: self._on_chart_series_ready(request_id, ticker, result))
+        worker.signals.error.connect(lambda err: self._on_chart_series_error(request_id, err))
+        self.threadpool.start(worker)
+
+    def _on_chart_series_ready(self, request_id: int, ticker: str, series):
+        if request_id != self._chart_request_seq:
+            return
+        self.chart_widget.render_chart(
+            ticker,
+            series,
             self.current_stock_id,
             self.current_price,
             self.portfolio_service,
         )
-        self.stats_panel.update_stats(self.portfolio_service, self.current_stock_id, self.current_price)
-        self._load_history()
+
+    def _on_chart_series_error(self, request_id: int, err):
+        if request_id != self._chart_request_seq:
+            return
+        logger.error("Grafik hatası: %s", err[1])
+        self.chart_widget.show_message("Grafik yüklenemedi")
 
     def _update_price_info(self):
         if not self.current_ticker or not self.price_lookup_func:
@@ -164,32 +196,13 @@ class StockDetailPage(BasePage):
             logger.error("Fiyat hatasi: %s", exc)
 
     def _load_history(self):
-        if not self.current_stock_id:
-            self.history_table.setRowCount(0)
-            return
-
-        trades = self.portfolio_service.get_trades_for_stock(self.current_stock_id)
-        trades.sort(key=lambda trade: trade.trade_date, reverse=True)
-
-        self.history_table.setRowCount(len(trades))
-        for row_index, trade in enumerate(trades):
-            self.history_table.setItem(row_index, 0, QTableWidgetItem(trade.trade_date.strftime("%d.%m.%Y")))
-            type_str = "ALIM" if trade.side == TradeSide.BUY else "SATIM"
-            type_item = QTableWidgetItem(type_str)
-            type_item.setForeground(Qt.green if trade.side == TradeSide.BUY else Qt.red)
-            self.history_table.setItem(row_index, 1, type_item)
-            self.history_table.setItem(row_index, 2, QTableWidgetItem(str(trade.quantity)))
-            self.history_table.setItem(row_index, 3, QTableWidgetItem(f"TL {trade.price:,.2f}"))
-            self.history_table.setItem(row_index, 4, QTableWidgetItem(f"TL {trade.total_amount:,.2f}"))
-
-            for col in range(5):
-                item = self.history_table.item(row_index, col)
-                if item:
-                    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                    item.setBackground(QColor("#1e293b" if row_index % 2 == 0 else "#0f172a"))
-
-        self.history_table.setShowGrid(False)
-        self.history_table.setProperty("cssClass", "dataTable")
+        trades = self.portfolio_service.get_trades_for_stock(self.current_stock_id) if self.current_stock_id else []
+        # Model sifirlanirken tablo ara boyama yapmaz; tek seferde yeniden cizilir.
+        self.history_table.setUpdatesEnabled(False)
+        try:
+            self.history_model.set_trades(trades)
+        finally:
+            self.history_table.setUpdatesEnabled(True)
 
     def _on_submit_trade(self, is_buy: bool, qty: int, price: float, date_sel: QDate):
         if not self.current_ticker:
@@ -13,6 +13,7 @@ class TradeFormPanel(QFrame):
     
     # Kullanıcı emir girdiğinde fırlatılacak sinyal (formdan gelen bilgiler)
     trade_submitted = pyqtSignal(bool, int, float, QDate) # is_buy, qty, price, date
+    impact_preview_requested = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -157,10 +158,9 @@ class TradeFormPanel(QFrame):
         self.impact_preview_request()
 
     def impact_preview_request(self):
-        # Üst sınıfa/Parent'a preview hesaplaması için çağrı, 
-        # Ya da direkt burada hesaplanabilir eğer portföy servisi ve hisse verilmişse.
-        # Bu bağımlılığı koparmak için bu sınıfta sadece arayüz bırakmalı.
-        pass
+        # Preview hesaplaması portföy servisine ihtiyaç duyduğu için Parent'a bırakılır.
+        # Girdi değişikliği başına tek sinyal: alt widget sinyallerine ayrıca bağlanılmaz.
+        self.impact_preview_requested.emit()
 
     def update_impact_preview(self, portfolio_service, current_stock_id: int):
         """Bu fonksiyon dışarıdan (Orchestrator tarafından) çağrılarak preview render eder."""
@@ -0,0 +1,80 @@
+# src/ui/pages/stock_detail/trade_history_model.py
+
+from __future__ import annotations
+
+from typing import List
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
+from PyQt5.QtGui import QColor
+
+from src.domain.models.trade import Trade, TradeSide
+
+BUY_COLOR = QColor(Qt.green)
+SELL_COLOR = QColor(Qt.red)
+ROW_BACKGROUNDS = (QColor("#1e293b"), QColor("#0f172a"))
+
+
+class TradeHistoryModel(QAbstractTableModel):
+    """
+    Hisse detay sayfasındaki işlem geçmişi için salt okunur tablo modeli.
+
+    Kolonlar: Tarih, İşlem, Adet, Fiyat, Tutar.
+    Hücre metinleri data() içinde yalnızca görünen satırlar için üretilir.
+    """
+
+    COLUMNS = ["Tarih", "Islem", "Adet", "Fiyat", "Tutar"]
+    SIDE_COLUMN = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._trades: List[Trade] = []
+
+    def set_trades(self, trades: List[Trade]) -> None:
+        """İşlemleri tarihe göre yeniden eskiye sıralayıp modeli tek seferde sıfırlar."""
+        self.beginResetModel()
+        self._trades = sorted(trades, key=lambda trade: trade.trade_date, reverse=True)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._trades)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return QVariant()
+        return self.COLUMNS[section]
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        trade = self._trades[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return trade.trade_date.strftime("%d.%m.%Y")
+            if col == 1:
+                return "ALIM" if trade.side == TradeSide.BUY else "SATIM"
+            if col == 2:
+                return str(trade.quantity)
+            if col == 3:
+                return f"TL {trade.price:,.2f}"
+            return f"TL {trade.total_amount:,.2f}"
+
+        if role == Qt.ForegroundRole and col == self.SIDE_COLUMN:
+            return BUY_COLOR if trade.side == TradeSide.BUY else SELL_COLOR
+
+        if role == Qt.BackgroundRole:
+            return ROW_BACKGROUNDS[index.row() % 2]
+
+        return QVariant()
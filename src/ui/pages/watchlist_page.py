@@ -173,9 +173,15 @@ class WatchlistPage(BasePage):
         self._load_watchlists()
 
     def _load_watchlists(self):
-        self.list_widget.clear()
         watchlists = self.watchlist_service.get_all_watchlists()
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self._fill_watchlist_rows(watchlists)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
+    def _fill_watchlist_rows(self, watchlists) -> None:
+        self.list_widget.clear()
         for wl in watchlists:
             count = self.watchlist_service.get_watchlist_item_count(wl.id)
             label = f"{wl.name} ({count})"
@@ -217,10 +223,18 @@ class WatchlistPage(BasePage):
             return
 
         stocks = self.watchlist_service.get_watchlist_stocks(self.current_watchlist_id)
-        
+
+        # Satirlar tek seferde acilir ve cizim doldurma bitene kadar ertelenir;
+        # satir satir ekleme her seferinde model/viewport guncellemesi tetiklemez.
+        self.stock_table.setUpdatesEnabled(False)
+        try:
+            self._fill_stock_rows(stocks)
+        finally:
+            self.stock_table.setUpdatesEnabled(True)
+
+    def _fill_stock_rows(self, stocks) -> None:
+        self.stock_table.setRowCount(len(stocks))
         for i, stock_data in enumerate(stocks):
-            self.stock_table.insertRow(i)
-            
             # Ticker kolonu kalktı, veriyi Hisse Adı kolonuna gömüyoruz
             name_text = stock_data["name"] or stock_data["ticker"]
             name_item = self._readonly_table_item(name_text)
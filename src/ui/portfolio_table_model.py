@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from PyQt5.QtGui import QColor, QFont
-from PyQt5.QtCore import QAbstractTableModel, Qt, QModelIndex, QVariant
+from PyQt5.QtCore import QAbstractItemModel, QAbstractTableModel, Qt, QModelIndex, QSize, QVariant
 from decimal import Decimal
 
 from src.domain.models.position import Position
 
+POSITIVE_COLOR = QColor("#22c55e")  # Yeşil
+NEGATIVE_COLOR = QColor("#ef4444")  # Kırmızı
+MISSING_COLOR = QColor("#666666")
+
+# (kolon metinleri, kolon ön plan renkleri, K/Z işareti)
+_RowRender = Tuple[Tuple[str, ...], Tuple[Optional[QColor], ...], int]
+
+
+def _sign_color(value: Decimal) -> Optional[QColor]:
+    if value > 0:
+        return POSITIVE_COLOR
+    if value < 0:
+        return NEGATIVE_COLOR
+    return None
+
 
 class PortfolioTableModel(QAbstractTableModel):
     """
@@ -21,8 +36,13 @@ class PortfolioTableModel(QAbstractTableModel):
       3: Güncel Fiyat
       4: Piyasa Değeri
       5: Gerçekleşmemiş Kar/Zarar
+
+    Satırlar görünüm kaydırıldıkça FETCH_BATCH_SIZE'lık parçalar halinde açılır
+    (canFetchMore/fetchMore); büyük portföylerde ilk boyama maliyeti sınırlı kalır.
     """
 
+    FETCH_BATCH_SIZE = 50
+
     def __init__(
         self,
         positions: List[Position],
@@ -32,10 +52,20 @@ class PortfolioTableModel(QAbstractTableModel):
         parent=None,
     ):
         super().__init__(parent)
-        self._positions = positions
-        self._price_map = price_map
-        self._ticker_map = ticker_map  # { stock_id: "ASELS.IS" ... }
+        # Liste/sozlukler modele aittir; yenilemelerde yeniden olusturulmaz, yerinde doldurulur.
+        # Boylece snapshot'in price_map'i canli fiyat olaylarinda degistirilmez.
+        self._positions: List[Position] = list(positions)
+        self._price_map: Dict[int, Decimal] = dict(price_map)
+        self._ticker_map: Dict[int, str] = dict(ticker_map)  # { stock_id: "ASELS.IS" ... }
         self._event_bus = event_bus
+        self._loaded_rows = min(len(positions), self.FETCH_BATCH_SIZE)
+        # Satir basina bicimlenmis metinler, renkler ve K/Z isareti; veri/fiyat degisene kadar
+        # her boyama/rol cagrisinda Decimal hesaplari yeniden yapilmaz.
+        self._row_cache: Dict[int, _RowRender] = {}
+        self._italic_font = QFont()
+        self._italic_font.setItalic(True)
+        # Başlık boyutları görünüm tarafından bir kez ölçülür; başlık her düzende stil ile yeniden ölçülmez.
+        self._header_size_hints: Dict[int, QSize] = {}
         
         self._headers = [
             "Hisse",
@@ -51,12 +81,35 @@ class PortfolioTableModel(QAbstractTableModel):
             self._event_bus.prices_updated.connect(self._on_prices_updated)
 
     def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded_rows
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded_rows < len(self._positions)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._positions) - self._loaded_rows, self.FETCH_BATCH_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+
+    def position_count(self) -> int:
+        """Henüz görünüme açılmamış satırlar dahil toplam pozisyon sayısı."""
         return len(self._positions)
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self._headers)
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.SizeHintRole and orientation == Qt.Horizontal:
+            return self._header_size_hints.get(section, QVariant())
         if role != Qt.DisplayRole:
             return QVariant()
         if orientation == Qt.Horizontal:
@@ -67,89 +120,76 @@ class PortfolioTableModel(QAbstractTableModel):
         if not index.isValid():
             return QVariant()
 
-        position = self._positions[index.row()]
-        stock_id = position.stock_id
-        current_price = self._price_map.get(stock_id)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
 
-        # Görüntülenecek metni belirleyelim, böylece Foreground ve Font rollerinde kullanabiliriz.
-        display_text = ""
-        col = index.column()
-        if col == 0: # HISSE
-            ticker = self._ticker_map.get(stock_id)
-            display_text = ticker if ticker is not None else str(stock_id)
-        elif col == 1: # GÜNCEL FİYAT
-            display_text = f"{current_price:,.2f}" if current_price is not None else "-"
-        elif col == 2: # DEĞİŞİM%
-            if current_price is None: 
-                display_text = "-"
-            else:
-                avg = position.average_cost
-                if avg and avg > 0:
-                    pct = ((current_price - avg) / avg) * 100
-                    display_text = f"%{pct:+.2f}"
-                else:
-                    display_text = "-"
-        elif col == 3: # LOT
-            display_text = f"{position.total_quantity:,}"
-        elif col == 4: # ORT. MALİYET
-            avg = position.average_cost
-            display_text = f"{avg:,.2f}" if avg is not None else "-"
-        elif col == 5: # PİYASA DEĞERİ
-            if current_price is None: 
-                display_text = "-"
-            else:
-                mv = position.market_value(current_price)
-                display_text = f"{mv:,.2f}"
-        elif col == 6: # KAR/ZARAR
-            if current_price is None: 
-                display_text = "-"
-            else:
-                u_pl = position.unrealized_pl(current_price)
-                display_text = f"{u_pl:+,.2f}"
+        if role == Qt.ToolTipRole:
+            return "Hisse detaylarını görmek için çift tıkla"
 
+        if role not in (Qt.DisplayRole, Qt.ForegroundRole, Qt.FontRole):
+            return QVariant()
+
+        col = index.column()
+        texts, colors, _ = self._row_render(index.row())
 
         if role == Qt.ForegroundRole:
-            if display_text == "-":
-                return QColor("#666666")
-                
-            if current_price is not None:
-                # 6. Kolon: Gerç. Olmayan K/Z
-                if col == 6:
-                    pl = position.unrealized_pl(current_price)
-                    if pl > 0:
-                        return QColor("#22c55e")  # Yeşil
-                    elif pl < 0:
-                        return QColor("#ef4444")  # Kırmızı
-                
-                # 2. Kolon: Değişim %
-                elif col == 2:
-                    avg = position.average_cost
-                    if avg and avg > 0:
-                        change_pct = ((current_price - avg) / avg) * 100
-                        if change_pct > 0:
-                            return QColor("#22c55e")
-                        elif change_pct < 0:
-                            return QColor("#ef4444")
-                            
-            return QVariant()
+            color = colors[col]
+            return color if color is not None else QVariant()
 
         if role == Qt.FontRole:
-            if display_text == "-":
-                font = QFont()
-                font.setItalic(True)
-                return font
-            return QVariant()
+            return self._italic_font if texts[col] == "-" else QVariant()
 
-        if role == Qt.DisplayRole:
-            return display_text
+        return texts[col]
 
-        if role == Qt.TextAlignmentRole:
-            return Qt.AlignCenter
-            
-        if role == Qt.ToolTipRole:
-            return "Hisse detaylarını görmek için çift tıkla"
+    def row_pl_sign(self, row: int) -> int:
+        """Satırın gerçekleşmemiş K/Z işareti (1, -1, fiyat yoksa/sıfırsa 0); delegate bunu kullanır."""
+        return self._row_render(row)[2]
 
-        return QVariant()
+    def _row_render(self, row: int) -> _RowRender:
+        cached = self._row_cache.get(row)
+        if cached is not None:
+            return cached
+
+        position = self._positions[row]
+        stock_id = position.stock_id
+        current_price = self._price_map.get(stock_id)
+        ticker = self._ticker_map.get(stock_id)
+        avg = position.average_cost
+
+        change_color = pl_color = None
+        pl_sign = 0
+        if current_price is None:
+            price_text = change_text = value_text = pl_text = "-"
+        else:
+            price_text = f"{current_price:,.2f}"
+            if avg and avg > 0:
+                change_pct = ((current_price - avg) / avg) * 100
+                change_text = f"%{change_pct:+.2f}"
+                change_color = _sign_color(change_pct)
+            else:
+                change_text = "-"
+            pl = position.unrealized_pl(current_price)
+            pl_sign = (pl > 0) - (pl < 0)
+            pl_color = _sign_color(pl)
+            value_text = f"{position.market_value(current_price):,.2f}"
+            pl_text = f"{pl:+,.2f}"
+
+        texts = (
+            ticker if ticker is not None else str(stock_id),
+            price_text,
+            change_text,
+            f"{position.total_quantity:,}",
+            f"{avg:,.2f}" if avg is not None else "-",
+            value_text,
+            pl_text,
+        )
+        colors = tuple(
+            MISSING_COLOR if text == "-" else color
+            for text, color in zip(texts, (None, None, change_color, None, None, None, pl_color))
+        )
+        render = (texts, colors, pl_sign)
+        self._row_cache[row] = render
+        return render
 
     # UI'yı güncellemek için helper
     def update_data(
@@ -158,12 +198,92 @@ class PortfolioTableModel(QAbstractTableModel):
         price_map: Dict[int, Decimal],
         ticker_map: Dict[int, str],
     ):
+        # Satır sayısı aynı kalıyorsa model sıfırlanmaz; tek layoutChanged ile görünüm yerinde yenilenir.
+        if len(positions) == len(self._positions):
+            self.layoutAboutToBeChanged.emit([], QAbstractItemModel.NoLayoutChangeHint)
+            self._swap_data(positions, price_map, ticker_map)
+            self.layoutChanged.emit([], QAbstractItemModel.NoLayoutChangeHint)
+            return
+        self.beginResetModel()
+        self._swap_data(positions, price_map, ticker_map)
+        self._loaded_rows = min(len(positions), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def _swap_data(
+        self,
+        positions: List[Position],
+        price_map: Dict[int, Decimal],
+        ticker_map: Dict[int, str],
+    ):
+        self._positions[:] = positions
+        self._replace_map(self._price_map, price_map)
+        self._replace_map(self._ticker_map, ticker_map)
+        self._row_cache.clear()
+
+    @staticmethod
+    def _replace_map(target: dict, source: dict):
+        if source is not target:
+            target.clear()
+            target.update(source)
+
+    def set_header_size_hints(self, hints: Dict[int, QSize]):
+        self._header_size_hints = dict(hints)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def update_row_for_stock(self, stock_id: int, position: Position) -> bool:
+        """
+        Tek hissenin pozisyonunu yerinde değiştirir ve yalnızca o satır için dataChanged yayar.
+        Hisse modelde yoksa False döner (yapısal değişiklik, tam yenileme gerekir).
+        """
+        for row, current in enumerate(self._positions):
+            if current.stock_id == stock_id:
+                break
+        else:
+            return False
+
+        self._positions[row] = position
+        self._row_cache.pop(row, None)
+        if row < self._loaded_rows:
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, len(self._headers) - 1),
+                [Qt.DisplayRole, Qt.ForegroundRole, Qt.FontRole],
+            )
+        return True
+
+    def clear(self):
+        """Portföy sıfırlandığında modeli boş listelerle tek reset ile temizler."""
         self.beginResetModel()
-        self._positions = positions
-        self._price_map = price_map
-        self._ticker_map = ticker_map
+        self._positions.clear()
+        self._price_map.clear()
+        self._ticker_map.clear()
+        self._row_cache.clear()
+        self._loaded_rows = 0
         self.endResetModel()
 
+    def update_prices_only(
+        self,
+        price_map: Dict[int, Decimal],
+        positions: Optional[List[Position]] = None,
+    ):
+        """
+        Satır yapısı değişmediğinde modeli sıfırlamadan günceller.
+        Yalnızca fiyat/değer kolonları için tek bir dataChanged yayılır;
+        aynı hisselerin güncel pozisyonları verilirse lot/maliyet kolonları da kapsanır.
+        """
+        self._replace_map(self._price_map, price_map)
+        self._row_cache.clear()
+        first_col = 1
+        if positions is not None:
+            self._positions[:] = positions
+            self._loaded_rows = min(self._loaded_rows, len(positions))
+            first_col = 0
+        if not self._loaded_rows:
+            return
+        top_left = self.index(0, first_col)
+        bottom_right = self.index(self._loaded_rows - 1, len(self._headers) - 1)
+        self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.ForegroundRole, Qt.FontRole])
+
     def get_position(self, row: int) -> Position:
         """
         Verilen satırdaki Position objesini döner.
@@ -172,6 +292,12 @@ class PortfolioTableModel(QAbstractTableModel):
             raise IndexError("Row out of range in PortfolioTableModel.get_position")
         return self._positions[row]
 
+    def get_ticker(self, stock_id: int) -> Optional[str]:
+        """
+        Modelin zaten tuttuğu ticker eşlemesinden hissenin ticker'ını döner.
+        """
+        return self._ticker_map.get(stock_id)
+
     def _on_prices_updated(self, new_prices: Dict[int, Decimal]):
         """EventBus'tan gelen anlık fiyat güncellemesi. Sadece değişen hücreleri/satırları render eder."""
         if not new_prices:
@@ -179,14 +305,19 @@ class PortfolioTableModel(QAbstractTableModel):
             
         self._price_map.update(new_prices)
         
+        # Henüz açılmamış satırlar ilk istendiğinde zaten güncel fiyatla biçimlenir.
         changed_rows = []
-        for row, pos in enumerate(self._positions):
+        for row, pos in enumerate(self._positions[:self._loaded_rows]):
             if pos.stock_id in new_prices:
                 changed_rows.append(row)
-                
+        if not changed_rows:
+            return
+
         for row in changed_rows:
-            top_left = self.index(row, 1)  # 1: Güncel Fiyat kolonu
-            bottom_right = self.index(row, 6)  # 6: Kar/Zarar kolonu
-            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.ForegroundRole])
+            self._row_cache.pop(row, None)
+        # Hücre hücre değil, değişen satırları kapsayan tek bir dataChanged yayılır.
+        top_left = self.index(changed_rows[0], 1)  # 1: Güncel Fiyat kolonu
+        bottom_right = self.index(changed_rows[-1], 6)  # 6: Kar/Zarar kolonu
+        self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.ForegroundRole])
 
 
@@ -2,6 +2,9 @@ from PyQt5.QtWidgets import QStyledItemDelegate
 from PyQt5.QtGui import QColor
 from PyQt5.QtCore import Qt
 
+# K/Z işaretine göre gösterge rengi: nötr gri, yeşil, kırmızı
+INDICATOR_COLORS = {0: QColor("#555555"), 1: QColor("#00C853"), -1: QColor("#FF1744")}
+
 class PortfolioRowDelegate(QStyledItemDelegate):
     """
     Tablo satırlarının sol kenarına kar/zarar durumuna göre 
@@ -21,20 +24,10 @@ class PortfolioRowDelegate(QStyledItemDelegate):
                 model = model.sourceModel()
                 row = source_index.row()
                 
-            if hasattr(model, 'get_position') and hasattr(model, '_price_map'):
+            if hasattr(model, 'row_pl_sign'):
                 try:
-                    position = model.get_position(row)
-                    current_price = model._price_map.get(position.stock_id)
-                    
-                    # Varsayılan: Nötr gri
-                    color = QColor("#555555")
-                    
-                    if current_price is not None:
-                        pl = position.unrealized_pl(current_price)
-                        if pl > 0:
-                            color = QColor("#00C853")
-                        elif pl < 0:
-                            color = QColor("#FF1744")
+                    # K/Z işareti modelin satır önbelleğinden okunur; her boyamada yeniden hesaplanmaz.
+                    color = INDICATOR_COLORS[model.row_pl_sign(row)]
                     
                     painter.save()
                     painter.setPen(Qt.NoPen)
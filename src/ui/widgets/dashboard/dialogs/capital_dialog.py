@@ -31,9 +31,9 @@ class CapitalDialog(QDialog):
         layout.setSpacing(15)
         
         # Mevcut sermaye
-        lbl_current = QLabel(f"Mevcut Sermaye: ₺{self.current_capital:,.2f}")
-        lbl_current.setProperty("cssClass", "dialogHeaderTitle")
-        layout.addWidget(lbl_current)
+        self.lbl_current = QLabel(f"Mevcut Sermaye: ₺{self.current_capital:,.2f}")
+        self.lbl_current.setProperty("cssClass", "dialogHeaderTitle")
+        layout.addWidget(self.lbl_current)
         
         form = QFormLayout()
         form.setSpacing(10)
@@ -71,6 +71,13 @@ class CapitalDialog(QDialog):
         btn_layout.addWidget(btn_confirm)
         layout.addLayout(btn_layout)
 
+    def set_current_capital(self, current_capital: Decimal):
+        """Diyalog yeniden açılmadan önce sermaye bilgisini ve girişleri tazeler."""
+        self.current_capital = current_capital
+        self.lbl_current.setText(f"Mevcut Sermaye: ₺{current_capital:,.2f}")
+        self.combo_action.setCurrentIndex(0)
+        self.spin_amount.setValue(10000)
+
     def get_result(self) -> Optional[Dict]:
         action = "deposit" if self.combo_action.currentIndex() == 0 else "withdraw"
         amount = Decimal(str(self.spin_amount.value()))
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Optional
 
 from PyQt5.QtWidgets import QDialog, QDoubleSpinBox, QFormLayout, QHBoxLayout, QLineEdit, QPushButton, QVBoxLayout
 
+from src.ui.widgets.shared import spin_box_decimal
+
 
 class PortfolioInputDialog(QDialog):
     def __init__(self, parent=None, portfolio=None):
@@ -55,6 +56,6 @@ class PortfolioInputDialog(QDialog):
         return {
             "name": name,
             "description": self.txt_desc.text().strip() or None,
-            "initial_cash": Decimal(str(self.spin_cash.value())),
+            "initial_cash": spin_box_decimal(self.spin_cash),
         }
 
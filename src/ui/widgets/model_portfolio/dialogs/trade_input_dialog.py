@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from decimal import Decimal
 from typing import Optional
 
 from PyQt5.QtCore import QDate, Qt
@@ -17,6 +16,8 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
 )
 
+from src.ui.widgets.shared import spin_box_decimal
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,7 +114,7 @@ class TradeInputDialog(QDialog):
         return {
             "ticker": ticker.upper(),
             "quantity": self.spin_qty.value(),
-            "price": Decimal(str(self.spin_price.value())),
+            "price": spin_box_decimal(self.spin_price),
             "trade_date": self.date_edit.date().toPyDate(),
         }
 
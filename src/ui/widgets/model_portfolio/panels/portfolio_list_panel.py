@@ -17,6 +17,8 @@ class PortfolioListPanel(QFrame):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._items_by_id: dict = {}
+        self._trade_counts = None
         self.setMinimumWidth(220)
         self.setMaximumWidth(340)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
@@ -52,25 +54,67 @@ class PortfolioListPanel(QFrame):
         btn_row.addStretch()
         layout.addLayout(btn_row)
 
-    def refresh(self, portfolios: list, trade_count_func=None) -> None:
+    def refresh(self, portfolios: list, trade_counts: dict = None) -> None:
         self._list.clear()
+        self._items_by_id = {}
+        self._trade_counts = dict(trade_counts) if trade_counts is not None else None
         for portfolio in portfolios:
-            count = trade_count_func(portfolio.id) if trade_count_func else ""
-            label = f"{portfolio.name} ({count} işlem)" if count != "" else portfolio.name
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, portfolio)
-            item.setSizeHint(QSize(0, 36))
-            self._list.addItem(item)
-
-            row = ActionListItem(label)
-            row.selected.connect(lambda portfolio=portfolio, item=item: self._select_item(item, portfolio))
-            row.edit_requested.connect(
-                lambda portfolio=portfolio, item=item: self._emit_item_action(item, portfolio, self.edit_requested)
-            )
-            row.delete_requested.connect(
-                lambda portfolio=portfolio, item=item: self._emit_item_action(item, portfolio, self.delete_requested)
-            )
-            self._list.setItemWidget(item, row)
+            self._append_item(portfolio)
+
+    def add_portfolio(self, portfolio, trade_count: int = 0) -> None:
+        """Listeyi yeniden kurmadan tek bir portfoy satiri ekler."""
+        if self._trade_counts is not None:
+            self._trade_counts[portfolio.id] = trade_count
+        self._append_item(portfolio)
+
+    def update_portfolio(self, portfolio) -> bool:
+        """Var olan satirin verisini ve etiketini gunceller; satir yoksa False doner."""
+        entry = self._items_by_id.get(portfolio.id)
+        if entry is None:
+            return False
+        item, row = entry
+        item.setData(Qt.UserRole, portfolio)
+        row.label.setText(self._label_for(portfolio))
+        return True
+
+    def set_trade_count(self, portfolio_id: int, trade_count: int) -> None:
+        entry = self._items_by_id.get(portfolio_id)
+        if entry is None or self._trade_counts is None:
+            return
+        self._trade_counts[portfolio_id] = trade_count
+        item, row = entry
+        row.label.setText(self._label_for(item.data(Qt.UserRole)))
+
+    def remove_portfolio(self, portfolio_id: int) -> None:
+        entry = self._items_by_id.pop(portfolio_id, None)
+        if entry is None:
+            return
+        if self._trade_counts is not None:
+            self._trade_counts.pop(portfolio_id, None)
+        self._list.takeItem(self._list.row(entry[0]))
+
+    def _label_for(self, portfolio) -> str:
+        if self._trade_counts is None:
+            return portfolio.name
+        return f"{portfolio.name} ({self._trade_counts.get(portfolio.id, 0)} işlem)"
+
+    def _append_item(self, portfolio) -> None:
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, portfolio)
+        item.setSizeHint(QSize(0, 36))
+        self._list.addItem(item)
+
+        # Portfoy nesnesi satir verisinden okunur; update_portfolio sonrasi da guncel kalir
+        row = ActionListItem(self._label_for(portfolio))
+        row.selected.connect(lambda item=item: self._select_item(item, item.data(Qt.UserRole)))
+        row.edit_requested.connect(
+            lambda item=item: self._emit_item_action(item, item.data(Qt.UserRole), self.edit_requested)
+        )
+        row.delete_requested.connect(
+            lambda item=item: self._emit_item_action(item, item.data(Qt.UserRole), self.delete_requested)
+        )
+        self._list.setItemWidget(item, row)
+        self._items_by_id[portfolio.id] = (item, row)
 
     def set_selection_enabled(self, enabled: bool) -> None:
         return None
@@ -80,13 +124,12 @@ class PortfolioListPanel(QFrame):
         return item.data(Qt.UserRole) if item else None
 
     def select_portfolio_by_id(self, portfolio_id: int):
-        for row_index in range(self._list.count()):
-            item = self._list.item(row_index)
-            portfolio = item.data(Qt.UserRole)
-            if portfolio and portfolio.id == portfolio_id:
-                self._list.setCurrentItem(item)
-                return portfolio
-        return None
+        entry = self._items_by_id.get(portfolio_id)
+        if entry is None:
+            return None
+        item = entry[0]
+        self._list.setCurrentItem(item)
+        return item.data(Qt.UserRole)
 
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         portfolio = item.data(Qt.UserRole)
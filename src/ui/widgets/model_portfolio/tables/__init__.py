@@ -1,3 +1,3 @@
-from .positions_table import PositionsTable
+from .positions_table import PositionsTable, PositionsTableModel
 
-__all__ = ["PositionsTable"]
+__all__ = ["PositionsTable", "PositionsTableModel"]
@@ -3,38 +3,153 @@
 PositionsTable — Pozisyon Tablosu Widget'ı
 
 Hisse bazlı pozisyon verilerini (lot, maliyet, güncel fiyat, K/Z)
-gösteren, renk kodlu QTableWidget bileşeni.
+gösteren, renk kodlu QTableView bileşeni. Veriler PositionsTableModel
+üzerinden sunulur; yalnızca görünen hücreler için data() çağrılır.
 
 Kullanım:
     table = PositionsTable()
     table.populate(positions_data)   # list[dict] veya liste
 """
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QTableView, QHeaderView
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
+from PyQt5.QtGui import QColor
 
+_PROFIT_COLOR = QColor(Qt.green)
+_LOSS_COLOR = QColor(Qt.red)
 
-class PositionsTable(QTableWidget):
+
+class PositionsTableModel(QAbstractTableModel):
+    """Pozisyon sözlüklerini satır olarak sunan salt okunur tablo modeli."""
+
+    COLUMNS = ["Hisse", "Lot", "Ort. Maliyet", "Güncel", "Değer", "K/Z"]
+    PL_COLUMN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list = []
+        self._display: list = []
+        self._fg: list = []
+
+    @classmethod
+    def prepare_rows(cls, positions: list) -> tuple:
+        """
+        Satırları, biçimlenmiş metinleri ve K/Z renklerini hazırlar.
+        Qt nesnesine dokunmadığı için arka plan thread'inde çağrılabilir.
+        """
+        rows = list(positions)
+        return rows, [cls._format_row(pos) for pos in rows], [cls._pl_color(pos) for pos in rows]
+
+    def set_rows(self, positions: list) -> None:
+        self.set_prepared_rows(self.prepare_rows(positions))
+
+    def set_prepared_rows(self, prepared: tuple) -> None:
+        # Metinler ve renkler bir kez hazırlanır; data() yalnızca indeksler
+        rows, display, fg = prepared
+
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows, self._display, self._fg = rows, display, fg
+            self.endResetModel()
+            return
+
+        # Satır sayısı aynıysa mevcut satırlar korunur; yalnızca değişen hücre aralığı boyanır
+        changed_rows = []
+        changed_cols = set()
+        for row, (old, new) in enumerate(zip(self._display, display)):
+            cols = [col for col, (a, b) in enumerate(zip(old, new)) if a != b]
+            if self._fg[row] is not fg[row]:
+                cols.append(self.PL_COLUMN)
+            if cols:
+                changed_rows.append(row)
+                changed_cols.update(cols)
+        self._rows, self._display, self._fg = rows, display, fg
+        if changed_rows:
+            self.dataChanged.emit(
+                self.index(changed_rows[0], min(changed_cols)),
+                self.index(changed_rows[-1], max(changed_cols)),
+                [Qt.DisplayRole, Qt.ForegroundRole],
+            )
+
+    @staticmethod
+    def _format_row(pos: dict) -> tuple:
+        name = pos.get("name") or ""
+        quantity = str(pos.get("quantity", ""))
+        avg_cost = f"₺ {pos['avg_cost']:.2f}"
+        if pos.get("current_price") is None:
+            return (name, quantity, avg_cost, "-", "-", "-")
+        return (
+            name,
+            quantity,
+            avg_cost,
+            f"₺ {pos['current_price']:.2f}",
+            f"₺ {pos['current_value']:,.2f}",
+            f"₺ {pos['profit_loss']:+,.2f}",
+        )
+
+    @staticmethod
+    def _pl_color(pos: dict):
+        if pos.get("current_price") is None:
+            return None
+        return _PROFIT_COLOR if pos["profit_loss"] >= 0 else _LOSS_COLOR
+
+    def has_priced_rows(self) -> bool:
+        """En az bir satırda güncel fiyat (ve dolayısıyla tüm sütunlar) dolu mu?"""
+        return any(color is not None for color in self._fg)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return QVariant()
+        return self.COLUMNS[section]
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        if role == Qt.DisplayRole:
+            return self._display[index.row()][index.column()]
+
+        if role == Qt.ForegroundRole and index.column() == self.PL_COLUMN:
+            color = self._fg[index.row()]
+            if color is not None:
+                return color
+        return QVariant()
+
+
+class PositionsTable(QTableView):
     """Portföy pozisyonlarını gösteren tablo bileşeni."""
 
-    _COLUMNS = ["Hisse", "Lot", "Ort. Maliyet", "Güncel", "Değer", "K/Z"]
+    _COLUMNS = PositionsTableModel.COLUMNS
+    # İlk sütun esnek, diğerleri içeriğe göre
+    _SECTION_MODES = (QHeaderView.Stretch,) + (QHeaderView.ResizeToContents,) * (len(_COLUMNS) - 1)
+    # ResizeToContents sütunları için ölçülecek en fazla satır sayısı
+    RESIZE_PRECISION_ROWS = 100
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._model = PositionsTableModel(self)
+        self.setModel(self._model)
+        self._column_widths_frozen = False
         self._setup_table()
 
     def _setup_table(self) -> None:
-        self.setColumnCount(len(self._COLUMNS))
-        self.setHorizontalHeaderLabels(self._COLUMNS)
+        header = self.horizontalHeader()
+        for col, mode in enumerate(self._SECTION_MODES):
+            header.setSectionResizeMode(col, mode)
+        # Genişlik hesabı tüm satırları değil, ilk RESIZE_PRECISION_ROWS satırı tarar
+        header.setResizeContentsPrecision(self.RESIZE_PRECISION_ROWS)
 
-        # İlk sütun esnek, diğerleri içeriğe göre
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        for col in range(1, len(self._COLUMNS)):
-            self.horizontalHeader().setSectionResizeMode(col, QHeaderView.ResizeToContents)
-
-        self.setSelectionBehavior(QTableWidget.SelectRows)
+        self.setSelectionBehavior(QTableView.SelectRows)
         self.setAlternatingRowColors(True)
         self.verticalHeader().setVisible(False)
-        self.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.setEditTriggers(QTableView.NoEditTriggers)
         self.setProperty("cssClass", "dataTable")
 
     def populate(self, positions: list) -> None:
@@ -46,28 +161,27 @@ class PositionsTable(QTableWidget):
                        name, quantity, avg_cost, current_price (None olabilir),
                        current_value, profit_loss
         """
-        self.setRowCount(0)
-
-        for i, pos in enumerate(positions):
-            self.insertRow(i)
-            self._set_readonly(i, 0, pos.get("name") or "")
-            self._set_readonly(i, 1, str(pos.get("quantity", "")))
-            self._set_readonly(i, 2, f"₺ {pos['avg_cost']:.2f}")
-
-            if pos.get("current_price") is not None:
-                self._set_readonly(i, 3, f"₺ {pos['current_price']:.2f}")
-                self._set_readonly(i, 4, f"₺ {pos['current_value']:,.2f}")
-
-                pl = pos["profit_loss"]
-                pl_item = QTableWidgetItem(f"₺ {pl:+,.2f}")
-                pl_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                pl_item.setForeground(Qt.green if pl >= 0 else Qt.red)
-                self.setItem(i, 5, pl_item)
-            else:
-                for col in (3, 4, 5):
-                    self._set_readonly(i, col, "-")
-
-    def _set_readonly(self, row: int, col: int, text: str) -> None:
-        item = QTableWidgetItem(text)
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        self.setItem(row, col, item)
+        self.populate_prepared(PositionsTableModel.prepare_rows(positions))
+
+    def populate_prepared(self, prepared: tuple) -> None:
+        """PositionsTableModel.prepare_rows çıktısını tabloya yazar."""
+        # Model sıfırlanırken ara boyama ve yeniden yerleşim yapılmaz
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_prepared_rows(prepared)
+        finally:
+            self.setUpdatesEnabled(True)
+        if not self._column_widths_frozen and self._model.has_priced_rows():
+            self._freeze_column_widths()
+
+    def _freeze_column_widths(self) -> None:
+        """
+        Fiyatlı ilk doldurmadan sonra sütun genişliklerini bir kez ölçüp
+        Interactive moda geçer; sonraki doldurmalarda hücreler yeniden ölçülmez.
+        """
+        header = self.horizontalHeader()
+        for col in range(1, len(self._COLUMNS)):
+            width = self.sizeHintForColumn(col)
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+            header.resizeSection(col, max(width, header.sectionSizeHint(col)))
+        self._column_widths_frozen = True
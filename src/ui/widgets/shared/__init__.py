@@ -1,5 +1,5 @@
 from .cards import InfoCard, MetricCard
-from .controls import ActionListItem, AnimatedButton
+from .controls import ActionListItem, AnimatedButton, spin_box_decimal
 from .feedback import Toast
 
-__all__ = ["ActionListItem", "AnimatedButton", "InfoCard", "MetricCard", "Toast"]
+__all__ = ["ActionListItem", "AnimatedButton", "InfoCard", "MetricCard", "Toast", "spin_box_decimal"]
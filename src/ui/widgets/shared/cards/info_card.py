@@ -74,8 +74,9 @@ class InfoCard(QFrame):
         self._lbl_title.setText(text)
 
     def set_value(self, text: str) -> None:
-        """Kart değerini günceller."""
-        self._lbl_value.setText(text)
+        """Kart değerini günceller. Metin aynıysa etiket yeniden çizilmez."""
+        if self._lbl_value.text() != text:
+            self._lbl_value.setText(text)
 
     def set_value_state(self, state: str) -> None:
         """
@@ -86,6 +87,9 @@ class InfoCard(QFrame):
         Args:
             state: 'positive' | 'negative' | 'neutral'
         """
+        # Aynı state için unpolish/polish (stil yeniden hesaplaması) atlanır
+        if self._lbl_value.property("cssState") == state:
+            return
         self._lbl_value.setProperty("cssState", state)
         self._lbl_value.style().unpolish(self._lbl_value)
         self._lbl_value.style().polish(self._lbl_value)
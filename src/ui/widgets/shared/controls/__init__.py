@@ -1,4 +1,5 @@
 from .action_list_item import ActionListItem
 from .animated_button import AnimatedButton
+from .spin_decimal import spin_box_decimal
 
-__all__ = ["ActionListItem", "AnimatedButton"]
+__all__ = ["ActionListItem", "AnimatedButton", "spin_box_decimal"]
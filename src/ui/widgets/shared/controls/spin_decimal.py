@@ -0,0 +1,20 @@
+# src/ui/widgets/shared/controls/spin_decimal.py
+"""
+QDoubleSpinBox değerini Decimal'e çeviren yardımcı.
+
+Spin box değeri zaten decimals() basamağına yuvarlanmıştır; tamsayıya
+ölçeklenip Decimal üssüyle geri kaydırılır. float → str → Decimal
+ayrıştırması ve yerel ayara bağlı metin işleme gerekmez.
+
+Kullanım:
+    price = spin_box_decimal(self.spin_price)   # Decimal("12.35")
+"""
+from decimal import Decimal
+
+from PyQt5.QtWidgets import QDoubleSpinBox
+
+
+def spin_box_decimal(spin_box: QDoubleSpinBox) -> Decimal:
+    """Spin box değerini, basamak sayısı sabit bir Decimal olarak döner."""
+    decimals = spin_box.decimals()
+    return Decimal(round(spin_box.value() * 10 ** decimals)).scaleb(-decimals)
@@ -1,9 +1,13 @@
+import threading
 from datetime import date
 from decimal import Decimal
 
 import pytest
 
 from src.application.services.analysis import AnalysisFilterState, AnalysisService
+from src.application.services.analysis import portfolio_series_builder
+from src.application.services.analysis.benchmark_service import AnalysisBenchmarkService
+from src.application.services.analysis.portfolio_series_builder import PortfolioSeriesBuilder
 from src.domain.models.daily_price import DailyPrice
 from src.domain.models.stock import Stock
 from src.domain.models.trade import Trade
@@ -20,6 +24,17 @@ class FakePortfolioRepo:
 class FakePriceRepo:
     def __init__(self, prices_by_stock):
         self._prices_by_stock = prices_by_stock
+        self.series_calls = 0
+        self.last_price_calls = 0
+
+    def get_portfolio_value_series(self, stock_ids, start_date, end_date):
+        self.series_calls += 1
+        result = {}
+        for stock_id in stock_ids:
+            for point_date, price in self._prices_by_stock.get(stock_id, {}).items():
+                if start_date <= point_date <= end_date:
+                    result.setdefault(point_date, {})[stock_id] = price
+        return result
 
     def get_price_series(self, stock_id, start_date, end_date):
         return [
@@ -39,15 +54,30 @@ class FakePriceRepo:
         last_date, last_price = sorted(eligible)[-1]
         return DailyPrice(id=None, stock_id=stock_id, price_date=last_date, close_price=last_price)
 
+    def get_last_prices_before(self, stock_ids, price_date):
+        self.last_price_calls += 1
+        result = {}
+        for stock_id in stock_ids:
+            eligible = sorted(
+                (point_date, price)
+                for point_date, price in self._prices_by_stock.get(stock_id, {}).items()
+                if point_date <= price_date
+            )
+            if eligible:
+                result[stock_id] = eligible[-1][1]
+        return result
+
 
 class FakeStockRepo:
     def __init__(self, stocks):
         self._stocks = stocks
+        self.ticker_map_calls = 0
 
     def get_all_stocks(self):
         return list(self._stocks)
 
     def get_ticker_map_for_stock_ids(self, stock_ids):
+        self.ticker_map_calls += 1
         return {stock.id: stock.ticker for stock in self._stocks if stock.id in stock_ids}
 
 
@@ -155,6 +185,81 @@ def test_comparison_view_builds_deposit_benchmark_series(monkeypatch, analysis_s
     assert values[2] > values[1]
 
 
+def test_price_series_are_loaded_with_a_single_batched_query():
+    trades = [
+        Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("100")),
+        Trade.create_buy(stock_id=2, trade_date=date(2026, 1, 1), quantity=5, price=Decimal("20")),
+    ]
+    price_repo = FakePriceRepo({
+        1: {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")},
+        2: {date(2026, 1, 1): Decimal("20"), date(2026, 1, 2): Decimal("22")},
+    })
+    service = AnalysisService(
+        portfolio_repo=FakePortfolioRepo(trades),
+        price_repo=price_repo,
+        stock_repo=FakeStockRepo([Stock(id=1, ticker="AKBNK"), Stock(id=2, ticker="ASELS")]),
+        market_data_client=FakeMarketDataClient({}),
+    )
+    filter_state = AnalysisFilterState(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 2),
+        selected_benchmarks=[],
+        portfolio_source="dashboard",
+    )
+
+    risk_view = service.get_allocation_risk_view(filter_state)
+
+    assert price_repo.series_calls == 1
+    assert price_repo.last_price_calls == 1
+    assert {item.label: item.current_value for item in risk_view.items} == {"AKBNK": 1100.0, "ASELS": 110.0}
+
+
+def test_ticker_map_is_memoized_until_caches_are_invalidated():
+    trades = [
+        Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("100")),
+    ]
+    stock_repo = FakeStockRepo([Stock(id=1, ticker="AKBNK")])
+    service = AnalysisService(
+        portfolio_repo=FakePortfolioRepo(trades),
+        price_repo=FakePriceRepo({1: {date(2026, 1, 1): Decimal("100")}}),
+        stock_repo=stock_repo,
+        market_data_client=FakeMarketDataClient({}),
+    )
+    filter_state = AnalysisFilterState(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 2),
+        selected_benchmarks=[],
+        portfolio_source="dashboard",
+    )
+
+    service.get_overview(filter_state)
+    service.get_allocation_risk_view(filter_state)
+    assert stock_repo.ticker_map_calls == 1
+
+    assert service.get_stock_map_for_source("dashboard") == {1: "AKBNK"}
+    assert stock_repo.ticker_map_calls == 1
+
+    service.invalidate_caches()
+    service.get_overview(filter_state)
+    assert stock_repo.ticker_map_calls == 2
+
+
+def test_ticker_map_cache_expires_after_ttl(monkeypatch):
+    stock_repo = FakeStockRepo([Stock(id=1, ticker="AKBNK")])
+    builder = PortfolioSeriesBuilder(price_repo=FakePriceRepo({}), stock_repo=stock_repo)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(portfolio_series_builder, "monotonic", lambda: clock["now"])
+
+    builder.get_ticker_map([1])
+    clock["now"] += PortfolioSeriesBuilder.TICKER_MAP_TTL_SECONDS - 1
+    builder.get_ticker_map([1])
+    assert stock_repo.ticker_map_calls == 1
+
+    clock["now"] += 1
+    builder.get_ticker_map([1])
+    assert stock_repo.ticker_map_calls == 2
+
+
 def test_missing_price_data_creates_warning():
     trades = [
         Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("100")),
@@ -258,6 +363,20 @@ def test_gold_benchmark_can_be_composed_from_gold_and_usd_series():
     assert market_client.requested_tickers[:3] == ["XAUTRY=X", "XAUUSD=X", "TRY=X"]
 
 
+def test_multiple_benchmarks_keep_selection_order(analysis_service):
+    filter_state = AnalysisFilterState(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 3),
+        selected_benchmarks=["usd", "bist100", "deposit"],
+        portfolio_source="dashboard",
+    )
+
+    comparison = analysis_service.get_comparison_view(filter_state)
+
+    assert [series.code for series in comparison.benchmark_series] == ["usd", "bist100", "deposit"]
+    assert comparison.warnings == []
+
+
 def test_invalid_date_range_raises_value_error(analysis_service):
     filter_state = AnalysisFilterState(
         start_date=date(2026, 1, 5),
@@ -282,6 +401,33 @@ def test_page_payload_contains_all_sections(analysis_service):
     assert set(payload.keys()) == {"overview", "comparison", "risk"}
 
 
+def test_page_payload_builds_the_analysis_bundle_once():
+    trades = [
+        Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("100")),
+    ]
+    price_repo = FakePriceRepo({1: {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")}})
+    market_client = FakeMarketDataClient({"XU100.IS": {date(2026, 1, 1): Decimal("100")}})
+    service = AnalysisService(
+        portfolio_repo=FakePortfolioRepo(trades),
+        price_repo=price_repo,
+        stock_repo=FakeStockRepo([Stock(id=1, ticker="AKBNK")]),
+        market_data_client=market_client,
+    )
+    filter_state = AnalysisFilterState(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 2),
+        selected_benchmarks=["bist100"],
+        portfolio_source="dashboard",
+    )
+
+    payload = service.get_page_payload(filter_state)
+
+    assert price_repo.last_price_calls == 1
+    assert price_repo.series_calls == 1
+    assert market_client.requested_tickers == ["XU100.IS"]
+    assert payload["risk"].items[0].current_value == 1100.0
+
+
 def test_empty_benchmark_selection_disables_benchmark_series(analysis_service):
     filter_state = AnalysisFilterState(
         start_date=date(2026, 1, 1),
@@ -297,3 +443,69 @@ def test_empty_benchmark_selection_disables_benchmark_series(analysis_service):
     assert comparison.benchmark_series == []
     assert comparison.comparison_metrics == []
     assert overview.benchmark_gap_pct is None
+
+
+def test_benchmark_series_serves_narrower_ranges_from_cache():
+    market_client = FakeMarketDataClient({
+        "XU100.IS": {
+            date(2026, 1, 1): Decimal("100"),
+            date(2026, 1, 2): Decimal("105"),
+            date(2026, 1, 3): Decimal("110"),
+        },
+    })
+    benchmark_service = AnalysisBenchmarkService(market_data_client=market_client)
+
+    benchmark_service.build_benchmark_series(date(2026, 1, 1), date(2026, 1, 3), ["bist100"])
+    narrowed, _ = benchmark_service.build_benchmark_series(date(2026, 1, 2), date(2026, 1, 3), ["bist100"])
+
+    assert market_client.requested_tickers == ["XU100.IS"]
+    assert narrowed[0].points == {date(2026, 1, 2): Decimal("105"), date(2026, 1, 3): Decimal("110")}
+
+    benchmark_service.clear_cache()
+    benchmark_service.build_benchmark_series(date(2026, 1, 2), date(2026, 1, 3), ["bist100"])
+
+    assert market_client.requested_tickers == ["XU100.IS", "XU100.IS"]
+
+
+def test_benchmark_cache_keeps_multiple_ranges_per_ticker():
+    market_client = FakeMarketDataClient({
+        "XU100.IS": {
+            date(2026, 1, 1): Decimal("100"),
+            date(2026, 2, 1): Decimal("105"),
+            date(2026, 3, 1): Decimal("110"),
+        },
+    })
+    benchmark_service = AnalysisBenchmarkService(market_data_client=market_client)
+
+    benchmark_service.build_benchmark_series(date(2026, 1, 1), date(2026, 1, 31), ["bist100"])
+    benchmark_service.build_benchmark_series(date(2026, 2, 1), date(2026, 3, 1), ["bist100"])
+    benchmark_service.build_benchmark_series(date(2026, 1, 1), date(2026, 1, 31), ["bist100"])
+    benchmark_service.build_benchmark_series(date(2026, 3, 1), date(2026, 3, 1), ["bist100"])
+
+    assert market_client.requested_tickers == ["XU100.IS", "XU100.IS"]
+
+
+def test_market_benchmarks_are_fetched_concurrently():
+    barrier = threading.Barrier(2, timeout=2)
+
+    class BarrierMarketDataClient(FakeMarketDataClient):
+        def get_price_series(self, ticker, start_date, end_date):
+            # Iki benchmark ayni anda beklemezse bariyer zaman asimina ugrar.
+            barrier.wait()
+            return super().get_price_series(ticker, start_date, end_date)
+
+    market_client = BarrierMarketDataClient({
+        "XU100.IS": {date(2026, 1, 1): Decimal("100")},
+        "TRY=X": {date(2026, 1, 1): Decimal("43")},
+    })
+    benchmark_service = AnalysisBenchmarkService(market_data_client=market_client)
+
+    series, warnings = benchmark_service.build_benchmark_series(
+        date(2026, 1, 1),
+        date(2026, 1, 1),
+        ["bist100", "usd", "deposit"],
+    )
+
+    assert [item.code for item in series] == ["bist100", "usd", "deposit"]
+    assert warnings == []
+    assert sorted(market_client.requested_tickers) == ["TRY=X", "XU100.IS"]
@@ -44,6 +44,9 @@ class FakeModelPortfolioRepo:
     def count_trades_by_portfolio_id(self, portfolio_id):
         return len(self.trades.get(portfolio_id, []))
 
+    def count_trades_by_portfolio_ids(self, portfolio_ids):
+        return {portfolio_id: len(self.trades.get(portfolio_id, [])) for portfolio_id in portfolio_ids}
+
     def create_model_portfolio(self, portfolio):
         return portfolio
 
@@ -107,6 +110,24 @@ def test_model_portfolio_service_returns_positions_with_details():
     assert positions[0]["profit_loss"] == Decimal("16")
 
 
+def test_model_portfolio_service_counts_trades_for_many_portfolios():
+    service = ModelPortfolioService(FakeModelPortfolioRepo(), FakeStockRepo())
+
+    counts = service.get_trade_counts_bulk([1, 2])
+
+    assert counts == {1: 2, 2: 0}
+
+
+def test_model_portfolio_overview_matches_separate_queries():
+    service = ModelPortfolioService(FakeModelPortfolioRepo(), FakeStockRepo())
+    price_map = {10: Decimal("12")}
+
+    summary, positions = service.get_portfolio_overview(1, price_map=price_map)
+
+    assert summary == service.get_portfolio_summary(1, price_map=price_map)
+    assert positions == service.get_positions_with_details(1, price_map=price_map)
+
+
 class FakePortfolioService:
     def __init__(self):
         self.saved_trades = []
@@ -4,7 +4,6 @@ from datetime import date
 from decimal import Decimal
 
 from src.application.services.portfolio.portfolio_service import PortfolioService
-from src.domain.models.trade import Trade
 
 @pytest.fixture
 def mock_portfolio_repo():
@@ -20,11 +19,7 @@ def portfolio_service(mock_portfolio_repo, mock_price_repo):
 
 def test_calculate_capital_with_profit(portfolio_service, mock_portfolio_repo):
     # Senaryo: 10 lot hisseyi 10 TL'den alıp 15 TL'den satmak
-    trades = [
-        Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("10.0")),
-        Trade.create_sell(stock_id=1, trade_date=date(2026, 1, 2), quantity=10, price=Decimal("15.0")),
-    ]
-    mock_portfolio_repo.get_all_trades.return_value = trades
+    mock_portfolio_repo.get_trade_cash_balance.return_value = Decimal("150.0") - Decimal("100.0")
     
     capital = portfolio_service.calculate_capital()
     
@@ -33,12 +28,16 @@ def test_calculate_capital_with_profit(portfolio_service, mock_portfolio_repo):
 
 def test_calculate_capital_negative_balance_returns_zero(portfolio_service, mock_portfolio_repo):
     # Senaryo: Henüz sadece alış yapılmış (Nakit sermaye hesabı eksiye düşmeyeceği için sıfır dönmeli)
-    trades = [
-        Trade.create_buy(stock_id=1, trade_date=date(2026, 1, 1), quantity=10, price=Decimal("10.0")),
-    ]
-    mock_portfolio_repo.get_all_trades.return_value = trades
+    mock_portfolio_repo.get_trade_cash_balance.return_value = Decimal("-100.0")
     
     capital = portfolio_service.calculate_capital()
     
     # -100 TL nakit hesapta max(0, capital) -> 0 dönmeli
     assert capital == Decimal("0.0")
+    mock_portfolio_repo.get_all_trades.assert_not_called()
+
+def test_get_first_trade_date_uses_repository_aggregate(portfolio_service, mock_portfolio_repo):
+    mock_portfolio_repo.get_first_trade_date.return_value = date(2025, 3, 14)
+
+    assert portfolio_service.get_first_trade_date() == date(2025, 3, 14)
+    mock_portfolio_repo.get_all_trades.assert_not_called()
@@ -10,7 +10,10 @@ class FakePortfolioRepo:
     def __init__(self, trades):
         self._trades = trades
 
+        self.get_all_trades_calls = 0
+
     def get_all_trades(self):
+        self.get_all_trades_calls += 1
         return list(self._trades)
 
 
@@ -34,6 +37,13 @@ class FakePriceRepo:
             close_price=price,
         )
 
+    def get_last_prices_before(self, stock_ids, price_date):
+        return {
+            stock_id: self._latest_prices[stock_id][1]
+            for stock_id in stock_ids
+            if stock_id in self._latest_prices
+        }
+
 
 def test_compute_portfolio_value_uses_latest_price_when_value_date_is_missing():
     trades = [
@@ -80,3 +90,46 @@ def test_compute_portfolio_value_keeps_exact_price_when_available():
 
     assert snapshot.price_map == {1: Decimal("13")}
     assert snapshot.total_value == Decimal("130")
+
+
+def test_compute_period_returns_matches_weekly_and_monthly_with_single_trade_read():
+    trades = [
+        Trade.create_buy(
+            stock_id=1,
+            trade_date=date(2026, 3, 1),
+            quantity=10,
+            price=Decimal("10"),
+        )
+    ]
+    portfolio_repo = FakePortfolioRepo(trades)
+    service = ReturnCalcService(
+        portfolio_repo=portfolio_repo,
+        price_repo=FakePriceRepo(
+            prices_for_date={
+                date(2026, 4, 24): {1: Decimal("15")},
+                date(2026, 4, 17): {1: Decimal("12")},
+                date(2026, 3, 25): {1: Decimal("10")},
+            },
+            latest_prices={},
+        ),
+    )
+
+    rates = service.compute_period_returns(date(2026, 4, 24), (7, 30))
+
+    assert portfolio_repo.get_all_trades_calls == 1
+    assert rates[7] == service.compute_weekly_return(date(2026, 4, 24))[0] == Decimal("0.25")
+    assert rates[30] == service.compute_monthly_return(date(2026, 4, 24))[0] == Decimal("0.5")
+
+
+class FailingPriceRepo:
+    def __getattr__(self, name):
+        raise AssertionError(f"price repo should not be queried: {name}")
+
+
+def test_compute_period_returns_skips_price_lookups_for_empty_portfolio():
+    service = ReturnCalcService(
+        portfolio_repo=FakePortfolioRepo([]),
+        price_repo=FailingPriceRepo(),
+    )
+
+    assert service.compute_period_returns(date(2026, 4, 24), (7, 30)) == {7: None, 30: None}
@@ -0,0 +1,85 @@
+import json
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.infrastructure.market_data import price_series_cache
+from src.infrastructure.market_data.price_series_cache import PriceSeriesFileCache
+
+
+def test_price_series_cache_round_trips_series(tmp_path):
+    cache = PriceSeriesFileCache(tmp_path)
+    series = {date(2026, 1, 1): Decimal("12345.67"), date(2026, 1, 2): Decimal("12400.01")}
+
+    cache.set("XU100.IS", date(2026, 1, 1), date(2026, 1, 2), series)
+
+    assert cache.get("xu100.is", date(2026, 1, 1), date(2026, 1, 2)) == series
+    assert cache.get("XU100.IS", date(2026, 1, 1), date(2026, 1, 3)) is None
+
+
+def test_price_series_cache_drops_expired_entries(tmp_path, monkeypatch):
+    cache = PriceSeriesFileCache(tmp_path)
+    cache.set("TRY=X", date(2026, 1, 1), date(2026, 1, 2), {date(2026, 1, 1): Decimal("35.1")})
+
+    ttl = PriceSeriesFileCache.ttl_for(date(2026, 1, 2))
+    expired_at = time.time() + ttl + 1
+    monkeypatch.setattr(price_series_cache.time, "time", lambda: expired_at)
+
+    assert cache.get("TRY=X", date(2026, 1, 1), date(2026, 1, 2)) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_price_series_cache_ttl_follows_range_age():
+    today = date(2026, 3, 10)
+
+    assert PriceSeriesFileCache.ttl_for(today, today) == PriceSeriesFileCache.INTRADAY_TTL_SECONDS
+    assert PriceSeriesFileCache.ttl_for(today - timedelta(days=2), today) == PriceSeriesFileCache.RECENT_TTL_SECONDS
+    assert PriceSeriesFileCache.ttl_for(today - timedelta(days=30), today) == PriceSeriesFileCache.HISTORICAL_TTL_SECONDS
+
+
+def test_price_series_cache_stores_plain_json(tmp_path):
+    cache = PriceSeriesFileCache(tmp_path)
+    cache.set("XU100.IS", date(2026, 1, 1), date(2026, 1, 1), {date(2026, 1, 1): Decimal("12345.67")})
+
+    (path,) = tmp_path.iterdir()
+    entry = json.loads(path.read_text(encoding="utf-8"))
+
+    assert path.suffix == ".json"
+    assert entry["series"] == {"2026-01-01": "12345.67"}
+
+
+def test_price_series_cache_sweeps_expired_and_foreign_files_on_startup(tmp_path, monkeypatch):
+    cache = PriceSeriesFileCache(tmp_path)
+    cache.set("TRY=X", date(2026, 1, 1), date(2026, 1, 2), {date(2026, 1, 1): Decimal("35.1")})
+    cache.set("XU100.IS", date(2026, 1, 1), date.today(), {date(2026, 1, 1): Decimal("100")})
+    (tmp_path / "legacy.pkl").write_bytes(b"not trusted")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+    expired_at = time.time() + PriceSeriesFileCache.INTRADAY_TTL_SECONDS + 1
+    monkeypatch.setattr(price_series_cache.time, "time", lambda: expired_at)
+    reopened = PriceSeriesFileCache(tmp_path)
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert reopened.get("TRY=X", date(2026, 1, 1), date(2026, 1, 2)) == {date(2026, 1, 1): Decimal("35.1")}
+
+
+def test_price_series_cache_caps_entry_count_on_startup(tmp_path, monkeypatch):
+    monkeypatch.setattr(PriceSeriesFileCache, "MAX_ENTRIES", 2)
+    cache = PriceSeriesFileCache(tmp_path)
+    clock = iter([100.0, 200.0, 300.0])
+    monkeypatch.setattr(price_series_cache.time, "time", lambda: next(clock, 400.0))
+    for day in (1, 2, 3):
+        cache.set("TRY=X", date(2026, 1, day), date(2026, 1, day), {date(2026, 1, day): Decimal(day)})
+
+    reopened = PriceSeriesFileCache(tmp_path)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert reopened.get("TRY=X", date(2026, 1, 1), date(2026, 1, 1)) is None
+    assert reopened.get("TRY=X", date(2026, 1, 3), date(2026, 1, 3)) == {date(2026, 1, 3): Decimal("3")}
+
+
+def test_default_cache_dir_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setattr(price_series_cache.sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert price_series_cache.default_cache_dir() == tmp_path / "portfoy" / "prices"
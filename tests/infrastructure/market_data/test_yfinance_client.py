@@ -26,7 +26,7 @@ def test_get_price_series_uses_countryeconomy_for_bist_without_yfinance(monkeypa
     monkeypatch.setattr(client, "_request_text", fake_request_text)
     monkeypatch.setattr(
         client,
-        "_download_dataframe",
+        "_history_dataframe",
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("yfinance cagrilmamaliydi")),
     )
     monkeypatch.setattr(
@@ -70,7 +70,7 @@ def test_get_price_series_uses_exchange_rates_for_usdtry_without_yfinance(monkey
     monkeypatch.setattr(client, "_request_text", lambda url: year_html)
     monkeypatch.setattr(
         client,
-        "_download_dataframe",
+        "_history_dataframe",
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("yfinance cagrilmamaliydi")),
     )
     monkeypatch.setattr(
@@ -130,7 +130,7 @@ def test_get_price_series_builds_xautry_from_gold_and_usd_sources(monkeypatch):
     monkeypatch.setattr(client, "_request_json", fake_request_json)
     monkeypatch.setattr(
         client,
-        "_download_dataframe",
+        "_history_dataframe",
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("yfinance cagrilmamaliydi")),
     )
     monkeypatch.setattr(
@@ -159,7 +159,7 @@ def test_countryeconomy_month_cache_is_reused(monkeypatch):
     monkeypatch.setattr(client, "_request_text", fake_request_text)
     monkeypatch.setattr(
         client,
-        "_download_dataframe",
+        "_history_dataframe",
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("yfinance cagrilmamaliydi")),
     )
 
@@ -168,3 +168,31 @@ def test_countryeconomy_month_cache_is_reused(monkeypatch):
 
     assert first == second == {date(2026, 1, 1): Decimal("12345.67")}
     assert counter["count"] == 1
+
+
+def test_get_price_series_flattens_multiindex_close_column(monkeypatch):
+    client = YFinanceMarketDataClient()
+    index = pd.to_datetime(["2026-01-01", "2026-01-02"])
+    columns = pd.MultiIndex.from_tuples([("Close", "THYAO.IS"), ("Open", "THYAO.IS")])
+    dataframe = pd.DataFrame([[300.5, 299.0], [float("nan"), 301.0]], index=index, columns=columns)
+
+    monkeypatch.setattr(client._investing_client, "fetch_series_for_ticker", lambda *args, **kwargs: {})
+    monkeypatch.setattr(client, "_history_dataframe", lambda *args, **kwargs: dataframe)
+
+    series = client.get_price_series("THYAO.IS", date(2026, 1, 1), date(2026, 1, 2))
+
+    assert series == {date(2026, 1, 1): Decimal("300.5")}
+
+
+def test_get_price_series_does_not_wait_for_batched_download_lock(monkeypatch):
+    client = YFinanceMarketDataClient()
+    index = pd.to_datetime(["2026-01-01"])
+    dataframe = pd.DataFrame({"Close": [300.5]}, index=index)
+
+    monkeypatch.setattr(client._investing_client, "fetch_series_for_ticker", lambda *args, **kwargs: {})
+    monkeypatch.setattr(client, "_history_dataframe", lambda *args, **kwargs: dataframe)
+
+    with client._download_lock:
+        series = client.get_price_series("THYAO.IS", date(2026, 1, 1), date(2026, 1, 1))
+
+    assert series == {date(2026, 1, 1): Decimal("300.5")}
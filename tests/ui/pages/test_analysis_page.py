@@ -3,16 +3,17 @@ from datetime import date
 from decimal import Decimal
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 pytest.importorskip("PyQt5")
-from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtCore import QDate, QEvent, Qt
 from PyQt5.QtGui import QMouseEvent
 from PyQt5.QtWidgets import QApplication, QGridLayout, QSizePolicy
 
-from src.application.services.analysis import ComparisonViewDTO
+from src.application.services.analysis import ComparisonViewDTO, PortfolioOption
 from src.ui.pages.analysis import AnalysisPage
-from src.ui.pages.analysis.analysis_chart_engine import AnalysisChartEngine
+from src.ui.pages.analysis.analysis_chart_engine import AnalysisChartEngine, PieChartWidget
 from src.ui.pages.analysis.analysis_comparison_section import AnalysisComparisonSection
 from src.ui.pages.analysis.analysis_control_panel import AnalysisControlPanel
 from src.ui.pages.analysis.analysis_overview_section import AnalysisOverviewSection
@@ -39,6 +40,16 @@ class DummyAnalysisService:
     def get_benchmark_definitions(self):
         return []
 
+    def get_source_context(self, source):
+        return {
+            "stock_map": self.get_stock_map_for_source(source),
+            "first_trade_date": self.get_first_trade_date_for_source(source),
+            "portfolio_options": self.get_portfolio_options(),
+        }
+
+    def get_page_payload(self, filter_state):
+        return {"overview": None, "comparison": None, "risk": None}
+
 
 class DummyPortfolioService:
     def get_first_trade_date(self):
@@ -59,6 +70,121 @@ def test_analysis_page_has_three_primary_tabs():
     assert page.tabs.tabText(2) == "Da\u011f\u0131l\u0131m & Risk"
 
 
+def test_analysis_page_debounces_filter_change_bursts():
+    container = SimpleNamespace(
+        analysis_service=DummyAnalysisService(),
+        portfolio_service=DummyPortfolioService(),
+    )
+
+    page = AnalysisPage(container=container)
+    for _ in range(5):
+        page.control_panel.filter_changed.emit()
+
+    assert page._request_seq == 0
+    assert page._refresh_timer.isActive() is True
+    assert page._refresh_timer.isSingleShot() is True
+
+
+def test_analysis_page_coalesces_refreshes_while_a_request_is_in_flight():
+    container = SimpleNamespace(
+        analysis_service=DummyAnalysisService(),
+        portfolio_service=DummyPortfolioService(),
+    )
+
+    page = AnalysisPage(container=container)
+    started = []
+    page.threadpool.start = started.append
+
+    page._request_refresh()
+    page._request_refresh()
+    page._request_refresh()
+
+    assert len(started) == 1
+    assert page._refresh_pending is True
+
+    page._on_payload_finished(1)
+
+    assert len(started) == 2
+    assert page._request_seq == 2
+    assert page._refresh_pending is False
+
+
+def test_analysis_page_clears_loading_when_pending_refresh_has_invalid_range():
+    container = SimpleNamespace(
+        analysis_service=DummyAnalysisService(),
+        portfolio_service=DummyPortfolioService(),
+    )
+
+    page = AnalysisPage(container=container)
+    started = []
+    page.threadpool.start = started.append
+
+    page._request_refresh()
+    assert page.btn_refresh.isEnabled() is False
+
+    page.control_panel.date_end.setDate(QDate(2024, 1, 1))
+    page.control_panel.date_start.setDate(QDate(2024, 2, 1))
+    page._request_refresh()
+    page._on_payload_finished(1)
+
+    assert len(started) == 1
+    assert page._refresh_pending is False
+    assert page._payload_in_flight is False
+    assert page.btn_refresh.isEnabled() is True
+    assert page.btn_refresh.text() == "Analizi Yenile"
+    assert page.warning_banner.isHidden() is False
+
+
+def test_analysis_page_applies_only_the_latest_source_context():
+    container = SimpleNamespace(
+        analysis_service=DummyAnalysisService(),
+        portfolio_service=DummyPortfolioService(),
+    )
+
+    page = AnalysisPage(container=container)
+    page.threadpool.start = lambda worker: None
+    page._sync_source_context()
+    page._sync_source_context()
+
+    page._on_source_context_ready(1, {"stock_map": {1: "ASELS.IS"}, "first_trade_date": None, "portfolio_options": []})
+
+    assert page._context_pending is True
+    assert page.control_panel.stock_combo.model().rowCount() == 0
+
+    page._on_source_context_ready(2, {"stock_map": {2: "THYAO.IS"}, "first_trade_date": None, "portfolio_options": []})
+
+    assert page._context_pending is False
+    assert page.control_panel.stock_combo.model().item(0).text() == "THYAO.IS"
+
+
+def test_analysis_page_fills_portfolio_options_from_background_source_context():
+    class CountingAnalysisService(DummyAnalysisService):
+        option_calls = 0
+
+        def get_portfolio_options(self):
+            self.option_calls += 1
+            return []
+
+    service = CountingAnalysisService()
+    page = AnalysisPage(container=SimpleNamespace(analysis_service=service, portfolio_service=DummyPortfolioService()))
+    page.threadpool.start = lambda worker: None
+
+    page.refresh_data()
+
+    assert service.option_calls == 0
+    assert page.control_panel.combo_portfolio.count() == 0
+
+    options = [
+        PortfolioOption(code="dashboard", label="Ana Portfoy", kind="dashboard"),
+        PortfolioOption(code="model:1", label="Model", kind="model"),
+    ]
+    page._on_source_context_ready(1, {"stock_map": {}, "first_trade_date": None, "portfolio_options": options})
+
+    assert page.control_panel.combo_portfolio.count() == 2
+    assert page.control_panel.selected_portfolio_source() == "dashboard"
+    assert page._context_pending is False
+
+
 def test_analysis_page_keeps_filter_panel_in_a_full_height_right_column():
     container = SimpleNamespace(
         analysis_service=DummyAnalysisService(),
@@ -236,7 +362,8 @@ def test_chart_engine_trims_leading_zero_points_for_normalized_series():
 
     series = chart._prepared_series[0]
     assert series.trimmed_points == 1
-    assert series.y_values == [100.0, 150.0]
+    assert series.y_values.tolist() == [100.0, 150.0]
+    assert series.y_values.dtype == np.float32
     assert len(series.x_values) == 2
     assert "başlangıç noktası kırpıldı" in chart.lbl_summary.text()
 
@@ -332,3 +459,131 @@ def test_comparison_section_can_draw_stocks_without_portfolio_series():
     assert kwargs["title"] == "Seçili Hisseler Karşılaştırması"
     assert list(kwargs["series_map"].keys()) == ["ASELS.IS", "THYAO.IS"]
     assert "Ana Portföy" not in kwargs["series_map"]
+
+
+def test_checkable_combo_box_set_items_keeps_existing_rows_and_checks():
+    combo = CheckableComboBox()
+    combo.set_items([("ASELS.IS", "1"), ("THYAO.IS", "2")])
+    model = combo.model()
+    kept_item = model.item(1)
+    kept_item.setCheckState(Qt.Checked)
+
+    combo.set_items([("AKBNK.IS", "3"), ("THYAO.IS", "2")])
+
+    assert [model.item(row).data(Qt.UserRole) for row in range(model.rowCount())] == ["3", "2"]
+    assert model.item(1) is kept_item
+    assert combo.selected_data() == ["2"]
+
+
+def test_pie_widget_precomputes_slices_when_data_changes():
+    widget = PieChartWidget()
+    widget.set_data("Dağılım", [("THYAO.IS", 75.0), ("AKBNK", 25.0)])
+
+    slices = widget._slices
+
+    assert [pie_slice.start_angle for pie_slice in slices] == [90 * 16, 90 * 16 - 270 * 16]
+    assert [pie_slice.span for pie_slice in slices] == [-270 * 16, -90 * 16]
+    assert slices[1].label == "AKBNK\n%25.0"
+
+    widget.set_empty("Veri yok")
+
+    assert widget._slices == []
+
+
+def test_chart_engine_reuses_legend_labels_between_draws():
+    chart = AnalysisChartEngine(show_toolbar=False)
+    series_map = {
+        "Portföy": {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")},
+        "BIST 100": {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("104")},
+    }
+
+    chart.draw_line_series("Karşılaştırma", "Değer", series_map)
+    first_labels = [chart.legend_layout.itemAt(idx).widget() for idx in range(chart.legend_layout.count())]
+    chart.draw_line_series("Karşılaştırma", "Değer", series_map)
+    second_labels = [chart.legend_layout.itemAt(idx).widget() for idx in range(chart.legend_layout.count())]
+
+    assert len(second_labels) == 2
+    assert second_labels == first_labels
+
+
+def test_chart_engine_enables_peak_downsampling_for_line_series():
+    chart = AnalysisChartEngine(show_toolbar=False)
+    series_map = {
+        "Portföy": {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")},
+    }
+
+    chart.draw_line_series("Karşılaştırma", "Değer", series_map)
+    plot_item = chart.plot_widget.getPlotItem()
+
+    assert plot_item.downsampleMode()[1:] == (True, "peak")
+    assert plot_item.clipToViewMode() is True
+    assert chart._plot_items[0].opts["autoDownsample"] is True
+
+
+def test_chart_engine_reuses_prepared_arrays_for_same_series():
+    chart = AnalysisChartEngine(show_toolbar=False)
+    points = {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")}
+
+    chart.draw_line_series("Karşılaştırma", "Değer", {"Portföy": points}, normalize=True)
+    first_values = chart._prepared_series[0].y_values
+    chart.draw_line_series("Karşılaştırma", "Değer", {"Portföy": points, "BIST 100": dict(points)}, normalize=True)
+
+    assert chart._prepared_series[0].y_values is first_values
+
+    chart.clear_series_cache()
+    chart.draw_line_series("Karşılaştırma", "Değer", {"Portföy": points}, normalize=True)
+
+    assert chart._prepared_series[0].y_values is not first_values
+    assert chart._prepared_series[0].y_values.tolist() == [100.0, 110.0]
+
+
+def test_chart_engine_nearest_points_picks_closest_sample():
+    chart = AnalysisChartEngine(show_toolbar=False)
+    series_map = {
+        "Portföy": {
+            date(2026, 1, 1): Decimal("100"),
+            date(2026, 1, 2): Decimal("110"),
+            date(2026, 1, 3): Decimal("120"),
+        },
+    }
+    chart.draw_line_series("Karşılaştırma", "Değer", series_map)
+    x_values = chart._prepared_series[0].x_values
+
+    assert chart._nearest_points(float(x_values[0]) - 10_000)[0][2] == 100.0
+    assert chart._nearest_points(float(x_values[1]) + 60)[0][2] == 110.0
+    assert chart._nearest_points(float(x_values[2]) - 60)[0][2] == 120.0
+    assert chart._nearest_points(float(x_values[2]) + 10_000)[0][2] == 120.0
+
+
+def test_chart_engine_reuses_plot_items_between_draws():
+    chart = AnalysisChartEngine(show_toolbar=False)
+    two_series = {
+        "Portföy": {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("110")},
+        "BIST 100": {date(2026, 1, 1): Decimal("100"), date(2026, 1, 2): Decimal("104")},
+    }
+
+    chart.draw_line_series("Karşılaştırma", "Değer", two_series, baseline=100)
+    first_item = chart._plot_items[0]
+    chart.draw_line_series("Karşılaştırma", "Değer", {"Portföy": two_series["Portföy"]})
+
+    assert chart._plot_items == [first_item]
+    assert first_item.getData()[1].tolist() == [100.0, 110.0]
+    assert chart.plot_widget.getPlotItem().getViewBox().autoRangeEnabled() == [True, True]
+    assert chart.baseline_line.isVisible() is False
+    assert len(chart.plot_widget.getPlotItem().listDataItems()) == 1
+
+
+def test_control_panel_keeps_stock_selection_when_stock_map_is_unchanged():
+    panel = AnalysisControlPanel()
+    panel.set_stocks({1: "ASELS.IS", 2: "THYAO.IS"})
+    panel.stock_combo.set_selected_data(["2"])
+    first_item = panel.stock_combo.model().item(0)
+
+    panel.set_stocks({1: "ASELS.IS", 2: "THYAO.IS"})
+
+    assert panel.stock_combo.model().item(0) is first_item
+    assert panel.selected_stock_ids() == [2]
+
+    panel.set_stocks({2: "THYAO.IS", 3: "AKBNK.IS"})
+
+    assert panel.selected_stock_ids() == [2]
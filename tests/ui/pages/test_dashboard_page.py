@@ -0,0 +1,210 @@
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt5")
+from PyQt5.QtWidgets import QApplication
+
+from src.domain.models.position import Position
+from src.domain.models.trade import Trade
+from src.ui.pages.dashboard.dashboard_presenter import DashboardPresenter
+from src.ui.portfolio_table_model import PortfolioTableModel
+
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication(sys.argv)
+
+TRADE_DATE = date(2026, 1, 5)
+
+
+class DummyPortfolioService:
+    def __init__(self, trades_by_stock):
+        self.trades_by_stock = trades_by_stock
+
+    def get_trades_for_stock(self, stock_id):
+        return list(self.trades_by_stock.get(stock_id, []))
+
+
+class SpySummaryCards:
+    def __init__(self):
+        self.base_metrics = []
+
+    def update_base_metrics(self, total_value, total_cost, capital, profit_loss):
+        self.base_metrics.append((total_value, total_cost, capital, profit_loss))
+
+
+class SpyPortfolioTable:
+    def __init__(self):
+        self.summary_rows = []
+
+    def update_summary_row(self, total_value, profit_loss):
+        self.summary_rows.append((total_value, profit_loss))
+
+
+def _buy(stock_id, quantity, price, trade_date=TRADE_DATE):
+    return Trade.create_buy(stock_id=stock_id, trade_date=trade_date, quantity=quantity, price=Decimal(price))
+
+
+def _sell(stock_id, quantity, price, trade_date=TRADE_DATE):
+    return Trade.create_sell(stock_id=stock_id, trade_date=trade_date, quantity=quantity, price=Decimal(price))
+
+
+def _make_presenter(trades_by_stock, price_map):
+    positions = [Position.from_trades(stock_id, trades) for stock_id, trades in trades_by_stock.items()]
+    model = PortfolioTableModel(positions, price_map, {1: "AAA.IS", 2: "BBB.IS"})
+    page = SimpleNamespace(
+        portfolio_model=model,
+        portfolio_service=DummyPortfolioService(trades_by_stock),
+        summary_cards=SpySummaryCards(),
+        portfolio_table_widget=SpyPortfolioTable(),
+        _capital=Decimal("5000"),
+    )
+    presenter = DashboardPresenter(page)
+    presenter._total_cost = sum((position.total_cost for position in positions), Decimal("0"))
+    return presenter, page
+
+
+def _trade_result(trade):
+    return SimpleNamespace(trade=trade, stock_id=trade.stock_id)
+
+
+def test_apply_new_trade_updates_existing_holding_and_totals_incrementally():
+    trades_by_stock = {1: [_buy(1, 10, "100")], 2: [_buy(2, 5, "20")]}
+    presenter, page = _make_presenter(trades_by_stock, {1: Decimal("110"), 2: Decimal("22")})
+    version = presenter._data_version
+
+    new_trade = _buy(1, 10, "120")
+    trades_by_stock[1].append(new_trade)
+
+    assert presenter.apply_new_trade(_trade_result(new_trade)) is True
+
+    assert page.portfolio_model.get_position(0).total_quantity == 20
+    assert presenter._total_cost == Decimal("2300")
+    assert presenter._data_version == version + 1
+    total_value = Decimal("20") * Decimal("110") + Decimal("5") * Decimal("22")
+    assert page.summary_cards.base_metrics[-1] == (
+        total_value,
+        Decimal("2300"),
+        Decimal("5000"),
+        total_value - Decimal("2300"),
+    )
+    assert page.portfolio_table_widget.summary_rows[-1] == (total_value, total_value - Decimal("2300"))
+
+
+def test_apply_new_trade_falls_back_for_a_new_stock():
+    trades_by_stock = {1: [_buy(1, 10, "100")]}
+    presenter, page = _make_presenter(trades_by_stock, {1: Decimal("110")})
+
+    new_trade = _buy(2, 5, "20")
+    trades_by_stock[2] = [new_trade]
+
+    assert presenter.apply_new_trade(_trade_result(new_trade)) is False
+    assert page.portfolio_model.position_count() == 1
+    assert presenter._total_cost == Decimal("1000")
+    assert page.summary_cards.base_metrics == []
+
+
+def test_apply_new_trade_falls_back_when_the_position_is_closed():
+    trades_by_stock = {1: [_buy(1, 10, "100")], 2: [_buy(2, 5, "20")]}
+    presenter, page = _make_presenter(trades_by_stock, {1: Decimal("110"), 2: Decimal("22")})
+
+    new_trade = _sell(1, 10, "115")
+    trades_by_stock[1].append(new_trade)
+
+    assert presenter.apply_new_trade(_trade_result(new_trade)) is False
+    assert page.portfolio_model.get_position(0).total_quantity == 10
+    assert presenter._total_cost == Decimal("1100")
+    assert page.summary_cards.base_metrics == []
+
+
+def test_apply_new_trade_falls_back_for_a_future_dated_trade():
+    trades_by_stock = {1: [_buy(1, 10, "100")]}
+    presenter, page = _make_presenter(trades_by_stock, {1: Decimal("110")})
+    version = presenter._data_version
+
+    new_trade = _buy(1, 5, "100", trade_date=date.today() + timedelta(days=1))
+    trades_by_stock[1].append(new_trade)
+
+    assert presenter.apply_new_trade(_trade_result(new_trade)) is False
+    assert page.portfolio_model.get_position(0).total_quantity == 10
+    assert presenter._data_version == version
+
+
+def _positions(count):
+    return [Position.from_trades(stock_id, [_buy(stock_id, 1, "10")]) for stock_id in range(1, count + 1)]
+
+
+def test_portfolio_table_model_pages_rows_with_fetch_more():
+    batch = PortfolioTableModel.FETCH_BATCH_SIZE
+    model = PortfolioTableModel(_positions(batch * 2 + 5), {}, {})
+
+    assert model.rowCount() == batch
+    assert model.position_count() == batch * 2 + 5
+    assert model.canFetchMore() is True
+
+    model.fetchMore()
+    assert model.rowCount() == batch * 2
+
+    model.fetchMore()
+    assert model.rowCount() == batch * 2 + 5
+    assert model.canFetchMore() is False
+
+    model.fetchMore()
+    assert model.rowCount() == batch * 2 + 5
+
+
+def test_portfolio_table_model_update_prices_only_keeps_loaded_row_count():
+    batch = PortfolioTableModel.FETCH_BATCH_SIZE
+    positions = _positions(batch + 10)
+    model = PortfolioTableModel(positions, {}, {})
+    changed = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: changed.append((top_left.row(), bottom_right.row())))
+
+    model.update_prices_only({1: Decimal("12")})
+
+    assert model.rowCount() == batch
+    assert model.canFetchMore() is True
+    assert changed == [(0, batch - 1)]
+    assert model.data(model.index(0, 1)) == "12.00"
+
+    model.fetchMore()
+    model.update_prices_only({1: Decimal("13")}, positions[:batch + 3])
+
+    assert model.position_count() == batch + 3
+    assert model.rowCount() == batch + 3
+    assert model.canFetchMore() is False
+    assert changed[-1] == (0, batch + 2)
+
+
+def test_refresh_data_reuses_snapshot_until_data_is_invalidated():
+    trades_by_stock = {1: [_buy(1, 10, "100")]}
+    computed = []
+
+    def compute_portfolio_value_on(as_of):
+        computed.append(as_of)
+        return SimpleNamespace(as_of_date=as_of, price_map={1: Decimal("110")}, total_value=Decimal("1100"))
+
+    presenter, page = _make_presenter(trades_by_stock, {1: Decimal("110")})
+    page.portfolio_service.get_current_portfolio = lambda: SimpleNamespace(
+        positions={1: Position.from_trades(1, trades_by_stock[1])}
+    )
+    page.return_calc_service = SimpleNamespace(compute_portfolio_value_on=compute_portfolio_value_on)
+    page.stock_repo = SimpleNamespace(get_ticker_map_for_stock_ids=lambda ids: {1: "AAA.IS"})
+
+    presenter.refresh_data()
+    presenter.refresh_data()
+    assert len(computed) == 1
+
+    presenter.invalidate_data()
+    presenter.refresh_data()
+    assert len(computed) == 2
+    assert page.summary_cards.base_metrics[-1] == (
+        Decimal("1100"),
+        Decimal("1000"),
+        Decimal("5000"),
+        Decimal("100"),
+    )
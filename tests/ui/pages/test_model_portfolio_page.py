@@ -22,6 +22,23 @@ class DummyPriceRepo:
         self.saved_prices.extend(prices)
 
 
+class InlineThreadPool:
+    def start(self, worker):
+        worker.run()
+
+
+class DummyButton:
+    def __init__(self):
+        self.enabled = True
+        self.text = ""
+
+    def setEnabled(self, enabled):
+        self.enabled = enabled
+
+    def setText(self, text):
+        self.text = text
+
+
 class DummyEventSignal:
     def __init__(self):
         self.emitted = []
@@ -44,9 +61,12 @@ def test_model_portfolio_refresh_persists_prices_to_daily_prices():
         as_of=datetime(2026, 4, 28, 12, 0),
         source="intraday",
     )
-    page._update_view = lambda: None
+    page._request_update = lambda: None
     page.record_last_update_time = lambda: None
     page.show_last_update_toast_once = lambda **kwargs: None
+    page.threadpool = InlineThreadPool()
+    page._recent_lookups = {}
+    page.btn_refresh = DummyButton()
 
     ModelPortfolioPage._on_refresh_prices(page)
 
@@ -55,3 +75,96 @@ def test_model_portfolio_refresh_persists_prices_to_daily_prices():
     assert price_repo.saved_prices[0].stock_id == 2
     assert price_repo.saved_prices[0].close_price == Decimal("22.50")
     assert event_signal.emitted == [{2: Decimal("22.50")}]
+    assert page.btn_refresh.enabled
+
+
+def test_model_portfolio_price_lookup_skips_failed_tickers():
+    page = ModelPortfolioPage.__new__(ModelPortfolioPage)
+
+    def lookup(ticker):
+        if ticker == "BAD.IS":
+            raise RuntimeError("baglanti hatasi")
+        return SimpleNamespace(price=Decimal("5"), as_of=None, source="intraday")
+
+    page.price_lookup_func = lookup
+    page._recent_lookups = {}
+
+    results = ModelPortfolioPage._lookup_prices(
+        page,
+        [{"stock_id": 1, "ticker": "BAD.IS"}, {"stock_id": 2, "ticker": "BBB.IS"}],
+    )
+
+    assert list(results) == [2]
+    assert results[2].price == Decimal("5")
+
+
+def test_model_portfolio_price_lookup_reuses_recent_results():
+    page = ModelPortfolioPage.__new__(ModelPortfolioPage)
+    calls = []
+
+    def lookup(ticker):
+        calls.append(ticker)
+        return SimpleNamespace(price=Decimal("7"), as_of=None, source="intraday")
+
+    page.price_lookup_func = lookup
+    page._recent_lookups = {}
+    positions = [{"stock_id": 3, "ticker": "CCC.IS"}]
+
+    ModelPortfolioPage._lookup_prices(page, positions)
+    results = ModelPortfolioPage._lookup_prices(page, positions)
+
+    assert calls == ["CCC.IS"]
+    assert results[3].price == Decimal("7")
+
+
+def test_model_portfolio_page_enter_reloads_only_when_dirty():
+    page = ModelPortfolioPage.__new__(ModelPortfolioPage)
+    loads = []
+
+    def load():
+        loads.append(True)
+        page._portfolios_dirty = False
+
+    page._portfolios_dirty = True
+    page._load_portfolios = load
+
+    ModelPortfolioPage.on_page_enter(page)
+    ModelPortfolioPage.on_page_enter(page)
+
+    assert loads == [True]
+
+
+class CountingOverviewService:
+    def __init__(self):
+        self.calls = 0
+
+    def get_portfolio_overview(self, portfolio_id, price_map):
+        self.calls += 1
+        summary = {
+            "initial_cash": Decimal("100"),
+            "remaining_cash": Decimal("100"),
+            "total_value": Decimal("100"),
+            "profit_loss": Decimal("0"),
+        }
+        return summary, []
+
+
+def test_model_portfolio_update_view_skips_unchanged_state():
+    service = CountingOverviewService()
+    card = SimpleNamespace(set_value=lambda text: None, set_value_state=lambda state: None)
+    page = ModelPortfolioPage.__new__(ModelPortfolioPage)
+    page.model_portfolio_service = service
+    page.current_portfolio_id = 1
+    page.current_price_map = {2: Decimal("10")}
+    page._trade_version = 0
+    page._last_view_key = None
+    page._positions_seq = 0
+    page.card_initial = page.card_cash = page.card_value = page.card_pl = card
+    page.positions_table = SimpleNamespace(populate=lambda positions: None)
+
+    ModelPortfolioPage._update_view(page)
+    ModelPortfolioPage._update_view(page)
+    page.current_price_map[2] = Decimal("11")
+    ModelPortfolioPage._update_view(page)
+
+    assert service.calls == 2